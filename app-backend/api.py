@@ -1,10 +1,14 @@
 from fastapi import FastAPI, Query, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, PlainTextResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
 from typing import Optional, List, Tuple
 import sys
 import os
 import json
+import asyncio
+import time
 
 # -------------------------------------------------------------------
 # Local module paths
@@ -17,13 +21,76 @@ sys.path.append(os.path.join(BASE_DIR, "multi-tool-agent"))
 # Local imports
 # -------------------------------------------------------------------
 from osm_api import (
-    get_city_boundary,
-    get_city_boundary_geojson,
-    list_available_cities,
-    reverse_geocode_coordinate,
+    close_overpass_client,
+    load_counties_index,
+    get_city_boundary_async,
+    get_city_boundary_geojson_async,
+    iter_reverse_geocode_batch,
+    list_available_cities_async,
+    reverse_geocode_coordinate_async,
+    start_places_index,
+)
+
+from agent import root_agent, light_agent, summarization_agent, structured_agent, HomeInsuranceExpertOutput
+from utils.agent_runner import AgentRunnerPool, AGENT_POOL_SIZE
+from utils.response_formatter import format_insurance_response, StreamingInsuranceFormatter
+from utils.chat_queue import ChatAdmissionQueue, ChatQueueFull, ChatDeadlineExceeded
+from utils.answer_cache import AnswerCache, intent_cache_key
+from utils.summarizer import summarize_answer
+from utils.resilience import CircuitBreaker, CircuitOpen, call_with_resilience
+from utils.degraded_answer import degraded_answer, warm_degraded_data
+from housing_prices_fetch import start_housing_market_warmup
+from utils.chat_router import RouteDecision, ROUTE_LIGHT, route_message
+from utils.coordinate_batch import parse_coordinate_batch
+from utils.metrics import (
+    registry as metrics_registry,
+    CHAT_STAGE_SECONDS,
+    CHAT_REQUESTS,
+    CHAT_TIMEOUTS,
+    CHAT_FALLBACKS,
+)
+
+# Agents are loaded once at startup and driven in-process by this pool
+agent_pool = AgentRunnerPool(
+    {
+        "insurance": root_agent,
+        "light": light_agent,
+        "summarizer": summarization_agent,
+        "structured": structured_agent,
+    },
+    max_sessions=AGENT_POOL_SIZE,
+)
+AGENT_TIMEOUT_S = float(os.getenv("AGENT_TIMEOUT_S", "30"))
+SUMMARY_TIMEOUT_S = float(os.getenv("SUMMARY_TIMEOUT_S", "15"))
+
+# Breakers open after BREAKER_FAILURE_THRESHOLD failed calls in a row; while
+# open, chat answers are built from local data instead of waiting on the model
+agent_breaker = CircuitBreaker("insurance_agent")
+summarizer_breaker = CircuitBreaker("summarizer")
+
+# Bounded chat work queue (CHAT_MAX_CONCURRENCY / CHAT_MAX_QUEUE_DEPTH / CHAT_DEADLINE_S)
+chat_queue = ChatAdmissionQueue()
+
+# Batch chat limits
+CHAT_BATCH_MAX_MESSAGES = int(os.getenv("CHAT_BATCH_MAX_MESSAGES", "500"))
+CHAT_BATCH_MAX_PARALLELISM = int(os.getenv("CHAT_BATCH_MAX_PARALLELISM", "8"))
+
+# Batch reverse geocoding limit (points per request)
+REVERSE_GEOCODE_BATCH_MAX_POINTS = int(os.getenv("REVERSE_GEOCODE_BATCH_MAX_POINTS", "100000"))
+
+# Answers keyed on normalized intent (CHAT_CACHE_MAX_ENTRIES / CHAT_CACHE_TTL_S / CHAT_CACHE_DB)
+answer_cache = AnswerCache()
+
+# Values owned by the cache and queue are read at scrape time
+metrics_registry.callback("chat_cache_hits_total", "Chat answer cache hits.", "counter", lambda: answer_cache.hits)
+metrics_registry.callback("chat_cache_misses_total", "Chat answer cache misses.", "counter", lambda: answer_cache.misses)
+metrics_registry.callback("chat_queue_running", "Chat requests currently running.", "gauge", lambda: chat_queue.running)
+metrics_registry.callback("chat_queue_waiting", "Chat requests waiting for a slot.", "gauge", lambda: chat_queue.waiting)
+metrics_registry.callback(
+    "chat_agent_circuit_open", "1 while the insurance agent circuit breaker is open.", "gauge",
+    lambda: int(agent_breaker.state == "open"),
 )
 
-from agent import root_agent, summarization_agent
 app = FastAPI(
     title="Geography API",
     description="API for city boundary, city coordinates, and location services",
@@ -79,97 +146,28 @@ class ChatMessage(BaseModel):
 class ChatResponse(BaseModel):
     response: str
 
+class BatchChatRequest(BaseModel):
+    messages: List[str] = Field(..., description="Messages to answer")
+    parallelism: Optional[int] = Field(None, ge=1, description="Max messages answered at once (capped by the server)")
+    ndjson: bool = Field(False, description="Stream results as NDJSON in completion order")
+
+class BatchChatResult(BaseModel):
+    index: int
+    message: str
+    response: str
+    cached: bool
+
+class BatchChatResponse(BaseModel):
+    total: int
+    unique: int
+    results: List[BatchChatResult]
+
 # -------------------------------------------------------------------
 # Helper Functions
 # -------------------------------------------------------------------
-def format_insurance_response(response_text: str) -> str:
-    """
-    Format insurance agent response with better structure and readability.
-    """
-    # Clean up the text first
-    clean_text = response_text.strip()
-    
-    # Split into sentences for better processing
-    sentences = clean_text.replace('. ', '.|').split('|')
-    sentences = [s.strip() for s in sentences if s.strip()]
-    
-    formatted_parts = []
-    current_section = []
-    
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence:
-            continue
-            
-        # Check if this looks like a header/section
-        if (any(keyword in sentence.lower() for keyword in 
-               ['recommendation', 'coverage', 'risk', 'price', 'cost', 'factors', 'benefits']) 
-            and len(sentence) < 80):
-            # If we have accumulated content, add it as a section
-            if current_section:
-                formatted_parts.append(' '.join(current_section))
-                current_section = []
-            # Add the header
-            formatted_parts.append(f"\n**{sentence.rstrip('.')}:**")
-        else:
-            current_section.append(sentence)
-    
-    # Add any remaining content
-    if current_section:
-        formatted_parts.append(' '.join(current_section))
-    
-    # Join everything together
-    result = '\n'.join(formatted_parts)
-    
-    # Add bullet points for lists
-    lines = result.split('\n')
-    formatted_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            formatted_lines.append('')
-            continue
-            
-        # Convert items that look like lists to bullet points with better formatting
-        if (line and not line.startswith('**') and not line.startswith('•') and 
-            (',' in line or 'and ' in line) and len(line) > 50):
-            # Try to split on common delimiters
-            if ': ' in line:
-                parts = line.split(': ', 1)
-                if len(parts) == 2:
-                    formatted_lines.append(f"🔹 **{parts[0]}:** {parts[1]}")
-                else:
-                    formatted_lines.append(f"🔹 {line}")
-            else:
-                formatted_lines.append(f"🔹 {line}")
-        elif line.startswith('**') and line.endswith(':**'):
-            # Format section headers with better styling
-            formatted_lines.append(f"📋 {line}")
-        else:
-            formatted_lines.append(line)
-    
-    # Clean up extra spaces and add better spacing
-    final_result = '\n'.join(formatted_lines)
-    
-    # Add more spacing between sections for better readability
-    final_result = final_result.replace('**', '\n**')  # Add line break before headers
-    final_result = final_result.replace(':\n•', ':\n\n•')  # Space between headers and bullets
-    final_result = final_result.replace('\n•', '\n\n•')  # Space between bullet points
-    
-    # Clean up excessive newlines (max 3 for good spacing)
-    while '\n\n\n\n' in final_result:
-        final_result = final_result.replace('\n\n\n\n', '\n\n\n')
-    
-    # Add greeting and closing for better UX
-    if final_result and not final_result.startswith('Hello') and not final_result.startswith('Hi'):
-        final_result = f"🏠 **Insurance Expert Response:**\n\n{final_result}"
-    
-    # Add a helpful closing
-    if not any(word in final_result.lower() for word in ['question', 'help', 'more']):
-        final_result += f"\n\n💡 *Need more specific information? Feel free to ask about coverage details, pricing, or risk factors for your area.*"
-    
-    return final_result.strip()
+def sse_frame(event: str, data: dict) -> str:
+    """Encode one Server-Sent Events frame with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 @app.get("/")
 async def root():
@@ -180,17 +178,125 @@ async def root():
         "docs": "/docs",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "reverse_geocode": "/reverse-geocode",
+            "reverse_geocode_batch": "/reverse-geocode/batch",
             "city_boundary": "/city-boundary",
             "cities_list": "/cities",
             "user_workflow": "/user-location-workflow",
-            "chat": "/chat"
+            "chat": "/chat",
+            "chat_stream": "/chat/stream",
+            "chat_structured": "/chat/structured",
+            "chat_batch": "/chat/batch",
+            "chat_cache_stats": "/chat/cache-stats"
         }
     }
 
+@app.on_event("startup")
+async def preload_local_data():
+    # Load local price data in the background so degraded answers stay fast
+    asyncio.get_running_loop().run_in_executor(None, warm_degraded_data)
+    # Redfin market data for the get_housing_market tool (large download)
+    start_housing_market_warmup()
+    # County polygons for in-process admin lookups
+    asyncio.get_running_loop().run_in_executor(None, load_counties_index)
+    # Statewide places index; geo endpoints use Overpass until it is ready
+    start_places_index()
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    await close_overpass_client()
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "message": "API is running"}
+    return {
+        "status": "healthy",
+        "message": "API is running",
+        "circuit_breakers": [agent_breaker.stats(), summarizer_breaker.stats()],
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Chat pipeline latency and token metrics in Prometheus text format"""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+async def summarize_with_agent(text: str) -> str:
+    """Summarize text with the in-process summarization agent."""
+    try:
+        return await call_with_resilience(
+            lambda: agent_pool.run("summarizer", f"Please summarize this text concisely: {text}"),
+            breaker=summarizer_breaker,
+            deadline_s=SUMMARY_TIMEOUT_S,
+        )
+    except asyncio.TimeoutError:
+        CHAT_TIMEOUTS.inc(stage="summarization")
+        raise
+
+async def answer_chat_message(user_input: str, decision: Optional[RouteDecision] = None) -> Tuple[str, bool]:
+    """
+    Run the chat pipeline for one message: router -> agent -> summarization stage -> formatter.
+    The message is passed in memory, so concurrent requests never share state.
+    Greetings and glossary questions are answered by the router without a model;
+    simple questions use the light agent, the rest the full tool-using agent.
+    When the agent fails, times out or its breaker is open, a data-only
+    answer is returned instead.
+
+    Returns:
+        tuple: (response text, True if the text came from the agent rather than
+        the router or a fallback)
+    """
+    if decision is None:
+        decision = route_message(user_input)
+    if decision.answer is not None:
+        # Canned text is cheap to rebuild and must not land in the answer cache
+        return decision.answer, False
+    agent_name = "light" if decision.route == ROUTE_LIGHT else "insurance"
+
+    try:
+        # Run the agent in-process (no `adk run` subprocess)
+        with CHAT_STAGE_SECONDS.time(stage="agent"):
+            agent_output = await call_with_resilience(
+                lambda: agent_pool.run(agent_name, user_input),
+                breaker=agent_breaker,
+                deadline_s=AGENT_TIMEOUT_S,
+            )
+        
+        if agent_output:
+            print(f"Captured agent output: {agent_output}")
+            
+            # Summarize only when needed: short answers pass through, mid-size
+            # answers get a local extractive summary, long ones use the model
+            with CHAT_STAGE_SECONDS.time(stage="summarization"):
+                summarized_output, summary_path = await summarize_answer(
+                    agent_output, llm_summarizer=summarize_with_agent
+                )
+            
+            # Format response with better structure and spacing
+            with CHAT_STAGE_SECONDS.time(stage="formatting"):
+                formatted_response = format_insurance_response(summarized_output)
+            
+            print(f"Final formatted response: {formatted_response}")
+            return formatted_response, True
+        else:
+            print("No output captured from agent")
+            CHAT_FALLBACKS.inc(reason="empty_agent_output")
+            return degraded_answer(user_input), False
+    
+    except CircuitOpen:
+        CHAT_FALLBACKS.inc(reason="circuit_open")
+        return degraded_answer(user_input), False
+    except Exception as agent_error:
+        print(f"Agent call failed: {agent_error!r}")
+        if isinstance(agent_error, asyncio.TimeoutError):
+            CHAT_TIMEOUTS.inc(stage="agent")
+        CHAT_FALLBACKS.inc(reason="agent_error")
+        return degraded_answer(user_input), False
+
+def _admission_error(error: Exception) -> HTTPException:
+    """Map a chat admission failure to a fast 429/503 response."""
+    if isinstance(error, ChatQueueFull):
+        return HTTPException(status_code=429, detail=str(error), headers={"Retry-After": "1"})
+    return HTTPException(status_code=503, detail=str(error), headers={"Retry-After": "5"})
 
 # Simple stateless chat endpoint
 @app.post("/chat", response_model=ChatResponse)
@@ -198,103 +304,299 @@ async def chat_with_agent(chat_message: ChatMessage):
     """
     Simple stateless chat with Home Insurance Expert.
     Each message is processed independently.
+    Requests beyond the queue limits are rejected with 429 (queue full)
+    or 503 (deadline exceeded).
     """
+    started = time.perf_counter()
     try:
         user_input = chat_message.message.strip()
         print(f"Received message: {user_input}")  # Debug log
         
         if not user_input:
+            CHAT_REQUESTS.inc(endpoint="chat", outcome="empty")
             return ChatResponse(response="Please provide a message.")
         
-        # Simple approach: Save user input to file and run agent
-        try:
-            import subprocess
-            
-            # Create input file path
-            input_file_path = os.path.join(os.path.dirname(__file__), "user_input.txt")
-            
-            # Save user input to text file
-            with open(input_file_path, 'w', encoding='utf-8') as f:
-                f.write(user_input)
-            
-            print(f"Saved input to: {input_file_path}")
-            
-            # Run ADK CLI command with better output capture
-            result = subprocess.run(
-                ['adk', 'run', 'multi-tool-agent'],
-                input=user_input,
-                cwd=os.path.dirname(__file__),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30,
-                shell=False
-            )
-            
-            # Process the output
-            print(f"Return code: {result.returncode}")
-            print(f"stdout: '{result.stdout}'")
-            print(f"stderr: '{result.stderr}'")
-            
-            # Check for any output (stdout or stderr might contain the response)
-            agent_output = ""
-            if result.stdout and result.stdout.strip():
-                agent_output = result.stdout.strip()
-            elif result.stderr and result.stderr.strip() and "error" not in result.stderr.lower():
-                # Sometimes agent output goes to stderr
-                agent_output = result.stderr.strip()
-            
-            if agent_output:
-                print(f"Captured agent output: {agent_output}")
-                
-                # Use summarization agent to condense the response
-                try:
-                    # Run summarizer agent on the output
-                    summary_result = subprocess.run(
-                        ['adk', 'run', 'multi-tool-agent'],
-                        input=f"Please summarize this text concisely: {agent_output}",
-                        cwd=os.path.dirname(__file__),
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        timeout=15
-                    )
-                    
-                    if summary_result.returncode == 0 and summary_result.stdout.strip():
-                        summarized_output = summary_result.stdout.strip()
-                        print(f"Summarized output: {summarized_output}")
-                    else:
-                        # If summarization fails, use original output
-                        summarized_output = agent_output
-                        print("Summarization failed, using original output")
-                    
-                except Exception as summary_error:
-                    print(f"Summarization error: {summary_error}")
-                    summarized_output = agent_output
-                
-                # Format response with better structure and spacing
-                formatted_response = format_insurance_response(summarized_output)
-                
-                print(f"Final formatted response: {formatted_response}")
-                return ChatResponse(response=formatted_response)
-            else:
-                print("No output captured from agent")
-                # Return fallback response that includes the user input
-                return ChatResponse(
-                    response=f"I received your message: '{user_input}'. I'm your home insurance expert ready to help! Based on your location, I can provide recommendations for Orlando, Florida."
-                )
+        # Repeat questions are served from the intent cache without touching the model
+        cache_key = intent_cache_key(user_input)
+        cached = answer_cache.get(cache_key)
+        if cached is not None:
+            print(f"Answer cache hit: {cache_key}")
+            CHAT_REQUESTS.inc(endpoint="chat", outcome="cache_hit")
+            return ChatResponse(response=cached)
         
-        except Exception as subprocess_error:
-            print(f"Subprocess agent call failed: {subprocess_error}")
-            return ChatResponse(
-                response=f"I see you mentioned '{user_input}'. I'm your home insurance expert ready to help! Please tell me more about your insurance needs."
-            )
-            
+        # Greetings and glossary questions never take a queue slot
+        decision = route_message(user_input)
+        if decision.answer is not None:
+            CHAT_REQUESTS.inc(endpoint="chat", outcome="routed_local")
+            return ChatResponse(response=decision.answer)
+        
+        response, from_agent = await chat_queue.run(lambda: answer_chat_message(user_input, decision))
+        if from_agent:
+            answer_cache.put(cache_key, response)
+        CHAT_REQUESTS.inc(endpoint="chat", outcome="answered" if from_agent else "fallback")
+        return ChatResponse(response=response)
+    
+    except (ChatQueueFull, ChatDeadlineExceeded) as e:
+        print(f"Chat request rejected: {e}")
+        if isinstance(e, ChatDeadlineExceeded):
+            CHAT_TIMEOUTS.inc(stage="deadline")
+        CHAT_REQUESTS.inc(endpoint="chat", outcome="rejected")
+        raise _admission_error(e)
     except Exception as e:
         print(f"Chat endpoint error: {str(e)}")
+        CHAT_REQUESTS.inc(endpoint="chat", outcome="error")
+        CHAT_FALLBACKS.inc(reason="endpoint_error")
         return ChatResponse(
             response="I'm having trouble right now. Please try again."
         )
+    finally:
+        CHAT_STAGE_SECONDS.observe(time.perf_counter() - started, stage="total")
+
+@app.post("/chat/stream")
+async def chat_with_agent_stream(chat_message: ChatMessage):
+    """
+    Streaming chat with Home Insurance Expert over Server-Sent Events.
+    Partial agent output is formatted per completed sentence and sent as
+    `delta` frames; a final `done` frame closes the stream.
+    """
+    user_input = chat_message.message.strip()
+    print(f"Received streaming message: {user_input}")  # Debug log
+
+    if not user_input:
+        empty = [sse_frame("delta", {"text": "Please provide a message."}), sse_frame("done", {})]
+        return StreamingResponse(iter(empty), media_type="text/event-stream")
+
+    cached = answer_cache.get(intent_cache_key(user_input))
+    if cached is not None:
+        CHAT_REQUESTS.inc(endpoint="chat_stream", outcome="cache_hit")
+        frames = [sse_frame("delta", {"text": cached}), sse_frame("done", {})]
+        return StreamingResponse(iter(frames), media_type="text/event-stream")
+
+    decision = route_message(user_input)
+    if decision.answer is not None:
+        CHAT_REQUESTS.inc(endpoint="chat_stream", outcome="routed_local")
+        frames = [sse_frame("delta", {"text": decision.answer}), sse_frame("done", {})]
+        return StreamingResponse(iter(frames), media_type="text/event-stream")
+    agent_name = "light" if decision.route == ROUTE_LIGHT else "insurance"
+
+    if agent_breaker.state == "open":
+        CHAT_REQUESTS.inc(endpoint="chat_stream", outcome="fallback")
+        CHAT_FALLBACKS.inc(reason="circuit_open")
+        frames = [sse_frame("delta", {"text": degraded_answer(user_input)}), sse_frame("done", {})]
+        return StreamingResponse(iter(frames), media_type="text/event-stream")
+
+    # Admit before the response starts so overload still gets a real 429/503
+    try:
+        deadline = await chat_queue.acquire()
+    except (ChatQueueFull, ChatDeadlineExceeded) as e:
+        print(f"Streaming chat request rejected: {e}")
+        CHAT_REQUESTS.inc(endpoint="chat_stream", outcome="rejected")
+        raise _admission_error(e)
+
+    released = False
+
+    def release_slot():
+        # Called from the stream's finally and as a background task; only the first call counts
+        nonlocal released
+        if not released:
+            released = True
+            chat_queue.release()
+
+    async def event_stream():
+        formatter = StreamingInsuranceFormatter()
+        started = time.perf_counter()
+        outcome = "answered"
+        chunks = agent_pool.stream(agent_name, user_input)
+        # The queue deadline is on time.monotonic(); timeout_at wants the loop clock
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + (deadline - time.monotonic())
+        try:
+            while True:
+                # The deadline covers each wait for the agent, in this task (wait_for would run the
+                # agent's generator in a new task and break its tracing contexts), but not our yields:
+                # a timeout firing there would cancel the response send instead of the agent
+                try:
+                    async with asyncio.timeout_at(deadline_at):
+                        chunk = await anext(chunks)
+                except StopAsyncIteration:
+                    break
+                except TimeoutError:
+                    raise ChatDeadlineExceeded("Streaming chat exceeded its deadline")
+                for piece in formatter.feed(chunk):
+                    yield sse_frame("delta", {"text": piece})
+            for piece in formatter.flush():
+                yield sse_frame("delta", {"text": piece})
+            agent_breaker.record_success()
+        except Exception as e:
+            print(f"Streaming chat error: {e!r}")
+            outcome = "error"
+            agent_breaker.record_failure()
+            if isinstance(e, ChatDeadlineExceeded):
+                CHAT_TIMEOUTS.inc(stage="deadline")
+            yield sse_frame("error", {"message": "I'm having trouble right now. Please try again."})
+        finally:
+            await chunks.aclose()
+            release_slot()
+            CHAT_REQUESTS.inc(endpoint="chat_stream", outcome=outcome)
+            CHAT_STAGE_SECONDS.observe(time.perf_counter() - started, stage="stream_total")
+        yield sse_frame("done", {})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Backstop for a stream that never started; Starlette may skip it on disconnect
+        background=BackgroundTask(release_slot),
+    )
+
+async def answer_with_cache(user_input: str) -> Tuple[str, bool]:
+    """
+    Answer one message, serving repeat intents from the answer cache.
+    Agent calls go through the chat admission queue like /chat requests.
+
+    Returns:
+        tuple: (response text, True if it came from the cache)
+
+    Raises:
+        ChatQueueFull, ChatDeadlineExceeded: The message was not admitted or ran out of time
+    """
+    cache_key = intent_cache_key(user_input)
+    cached = answer_cache.get(cache_key)
+    if cached is not None:
+        return cached, True
+
+    # Greetings and glossary questions never take a queue slot
+    decision = route_message(user_input)
+    if decision.answer is not None:
+        return decision.answer, False
+
+    response, from_agent = await chat_queue.run(lambda: answer_chat_message(user_input, decision))
+    if from_agent:
+        answer_cache.put(cache_key, response)
+    return response, False
+
+@app.post("/chat/batch", response_model=BatchChatResponse)
+async def chat_with_agent_batch(batch: BatchChatRequest):
+    """
+    Answer many messages concurrently through the in-process agent.
+    Identical messages (ignoring case and whitespace) are answered once. Results come
+    back in input order, or as NDJSON lines as they complete when `ndjson` is set.
+    Agent calls share the /chat admission queue; messages it rejects get the
+    data-only fallback answer.
+    """
+    if len(batch.messages) > CHAT_BATCH_MAX_MESSAGES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many messages ({len(batch.messages)}); the limit is {CHAT_BATCH_MAX_MESSAGES}",
+        )
+
+    parallelism = min(batch.parallelism or CHAT_BATCH_MAX_PARALLELISM, CHAT_BATCH_MAX_PARALLELISM)
+    slots = asyncio.Semaphore(parallelism)
+
+    # Group identical prompts (case/whitespace-insensitive) so duplicates share
+    # one agent call; the intent key is only used for the answer cache lookup
+    groups = {}
+    for index, message in enumerate(batch.messages):
+        key = " ".join(message.lower().split())
+        groups.setdefault(key, []).append(index)
+    print(f"Batch chat: {len(batch.messages)} messages, {len(groups)} unique, parallelism {parallelism}")
+
+    async def answer_group(key: str, indices: List[int]) -> Tuple[List[int], str, bool]:
+        user_input = batch.messages[indices[0]].strip()
+        if not key:
+            return indices, "Please provide a message.", False
+        async with slots:
+            try:
+                response, cached = await answer_with_cache(user_input)
+            except (ChatQueueFull, ChatDeadlineExceeded) as e:
+                print(f"Batch chat message rejected: {e}")
+                if isinstance(e, ChatDeadlineExceeded):
+                    CHAT_TIMEOUTS.inc(stage="deadline")
+                CHAT_REQUESTS.inc(endpoint="chat_batch", outcome="rejected")
+                return indices, degraded_answer(user_input), False
+        return indices, response, cached
+
+    tasks = [asyncio.ensure_future(answer_group(key, indices)) for key, indices in groups.items()]
+
+    def results_for(indices: List[int], response: str, cached: bool) -> List[BatchChatResult]:
+        return [
+            BatchChatResult(index=i, message=batch.messages[i], response=response, cached=cached)
+            for i in indices
+        ]
+
+    if batch.ndjson:
+        async def result_lines():
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    for result in results_for(*(await finished)):
+                        yield result.model_dump_json() + "\n"
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+
+    results = []
+    for group_result in await asyncio.gather(*tasks):
+        results.extend(results_for(*group_result))
+    results.sort(key=lambda r: r.index)
+    return BatchChatResponse(total=len(batch.messages), unique=len(groups), results=results)
+
+@app.post("/chat/structured", response_model=HomeInsuranceExpertOutput)
+async def chat_with_agent_structured(chat_message: ChatMessage):
+    """
+    Chat with Home Insurance Expert in structured mode.
+    The agent is constrained to HomeInsuranceExpertOutput and the typed
+    JSON is returned as-is (no summarizer or formatter pass).
+    """
+    user_input = chat_message.message.strip()
+    print(f"Received structured message: {user_input}")  # Debug log
+
+    if not user_input:
+        raise HTTPException(status_code=422, detail="Please provide a message.")
+
+    cache_key = f"structured|{intent_cache_key(user_input)}"
+    cached = answer_cache.get(cache_key)
+    if cached is not None:
+        CHAT_REQUESTS.inc(endpoint="chat_structured", outcome="cache_hit")
+        return HomeInsuranceExpertOutput.model_validate_json(cached)
+
+    try:
+        agent_output = await chat_queue.run(
+            lambda: call_with_resilience(
+                lambda: agent_pool.run("structured", user_input),
+                breaker=agent_breaker,
+                deadline_s=AGENT_TIMEOUT_S,
+            )
+        )
+    except (ChatQueueFull, ChatDeadlineExceeded) as e:
+        print(f"Structured chat request rejected: {e}")
+        CHAT_REQUESTS.inc(endpoint="chat_structured", outcome="rejected")
+        raise _admission_error(e)
+    except CircuitOpen as e:
+        # No schema-shaped answer can be built without the model, so fail fast
+        CHAT_REQUESTS.inc(endpoint="chat_structured", outcome="circuit_open")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except Exception as e:
+        print(f"Structured chat error: {e!r}")
+        CHAT_REQUESTS.inc(endpoint="chat_structured", outcome="error")
+        raise HTTPException(status_code=502, detail="The insurance agent is unavailable. Please try again.")
+
+    try:
+        structured = HomeInsuranceExpertOutput.model_validate_json(agent_output)
+    except Exception as e:
+        print(f"Structured output did not match schema: {e!r} (output: {agent_output!r})")
+        CHAT_REQUESTS.inc(endpoint="chat_structured", outcome="invalid")
+        raise HTTPException(status_code=502, detail="The insurance agent returned an invalid answer.")
+
+    answer_cache.put(cache_key, structured.model_dump_json())
+    CHAT_REQUESTS.inc(endpoint="chat_structured", outcome="answered")
+    return structured
+
+@app.get("/chat/cache-stats")
+async def chat_cache_stats():
+    """Hit/miss counters and hit ratio of the chat answer cache"""
+    return answer_cache.stats()
 
 @app.get("/reverse-geocode", response_model=LocationResponse)
 async def reverse_geocode(
@@ -311,7 +613,7 @@ async def reverse_geocode(
     """
     try:
         print(f"DEBUG: Calling reverse_geocode_coordinate with lat={lat}, lon={lon}, radius_km={radius_km}")
-        raw_info = reverse_geocode_coordinate(lat, lon, radius_km=radius_km)
+        raw_info = await reverse_geocode_coordinate_async(lat, lon, radius_km=radius_km)
         print(f"DEBUG: Successfully got raw location_info: {raw_info}")
 
         # Defensive normalization: adapt different shapes that reverse_geocode_coordinate
@@ -367,6 +669,41 @@ async def reverse_geocode(
         print(f"DEBUG: Error type: {type(e)}")
         raise HTTPException(status_code=500, detail=str(e))
     
+@app.post("/reverse-geocode/batch")
+async def reverse_geocode_batch(
+    request: Request,
+    radius_km: float = Query(25, description = "Radius in kilometers to search within", ge = 1, le = 100),
+):
+    """
+    Reverse geocode many coordinates in one request, streamed back as NDJSON in input order.
+
+    The body is JSON (`{"lat": [...], "lon": [...]}` or `{"points": [{"lat": .., "lon": ..}, ...]}`),
+    CSV with `lat`/`lon` columns (`Content-Type: text/csv`) or an Arrow IPC stream/file
+    (`Content-Type: application/vnd.apache.arrow.stream`). Each output line is
+    `{"index": i, ...}` with the same fields as `/reverse-geocode`'s `location_info`.
+
+    - **radius_km**: Search radius in kilometers (1-100)
+    """
+    try:
+        points = parse_coordinate_batch(await request.body(), request.headers.get("content-type"))
+    except LookupError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if len(points) > REVERSE_GEOCODE_BATCH_MAX_POINTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many points ({len(points)}); the limit is {REVERSE_GEOCODE_BATCH_MAX_POINTS}",
+        )
+    print(f"Batch reverse geocode: {len(points)} points, radius {radius_km} km")
+
+    async def result_lines():
+        async for index, result in iter_reverse_geocode_batch(points, search_radius_km=radius_km):
+            yield json.dumps({"index": index, **result}) + "\n"
+
+    return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+    
 @app.get("/city-boundary", response_model=CityBoundaryResponse)
 async def get_city_boundary_api(
     city_name: str = Query(..., description = "Name of city to find"),
@@ -387,7 +724,7 @@ async def get_city_boundary_api(
         bbox = (min_lat, min_lon, max_lat, max_lon)
         
         if return_geojson:
-            geojson_data = get_city_boundary_geojson(city_name, bbox=bbox)
+            geojson_data = await get_city_boundary_geojson_async(city_name, bbox=bbox)
             
             if "error" in geojson_data:
                 return CityBoundaryResponse(
@@ -401,7 +738,7 @@ async def get_city_boundary_api(
                 geojson=geojson_data
             )
         else:
-            city_gdf = get_city_boundary(city_name, bbox=bbox)
+            city_gdf = await get_city_boundary_async(city_name, bbox=bbox)
             
             if city_gdf.empty:
                 return CityBoundaryResponse(
@@ -440,7 +777,7 @@ async def get_cities_list(
     """
     try:
         bbox = (min_lat, min_lon, max_lat, max_lon)
-        cities = list_available_cities(bbox=bbox)
+        cities = await list_available_cities_async(bbox=bbox)
         
         return CitiesListResponse(
             bbox=bbox,
@@ -467,7 +804,7 @@ async def user_location_workflow(
     """
     try:
         # Step 1: Reverse geocode user location
-        location_info = reverse_geocode_coordinate(lat, lon, search_radius_km=search_radius_km)
+        location_info = await reverse_geocode_coordinate_async(lat, lon, search_radius_km=search_radius_km)
         
         if not location_info['city']:
             raise HTTPException(status_code=404, detail="Could not determine user's city")
@@ -482,11 +819,11 @@ async def user_location_workflow(
         )
         
         # Step 3: Get nearby cities
-        nearby_cities = list_available_cities(bbox=bbox)
+        nearby_cities = await list_available_cities_async(bbox=bbox)
         
         # Step 4: Try to get user's city boundary
         user_city = location_info['city']
-        city_boundary = get_city_boundary(user_city, bbox=bbox)
+        city_boundary = await get_city_boundary_async(user_city, bbox=bbox)
         
         return UserLocationWorkflowResponse(
             user_location={
@@ -516,7 +853,7 @@ async def user_location_workflow(
 async def get_miami_area():
     """Get cities in Miami metropolitan area (preset bounding box)"""
     miami_bbox = (25.0, -81.0, 27.0, -79.5)  # South Florida
-    cities = list_available_cities(bbox=miami_bbox)
+    cities = await list_available_cities_async(bbox=miami_bbox)
     
     return {
         "area": "Miami Metropolitan Area",
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Build data/florida_counties.geojson (the polygons behind the in-process
+county lookup) from the Census cartographic boundary county file.
+
+    python build_florida_counties.py [--force]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+import geopandas as gpd
+import requests
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BASE_DIR, "functions"))
+from florida_counties_index import DEFAULT_FL_COUNTIES_PATH
+
+# 1:500k generalized counties: small enough to ship, accurate enough for point-in-county
+COUNTIES_SOURCE_URL = os.getenv(
+    "FL_COUNTIES_SOURCE_URL",
+    "https://www2.census.gov/geo/tiger/GENZ2023/shp/cb_2023_us_county_500k.zip",
+)
+FLORIDA_STATEFP = "12"
+
+
+def build_florida_counties(path: str = DEFAULT_FL_COUNTIES_PATH, source_url: str = COUNTIES_SOURCE_URL) -> int:
+    """
+    Download the US county file and write Florida's counties as GeoJSON (EPSG:4326).
+
+    Args:
+        path (str): Output GeoJSON path
+        source_url (str): Zipped shapefile of US counties with STATEFP/NAME columns
+
+    Returns:
+        int: Number of counties written
+    """
+    print(f"📥 Downloading {source_url}")
+    response = requests.get(source_url, timeout=(10, 300))
+    response.raise_for_status()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, "counties.zip")
+        with open(archive, "wb") as f:
+            f.write(response.content)
+        counties = gpd.read_file(f"zip://{archive}")
+
+    counties = counties[counties["STATEFP"] == FLORIDA_STATEFP][["NAME", "GEOID", "geometry"]]
+    if counties.empty:
+        raise ValueError(f"No Florida counties (STATEFP {FLORIDA_STATEFP}) in {source_url}")
+    counties = counties.to_crs(epsg=4326).sort_values("NAME")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write next to the target and swap, so a running API never reads a partial file
+    partial = f"{path}.partial"
+    counties.to_file(partial, driver="GeoJSON")
+    os.replace(partial, path)
+    print(f"✅ Wrote {len(counties)} counties to {path}")
+    return len(counties)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Florida county polygons file")
+    parser.add_argument("--output", default=DEFAULT_FL_COUNTIES_PATH, help="GeoJSON path to write")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the file exists")
+    args = parser.parse_args()
+
+    if os.path.exists(args.output) and not args.force:
+        print(f"✅ {args.output} already exists (use --force to rebuild)")
+        return
+    build_florida_counties(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,11 @@ except ImportError:
     spec.loader.exec_module(agent_module)
     root_agent = agent_module.root_agent
 
+from utils.agent_runner import AgentRunnerPool, AGENT_POOL_SIZE
+
+# Agent is loaded once at startup and driven in-process by this pool
+agent_pool = AgentRunnerPool({"insurance": root_agent}, max_sessions=AGENT_POOL_SIZE)
+
 app = FastAPI()
 
 # Add CORS middleware to allow frontend requests
@@ -41,15 +46,8 @@ class ChatResponse(BaseModel):
 @app.post("/chat", response_model=ChatResponse)
 async def chat_with_agent(chat_message: ChatMessage):
     try:
-        # Create a simple conversation with the agent
-        response_text = ""
-        
         # Run the agent with the user's message
-        async for event in root_agent.run_async(chat_message.message):
-            if hasattr(event, 'text') and event.text:
-                response_text += event.text
-            elif hasattr(event, 'content') and event.content:
-                response_text += str(event.content)
+        response_text = await agent_pool.run("insurance", chat_message.message)
         
         if not response_text:
             response_text = "I'm here to help you with home insurance questions. Could you please provide more details?"
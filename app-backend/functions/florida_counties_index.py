@@ -0,0 +1,112 @@
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import Point
+
+# County polygons (GeoJSON or shapefile, any CRS), built by
+# build_florida_counties.py; without the file every lookup misses and callers
+# fall back to Overpass
+DEFAULT_FL_COUNTIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "florida_counties.geojson")
+FL_COUNTIES_PATH = os.getenv("FL_COUNTIES_PATH", DEFAULT_FL_COUNTIES_PATH)
+
+# Attribute holding the county name in common county datasets (Census TIGER, FDOT, FGDL)
+NAME_COLUMNS = ("NAME", "name", "COUNTY", "county", "COUNTYNAME", "COUNTY_NAME", "NAMELSAD")
+
+
+# Names title-casing gets wrong, keyed by the upper-cased name
+# (older datasets also use "DADE" and "DE SOTO")
+COUNTY_NAME_FIXES = {
+    "DESOTO": "DeSoto",
+    "DE SOTO": "DeSoto",
+    "DADE": "Miami-Dade",
+    "MIAMI DADE": "Miami-Dade",
+}
+
+
+def _county_name(raw: str) -> str:
+    # Match Overpass admin_level=6 names, e.g. "Miami-Dade County", "DeSoto County", "St. Johns County"
+    name = " ".join(str(raw).split())
+    if name.lower().endswith(" county"):
+        name = name[:-len(" county")]
+    key = re.sub(r"^(ST\.?|SAINT) ", "ST. ", name.upper())
+    if key in COUNTY_NAME_FIXES:
+        name = COUNTY_NAME_FIXES[key]
+    elif name.isupper() or key.startswith("ST. "):
+        name = key.title()
+    return f"{name} County"
+
+
+class FloridaCountiesIndex:
+    """
+    Point-in-polygon lookup of Florida's counties.
+
+    The polygons are read once (on first use or via ``load``), prepared and
+    put in an STRtree, so a lookup is a bbox query plus a prepared
+    containment test on one or two candidates.
+    """
+
+    def __init__(self, path: Optional[str] = FL_COUNTIES_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._tree: Optional[STRtree] = None
+        self._geoms = None
+        self._names = None
+
+    @property
+    def ready(self) -> bool:
+        return self._tree is not None
+
+    def load(self) -> bool:
+        """Read and index the polygons (idempotent). Returns True if the index is usable."""
+        with self._lock:
+            if self._loaded:
+                return self.ready
+            self._loaded = True
+            if not self.path or not os.path.exists(self.path):
+                print(f"Florida counties index: {self.path} not found, admin lookups use Overpass")
+                return False
+            started = time.perf_counter()
+            try:
+                counties = gpd.read_file(self.path)
+                if counties.crs is not None and counties.crs.to_epsg() != 4326:
+                    counties = counties.to_crs(epsg=4326)
+                name_column = next((c for c in NAME_COLUMNS if c in counties.columns), None)
+                if name_column is None:
+                    print(f"Florida counties index: no county name column in {self.path}")
+                    return False
+                counties = counties[counties.geometry.notna() & ~counties.geometry.is_empty]
+                geoms = np.asarray(counties.geometry.values, dtype=object)
+                shapely.prepare(geoms)
+                self._names = np.array([_county_name(n) for n in counties[name_column]], dtype=object)
+                self._geoms = geoms
+                self._tree = STRtree(geoms)
+            except Exception as e:
+                print(f"Florida counties index: failed to load {self.path}: {e!r}")
+                return False
+            print(f"Florida counties index: {len(self._names)} counties loaded in {time.perf_counter() - started:.2f}s")
+            return True
+
+    def lookup(self, lat: float, lon: float) -> Optional[dict]:
+        """
+        Country/state/county containing a point, or None outside the polygons
+        (or when no polygon file is available).
+        """
+        if not self._loaded:
+            self.load()
+        if self._tree is None:
+            return None
+        candidates = self._tree.query(Point(lon, lat))
+        if len(candidates) == 0:
+            return None
+        inside = candidates[shapely.contains_xy(self._geoms[candidates], lon, lat)]
+        if len(inside) == 0:
+            return None
+        return {"country": "United States", "state": "Florida", "county": self._names[inside[0]]}
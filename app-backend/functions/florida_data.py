@@ -0,0 +1,239 @@
+from functools import lru_cache
+from typing import Dict, Optional
+
+# Mapping of Florida counties to their incorporated cities
+# (kept in sync with frontend/src/data/countyCityData.ts)
+COUNTY_CITIES = {
+    'Alachua': ['Alachua', 'Archer', 'Gainesville', 'Hawthorne', 'High Springs', 'LaCrosse', 'Micanopy', 'Newberry', 'Waldo'],
+    'Baker': ['Baldwin', 'Glen St. Mary', 'Macclenny'],
+    'Bay': ['Callaway', 'Lynn Haven', 'Mexico Beach', 'Panama City', 'Panama City Beach', 'Parker'],
+    'Bradford': ['Brooker', 'Hampton', 'Lawtey', 'Starke'],
+    'Brevard': ['Cape Canaveral', 'Cocoa', 'Cocoa Beach', 'Grant-Valkaria', 'Indialantic', 'Indian Harbour Beach', 'Malabar', 'Melbourne', 'Melbourne Beach', 'Melbourne Village', 'Palm Bay', 'Palm Shores', 'Rockledge', 'Satellite Beach', 'Titusville', 'West Melbourne'],
+    'Broward': ['Coconut Creek', 'Cooper City', 'Coral Springs', 'Dania Beach', 'Davie', 'Deerfield Beach', 'Fort Lauderdale', 'Hallandale Beach', 'Hillsboro Beach', 'Hollywood', 'Lauderdale Lakes', 'Lauderdale-by-the-Sea', 'Lauderhill', 'Lazy Lake', 'Lighthouse Point', 'Margate', 'Miramar', 'North Lauderdale', 'Oakland Park', 'Parkland', 'Pembroke Park', 'Pembroke Pines', 'Plantation', 'Pompano Beach', 'Sea Ranch Lakes', 'Southwest Ranches', 'Sunrise', 'Tamarac', 'Weston', 'Wilton Manors'],
+    'Calhoun': ['Altha', 'Blountstown'],
+    'Charlotte': ['Punta Gorda'],
+    'Citrus': ['Crystal River', 'Inverness'],
+    'Clay': ['Green Cove Springs', 'Keystone Heights', 'Orange Park', 'Penney Farms'],
+    'Collier': ['Everglades City', 'Marco Island', 'Naples'],
+    'Columbia': ['Fort White', 'Lake City'],
+    'DeSoto': ['Arcadia'],
+    'Dixie': ['Cross City', 'Horseshoe Beach'],
+    'Duval': ['Atlantic Beach', 'Jacksonville', 'Jacksonville Beach', 'Neptune Beach'],
+    'Escambia': ['Pensacola'],
+    'Flagler': ['Bunnell', 'Flagler Beach', 'Beverly Beach', 'Marineland', 'Palm Coast'],
+    'Franklin': ['Apalachicola', 'Carrabelle'],
+    'Gadsden': ['Chattahoochee', 'Gretna', 'Greensboro', 'Havana', 'Midway', 'Quincy'],
+    'Gilchrist': ['Bell', 'Fanning Springs', 'Trenton'],
+    'Glades': ['Moore Haven'],
+    'Gulf': ['Port St. Joe', 'Wewahitchka'],
+    'Hamilton': ['Jasper', 'Jennings', 'White Springs'],
+    'Hardee': ['Bowling Green', 'Wauchula', 'Zolfo Springs'],
+    'Hendry': ['Clewiston', 'LaBelle'],
+    'Hernando': ['Brooksville'],
+    'Highlands': ['Avon Park', 'Lake Placid', 'Sebring'],
+    'Hillsborough': ['Plant City', 'Tampa', 'Temple Terrace'],
+    'Holmes': ['Bonifay', 'Esto', 'Noma', 'Ponce de Leon', 'Westville'],
+    'Indian River': ['Fellsmere', 'Indian River Shores', 'Orchid', 'Sebastian', 'Vero Beach'],
+    'Jackson': ['Alford', 'Bascom', 'Campbellton', 'Cottondale', 'Graceville', 'Grand Ridge', 'Greenwood', 'Jacob City', 'Malone', 'Marianna', 'Sneads'],
+    'Jefferson': ['Monticello'],
+    'Lafayette': ['Mayo'],
+    'Lake': ['Astatula', 'Clermont', 'Eustis', 'Fruitland Park', 'Groveland', 'Howey-in-the-Hills', 'Lady Lake', 'Leesburg', 'Mascotte', 'Minneola', 'Mount Dora', 'Tavares', 'Umatilla'],
+    'Lee': ['Bonita Springs', 'Cape Coral', 'Fort Myers', 'Fort Myers Beach', 'Sanibel'],
+    'Leon': ['Tallahassee'],
+    'Levy': ['Bronson', 'Cedar Key', 'Chiefland', 'Inglis', 'Otter Creek', 'Williston', 'Yankeetown'],
+    'Liberty': ['Bristol'],
+    'Madison': ['Madison'],
+    'Manatee': ['Anna Maria', 'Bradenton', 'Bradenton Beach', 'Holmes Beach', 'Palmetto'],
+    'Marion': ['Belleview', 'Dunnellon', 'McIntosh', 'Ocala', 'Reddick'],
+    'Martin': ['Jupiter Island', 'Ocean Breeze', "Sewall's Point", 'Stuart'],
+    'Miami-Dade': ['Aventura', 'Bal Harbour', 'Bay Harbor Islands', 'Biscayne Park', 'Coral Gables', 'Cutler Bay', 'Doral', 'El Portal', 'Florida City', 'Golden Beach', 'Hialeah', 'Hialeah Gardens', 'Homestead', 'Indian Creek', 'Key Biscayne', 'Medley', 'Miami', 'Miami Beach', 'Miami Gardens', 'Miami Lakes', 'Miami Shores', 'Miami Springs', 'North Bay Village', 'North Miami', 'North Miami Beach', 'Opa-locka', 'Palmetto Bay', 'Pinecrest', 'South Miami', 'Sunny Isles Beach', 'Surfside', 'Sweetwater', 'Virginia Gardens', 'West Miami'],
+    'Monroe': ['Islamorada', 'Key Colony Beach', 'Key West', 'Layton', 'Marathon'],
+    'Nassau': ['Callahan', 'Fernandina Beach', 'Hilliard'],
+    'Okaloosa': ['Cinco Bayou', 'Crestview', 'Destin', 'Fort Walton Beach', 'Laurel Hill', 'Mary Esther', 'Niceville', 'Shalimar', 'Valparaiso'],
+    'Okeechobee': ['Okeechobee'],
+    'Orange': ['Apopka', 'Bay Lake', 'Belle Isle', 'Edgewood', 'Lake Buena Vista', 'Maitland', 'Oakland', 'Ocoee', 'Orlando', 'Windermere', 'Winter Garden', 'Winter Park'],
+    'Osceola': ['Kissimmee', 'St. Cloud'],
+    'Palm Beach': ['Atlantis', 'Belle Glade', 'Boca Raton', 'Boynton Beach', 'Briny Breezes', 'Cloud Lake', 'Delray Beach', 'Glen Ridge', 'Golf', 'Greenacres', 'Gulf Stream', 'Haverhill', 'Highland Beach', 'Hypoluxo', 'Juno Beach', 'Jupiter', 'Jupiter Inlet Colony', 'Lake Clarke Shores', 'Lake Park', 'Lake Worth Beach', 'Lantana', 'Manalapan', 'Mangonia Park', 'North Palm Beach', 'Ocean Ridge', 'Pahokee', 'Palm Beach', 'Palm Beach Gardens', 'Palm Beach Shores', 'Palm Springs', 'Riviera Beach', 'Royal Palm Beach', 'South Bay', 'South Palm Beach', 'Tequesta', 'Wellington', 'West Palm Beach'],
+    'Pasco': ['Dade City', 'New Port Richey', 'Port Richey', 'San Antonio', 'St. Leo', 'Zephyrhills'],
+    'Pinellas': ['Belleair', 'Belleair Beach', 'Belleair Bluffs', 'Belleair Shore', 'Clearwater', 'Dunedin', 'Gulfport', 'Indian Rocks Beach', 'Indian Shores', 'Kenneth City', 'Largo', 'Madeira Beach', 'North Redington Beach', 'Oldsmar', 'Pinellas Park', 'Redington Beach', 'Redington Shores', 'Safety Harbor', 'Seminole', 'South Pasadena', 'St. Pete Beach', 'St. Petersburg', 'Tarpon Springs', 'Treasure Island'],
+    'Polk': ['Auburndale', 'Bartow', 'Davenport', 'Dundee', 'Eagle Lake', 'Fort Meade', 'Frostproof', 'Haines City', 'Highland Park', 'Hillcrest Heights', 'Lake Alfred', 'Lake Hamilton', 'Lake Wales', 'Lakeland', 'Mulberry', 'Polk City', 'Winter Haven'],
+    'Putnam': ['Crescent City', 'Interlachen', 'Palatka', 'Pomona Park', 'Welaka'],
+    'Santa Rosa': ['Gulf Breeze', 'Jay', 'Milton'],
+    'Sarasota': ['Longboat Key', 'North Port', 'Sarasota', 'Venice'],
+    'Seminole': ['Altamonte Springs', 'Casselberry', 'Lake Mary', 'Longwood', 'Oviedo', 'Sanford', 'Winter Springs'],
+    'St. Johns': ['St. Augustine', 'St. Augustine Beach'],
+    'St. Lucie': ['Fort Pierce', 'Port St. Lucie', 'St. Lucie Village'],
+    'Sumter': ['Bushnell', 'Center Hill', 'Coleman', 'Webster', 'Wildwood'],
+    'Suwannee': ['Branford', 'Live Oak'],
+    'Taylor': ['Perry'],
+    'Union': ['Lake Butler', 'Raiford', 'Worthington Springs'],
+    'Volusia': ['Daytona Beach', 'Daytona Beach Shores', 'DeBary', 'DeLand', 'Edgewater', 'Holly Hill', 'Lake Helen', 'Oak Hill', 'Ormond Beach', 'Pierson', 'Ponce Inlet', 'Port Orange', 'South Daytona'],
+    'Wakulla': ['Sopchoppy', 'St. Marks'],
+    'Walton': ['DeFuniak Springs', 'Freeport', 'Paxton'],
+    'Washington': ['Caryville', 'Chipley', 'Ebro', 'Vernon', 'Wausau'],
+}
+
+
+# Annual HO-3 base premium (USD) per county
+# (kept in sync with INSURANCE_RATES in frontend/src/data/countyInsuranceData.ts)
+COUNTY_BASE_RATES = {
+    'Alachua': 1800,
+    'Baker': 1650,
+    'Bay': 3500,  # High coastal risk
+    'Bradford': 1700,
+    'Brevard': 2800,  # Coastal
+    'Broward': 4200,  # High coastal risk
+    'Calhoun': 1600,
+    'Charlotte': 3200,  # Coastal
+    'Citrus': 2200,  # Near coast
+    'Clay': 1900,
+    'Collier': 3800,  # High coastal risk
+    'Columbia': 1650,
+    'DeSoto': 1850,
+    'Dixie': 2100,  # Coastal
+    'Duval': 2500,  # Coastal city
+    'Escambia': 3300,  # High coastal risk
+    'Flagler': 2700,  # Coastal
+    'Franklin': 3100,  # Coastal
+    'Gadsden': 1700,
+    'Gilchrist': 1650,
+    'Glades': 2000,
+    'Gulf': 3200,  # Coastal
+    'Hamilton': 1600,
+    'Hardee': 1800,
+    'Hendry': 1900,
+    'Hernando': 2300,  # Near coast
+    'Highlands': 1950,
+    'Hillsborough': 2600,  # Coastal metro
+    'Holmes': 1650,
+    'Indian River': 2900,  # Coastal
+    'Jackson': 1700,
+    'Jefferson': 1650,
+    'Lafayette': 1600,
+    'Lake': 2000,
+    'Lee': 3600,  # High coastal risk
+    'Leon': 1850,
+    'Levy': 2100,  # Coastal
+    'Liberty': 1600,
+    'Madison': 1650,
+    'Manatee': 3100,  # Coastal
+    'Marion': 1900,
+    'Martin': 3000,  # Coastal
+    'Miami-Dade': 4500,  # Highest coastal risk
+    'Monroe': 5200,  # Keys - highest risk
+    'Nassau': 2600,  # Coastal
+    'Okaloosa': 3100,  # Coastal
+    'Okeechobee': 2100,
+    'Orange': 2200,
+    'Osceola': 2100,
+    'Palm Beach': 3900,  # High coastal risk
+    'Pasco': 2400,  # Near coast
+    'Pinellas': 3400,  # High coastal risk
+    'Polk': 2000,
+    'Putnam': 1850,
+    'Santa Rosa': 2900,  # Coastal
+    'Sarasota': 3300,  # Coastal
+    'Seminole': 2100,
+    'St. Johns': 2800,  # Coastal
+    'St. Lucie': 2900,  # Coastal
+    'Sumter': 1950,
+    'Suwannee': 1700,
+    'Taylor': 2000,  # Coastal
+    'Union': 1650,
+    'Volusia': 2800,  # Coastal
+    'Wakulla': 2200,  # Near coast
+    'Walton': 3200,  # Coastal
+    'Washington': 1650,
+}
+
+# Premium of each HO form relative to the county's HO-3 base rate
+HO_FORM_MULTIPLIERS = {
+    'HO-1': 0.4,
+    'HO-2': 0.55,
+    'HO-3': 1.0,
+    'HO-4': 0.25,
+    'HO-5': 1.35,
+    'HO-6': 0.65,
+    'HO-7': 0.85,
+    'HO-8': 1.15,
+}
+
+# Redfin metro areas covered by the median sale price files
+COUNTY_METRO_AREAS = {
+    'Broward': 'Fort Lauderdale, FL metro area',
+    'Baker': 'Jacksonville, FL metro area',
+    'Clay': 'Jacksonville, FL metro area',
+    'Duval': 'Jacksonville, FL metro area',
+    'Nassau': 'Jacksonville, FL metro area',
+    'St. Johns': 'Jacksonville, FL metro area',
+    'Miami-Dade': 'Miami, FL metro area',
+    'Lake': 'Orlando, FL metro area',
+    'Orange': 'Orlando, FL metro area',
+    'Osceola': 'Orlando, FL metro area',
+    'Seminole': 'Orlando, FL metro area',
+    'Hernando': 'Tampa, FL metro area',
+    'Hillsborough': 'Tampa, FL metro area',
+    'Pasco': 'Tampa, FL metro area',
+    'Pinellas': 'Tampa, FL metro area',
+    'Palm Beach': 'West Palm Beach, FL metro area',
+}
+
+
+@lru_cache(maxsize=1)
+def city_county_index() -> Dict[str, str]:
+    """
+    Return a lowercase city name -> county name lookup.
+
+    Returns:
+        dict: e.g. {'orlando': 'Orange', 'miami beach': 'Miami-Dade', ...}
+    """
+    index = {}
+    for county, cities in COUNTY_CITIES.items():
+        for city in cities:
+            index.setdefault(city.lower(), county)
+    return index
+
+
+def county_for_city(city_name: str) -> Optional[str]:
+    """Return the county of a Florida city (case-insensitive), or None."""
+    if not city_name:
+        return None
+    return city_county_index().get(city_name.lower().strip())
+
+
+def resolve_county(location: str) -> Optional[str]:
+    """
+    Resolve a Florida city or county name to its county.
+
+    Args:
+        location (str): City name, county name, or "<name> County"
+
+    Returns:
+        str: County name as used in COUNTY_CITIES, or None if unknown
+    """
+    if not location:
+        return None
+    name = location.strip()
+    if name.lower().endswith(" county"):
+        name = name[:-len(" county")].strip()
+    for county in COUNTY_CITIES:
+        if county.lower() == name.lower():
+            return county
+    return county_for_city(name)
+
+
+def get_insurance_rates(county: str) -> Dict[str, int]:
+    """
+    Estimated annual premium per HO form for a county.
+
+    Args:
+        county (str): County name (see COUNTY_BASE_RATES)
+
+    Returns:
+        dict: e.g. {'HO-1': 880, 'HO-2': 1210, 'HO-3': 2200, ...}, empty if unknown
+    """
+    base_rate = COUNTY_BASE_RATES.get(county)
+    if base_rate is None:
+        return {}
+    # Round half up, like Math.round in the frontend
+    return {form: int(base_rate * factor + 0.5) for form, factor in HO_FORM_MULTIPLIERS.items()}
@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+import geopandas as gpd
+import numpy as np
+
+from geo_distance import k_nearest
+
+# Statewide bbox (min_lat, min_lon, max_lat, max_lon) covering Florida and the Keys
+FLORIDA_BBOX = (24.3, -87.7, 31.1, -79.8)
+
+# Index knobs (env-driven)
+PLACES_INDEX_REFRESH_S = float(os.getenv("PLACES_INDEX_REFRESH_S", str(24 * 3600)))
+PLACES_INDEX_RETRY_S = float(os.getenv("PLACES_INDEX_RETRY_S", "60"))
+
+PLACE_COLUMNS = ['name', 'osm_id', 'place_type', 'population', 'element_type', 'geometry']
+
+
+class _PlacesSnapshot:
+    """Immutable arrays for one load of the places, sorted by latitude."""
+
+    def __init__(self, places: gpd.GeoDataFrame):
+        lats = np.asarray(places.geometry.y, dtype=np.float64)
+        order = np.argsort(lats, kind="stable")
+        self.lats = lats[order]
+        self.lons = np.asarray(places.geometry.x, dtype=np.float64)[order]
+        self.names = places['name'].to_numpy(dtype=object)[order]
+        self.osm_ids = places['osm_id'].to_numpy()[order]
+        self.place_types = places['place_type'].to_numpy(dtype=object)[order]
+        self.populations = places['population'].to_numpy(dtype=object)[order]
+        self.loaded_at = time.time()
+
+    def __len__(self):
+        return len(self.lats)
+
+    def bbox_positions(self, bbox) -> np.ndarray:
+        min_lat, min_lon, max_lat, max_lon = bbox
+        start = np.searchsorted(self.lats, min_lat, side="left")
+        stop = np.searchsorted(self.lats, max_lat, side="right")
+        lons = self.lons[start:stop]
+        return start + np.nonzero((lons >= min_lon) & (lons <= max_lon))[0]
+
+    def to_geodataframe(self, positions) -> gpd.GeoDataFrame:
+        positions = np.asarray(positions, dtype=np.intp)
+        if len(positions) == 0:
+            return gpd.GeoDataFrame(columns=PLACE_COLUMNS)
+        return gpd.GeoDataFrame(
+            {
+                'name': self.names[positions],
+                'osm_id': self.osm_ids[positions],
+                'place_type': self.place_types[positions],
+                'population': self.populations[positions],
+                'element_type': 'node',
+            },
+            geometry=gpd.points_from_xy(self.lons[positions], self.lats[positions]),
+        )
+
+
+class FloridaPlacesIndex:
+    """
+    In-memory spatial index of every Florida city/town node.
+
+    The places are fetched once (statewide) by a background thread and
+    refreshed every PLACES_INDEX_REFRESH_S. Until the first load finishes
+    ``ready`` is False and callers should fall back to a live query.
+    Lookups only read an immutable snapshot, so they never wait on a refresh.
+    """
+
+    def __init__(self, loader: Callable[[Tuple[float, float, float, float]], gpd.GeoDataFrame], bbox=FLORIDA_BBOX):
+        self._loader = loader
+        self.bbox = bbox
+        self._snapshot: Optional[_PlacesSnapshot] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    def covers(self, bbox) -> bool:
+        """True if the index is loaded and ``bbox`` lies inside the indexed area."""
+        min_lat, min_lon, max_lat, max_lon = bbox
+        return (
+            self.ready
+            and min_lat >= self.bbox[0] and min_lon >= self.bbox[1]
+            and max_lat <= self.bbox[2] and max_lon <= self.bbox[3]
+        )
+
+    def start(self):
+        """Start the background load/refresh thread (idempotent)."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._refresh_loop, name="florida-places-index", daemon=True)
+                self._thread.start()
+
+    def refresh(self) -> bool:
+        """Load the places now and swap in the new snapshot. Returns True on success."""
+        started = time.perf_counter()
+        places = self._loader(self.bbox)
+        if places is None or places.empty:
+            print("Florida places index: no places loaded, keeping the previous snapshot")
+            return False
+        self._snapshot = _PlacesSnapshot(places)
+        print(f"Florida places index: {len(self._snapshot)} places loaded in {time.perf_counter() - started:.1f}s")
+        return True
+
+    def _refresh_loop(self):
+        while True:
+            try:
+                ok = self.refresh()
+            except Exception as e:
+                print(f"Florida places index refresh failed: {e!r}")
+                ok = False
+            time.sleep(PLACES_INDEX_REFRESH_S if ok else PLACES_INDEX_RETRY_S)
+
+    def names_in_bbox(self, bbox) -> List[str]:
+        """Sorted names of the places inside ``bbox``."""
+        snapshot = self._snapshot
+        return sorted(snapshot.names[snapshot.bbox_positions(bbox)].tolist())
+
+    def places_in_bbox(self, bbox) -> gpd.GeoDataFrame:
+        """Places inside ``bbox`` with the same columns as the Overpass query."""
+        snapshot = self._snapshot
+        return snapshot.to_geodataframe(snapshot.bbox_positions(bbox))
+
+    def nearest(self, lat: float, lon: float, k: int = 1, bbox=None) -> List[Tuple[str, float]]:
+        """
+        The ``k`` places nearest to a point as (name, great-circle km), closest first.
+
+        With ``bbox``, only places inside it are candidates, matching the
+        per-bbox Overpass results.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        if bbox is None:
+            positions, distances = k_nearest(lat, lon, snapshot.lats, snapshot.lons, k)
+        else:
+            candidates = snapshot.bbox_positions(bbox)
+            found, distances = k_nearest(lat, lon, snapshot.lats[candidates], snapshot.lons[candidates], k)
+            positions = candidates[found]
+        return list(zip(snapshot.names[positions].tolist(), distances.tolist()))
@@ -0,0 +1,41 @@
+from typing import Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance in km from one point to arrays of points (vectorized).
+
+    Args:
+        lat (float): Latitude of the origin in degrees
+        lon (float): Longitude of the origin in degrees
+        lats (np.ndarray): Latitudes in degrees (float64)
+        lons (np.ndarray): Longitudes in degrees (float64)
+
+    Returns:
+        np.ndarray: Distances in kilometres, same shape as ``lats``
+    """
+    lat1 = np.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - np.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def k_nearest(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions and km distances of the ``k`` points nearest to (lat, lon), closest first.
+
+    The input arrays are only read, never copied into or modified.
+    """
+    if len(lats) == 0 or k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+    distances = haversine_km(lat, lon, lats, lons)
+    k = min(k, len(distances))
+    positions = np.argpartition(distances, k - 1)[:k] if k < len(distances) else np.arange(len(distances))
+    positions = positions[np.argsort(distances[positions], kind="stable")]
+    return positions, distances[positions]
@@ -1,4 +1,5 @@
 import os
+import threading
 import pandas as pd
 from functools import lru_cache
 
@@ -115,6 +116,32 @@ def load_fl_latest() -> pd.DataFrame:
     return df.reset_index(drop=True)
 
 
+_warmup_thread = None
+_warmup_lock = threading.Lock()
+
+
+def housing_market_ready() -> bool:
+    """True once load_fl_latest() has finished and its result is cached."""
+    return load_fl_latest.cache_info().currsize > 0
+
+
+def start_housing_market_warmup():
+    """Load the Redfin data in a background thread (idempotent; retried if a load failed)."""
+    global _warmup_thread
+    with _warmup_lock:
+        if housing_market_ready() or (_warmup_thread is not None and _warmup_thread.is_alive()):
+            return
+
+        def warm():
+            try:
+                load_fl_latest()
+            except Exception as e:
+                print(f"⚠️  Could not load Redfin data: {e!r}", flush=True)
+
+        _warmup_thread = threading.Thread(target=warm, name="redfin-warmup", daemon=True)
+        _warmup_thread.start()
+
+
 # ---------- Helper Functions ----------
 
 def list_cities() -> list[str]:
@@ -1,73 +1,517 @@
+import asyncio
 import geopandas as gpd
+import numpy as np
 import requests
-from functools import lru_cache
 import json
-from typing import Optional
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
-@lru_cache(maxsize=128)
-def get_city_boundaries_by_bbox(bbox):
+from florida_counties_index import FloridaCountiesIndex
+from geo_distance import k_nearest
+from florida_places_index import FloridaPlacesIndex
+from overpass_cache import OverpassCache
+from overpass_client import AsyncOverpassClient, OVERPASS_CONNECT_TIMEOUT_S, OVERPASS_MAX_CONNECTIONS, OVERPASS_READ_TIMEOUT_S
+
+OVERPASS_URL = "http://overpass-api.de/api/interpreter"
+PLACE_COLUMNS = ['name', 'osm_id', 'place_type', 'population', 'element_type', 'geometry']
+
+# Overpass results are cached per fixed grid tile (env-driven size in degrees)
+OVERPASS_TILE_DEG = float(os.getenv("OVERPASS_TILE_DEG", "0.25"))
+OVERPASS_TILE_CACHE_SIZE = int(os.getenv("OVERPASS_TILE_CACHE_SIZE", "4096"))
+# Most tiles fetched by one Overpass query; larger groups are split
+OVERPASS_MAX_QUERY_TILES = int(os.getenv("OVERPASS_MAX_QUERY_TILES", "64"))
+
+# Reverse geocoding: how many nearest cities to report, and how close the
+# nearest one must be to count as the point's city
+NEAREST_CITIES_K = int(os.getenv("NEAREST_CITIES_K", "5"))
+NEAREST_CITY_MAX_KM = float(os.getenv("NEAREST_CITY_MAX_KM", "11"))
+
+# Batch reverse geocoding: points are grouped into grid cells of this size
+# (degrees) and each cell is resolved with one spatial query
+REVERSE_GEOCODE_CLUSTER_DEG = float(os.getenv("REVERSE_GEOCODE_CLUSTER_DEG", "0.25"))
+# Points outside the county polygons per combined Overpass admin query
+REVERSE_GEOCODE_ADMIN_BATCH = int(os.getenv("REVERSE_GEOCODE_ADMIN_BATCH", "200"))
+
+# Raw Overpass responses on disk, shared by every query in this module
+# (OVERPASS_CACHE_DB / OVERPASS_CACHE_TTL_S / OVERPASS_CACHE_STALE_S / OVERPASS_CACHE_MAX_BYTES)
+overpass_cache = OverpassCache()
+
+# Pooled keep-alive clients: async for the API endpoints, sync for scripts and background threads
+overpass_client = AsyncOverpassClient(OVERPASS_URL)
+_http = requests.Session()
+
+
+def overpass_json(query: str) -> dict:
     """
-    Fetch city boundaries from OpenStreetMap using Overpass API within a bounding box
-    Results are cached to avoid repeated API calls
-    
-    Args:
-        bbox (tuple): Bounding box (min_lat, min_lon, max_lat, max_lon)
+    Run an Overpass query through the shared disk cache.
+
+    Fresh entries are returned directly; stale ones are returned too and
+    refreshed in the background (stale-while-revalidate). Misses go to the
+    network and are stored. Raises on network or HTTP errors.
     """
-    
-    overpass_url = "http://overpass-api.de/api/interpreter"
-    
+    data = _cached_overpass_json(query)
+    if data is not None:
+        return data
+    return _overpass_fetch(query)
+
+
+async def overpass_json_async(query: str) -> dict:
+    """
+    Async version of overpass_json; network calls go through the pooled async
+    client and disk cache reads and writes (SQLite) run in a worker thread.
+    """
+    data = await asyncio.to_thread(_cached_overpass_json, query)
+    if data is not None:
+        return data
+    return await _overpass_fetch_async(query)
+
+
+def _cached_overpass_json(query: str) -> Optional[dict]:
+    """Disk-cached response for a query (stale entries are revalidated in the background), or None."""
+    data, fetched_at = overpass_cache.lookup(query)
+    if data is not None and overpass_cache.is_stale(fetched_at):
+        _revalidate(query)
+    return data
+
+
+def _overpass_fetch(query: str, store: bool = True) -> dict:
+    response = _http.get(
+        OVERPASS_URL,
+        params={'data': query},
+        timeout=(OVERPASS_CONNECT_TIMEOUT_S, OVERPASS_READ_TIMEOUT_S),
+    )
+    response.raise_for_status()
+    data = response.json()
+    if store:
+        overpass_cache.store(query, data)
+    return data
+
+
+async def _overpass_fetch_async(query: str, store: bool = True) -> dict:
+    data = await overpass_client.query(query)
+    if store:
+        await asyncio.to_thread(overpass_cache.store, query, data)
+    return data
+
+
+async def close_overpass_client():
+    """Release the pooled Overpass connections (application shutdown)."""
+    await overpass_client.aclose()
+
+
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+
+def _revalidate(query: str, on_refresh=None):
+    """Refresh a stale cached query in a background thread (one refresh per query at a time)."""
+    with _revalidating_lock:
+        if query in _revalidating:
+            return
+        _revalidating.add(query)
+
+    def refresh():
+        try:
+            data = _overpass_fetch(query)
+            if on_refresh is not None:
+                on_refresh(data)
+        except Exception as e:
+            print(f"Overpass revalidation failed: {e}")
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(query)
+
+    threading.Thread(target=refresh, name="overpass-revalidate", daemon=True).start()
+
+
+def _city_nodes_query(bbox) -> str:
     min_lat, min_lon, max_lat, max_lon = bbox
     
     # Simple query for city/town nodes (points) - more reliable than boundaries
-    overpass_query = f"""[out:json][timeout:60];
+    return f"""[out:json][timeout:60];
 (
   node["place"~"^(city|town)$"](bbox:{min_lat},{min_lon},{max_lat},{max_lon});
 );
 out;"""
-    
-    try:
-        response = requests.get(overpass_url, params={'data': overpass_query})
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Convert OSM data to simple point-based GeoDataFrame
-        features = []
-        for element in data.get('elements', []):
-            if element.get('type') == 'node' and 'tags' in element:
-                tags = element.get('tags', {})
-                name = tags.get('name')
-                
-                if name and 'lat' in element and 'lon' in element:
-                    # Create a simple point geometry
-                    feature = {
-                        'type': 'Feature',
-                        'properties': {
-                            'name': name,
-                            'osm_id': element.get('id'),
-                            'place_type': tags.get('place', 'city'),
-                            'population': tags.get('population'),
-                            'element_type': 'node'
-                        },
-                        'geometry': {
-                            'type': 'Point',
-                            'coordinates': [element['lon'], element['lat']]
-                        }
-                    }
-                    features.append(feature)
-        
-        # Create GeoDataFrame from features
-        if features:
-            gdf = gpd.GeoDataFrame.from_features(features)
-            return gdf
-        else:
-            # Return empty GeoDataFrame with expected columns if no data
-            return gpd.GeoDataFrame(columns=['name', 'osm_id', 'place_type', 'population', 'element_type', 'geometry'])
+
+
+def _parse_city_features(data: dict) -> List[dict]:
+    """Convert an Overpass response to simple point features."""
+    features = []
+    for element in data.get('elements', []):
+        if element.get('type') == 'node' and 'tags' in element:
+            tags = element.get('tags', {})
+            name = tags.get('name')
             
+            if name and 'lat' in element and 'lon' in element:
+                # Create a simple point geometry
+                feature = {
+                    'type': 'Feature',
+                    'properties': {
+                        'name': name,
+                        'osm_id': element.get('id'),
+                        'place_type': tags.get('place', 'city'),
+                        'population': tags.get('population'),
+                        'element_type': 'node'
+                    },
+                    'geometry': {
+                        'type': 'Point',
+                        'coordinates': [element['lon'], element['lat']]
+                    }
+                }
+                features.append(feature)
+    return features
+
+
+def _query_city_features(bbox) -> List[dict]:
+    """
+    Query Overpass (through the disk cache) for the city/town nodes in a bounding box.
+
+    Raises on network or HTTP errors so callers can decide what to cache.
+    """
+    return _parse_city_features(overpass_json(_city_nodes_query(bbox)))
+
+
+def _features_to_gdf(features: List[dict]) -> gpd.GeoDataFrame:
+    if features:
+        return gpd.GeoDataFrame.from_features(features)
+    # Return empty GeoDataFrame with expected columns if no data
+    return gpd.GeoDataFrame(columns=PLACE_COLUMNS)
+
+
+def _fetch_city_nodes(bbox):
+    """Query Overpass for the city/town nodes in a bounding box (uncached)."""
+    try:
+        return _features_to_gdf(_query_city_features(bbox))
     except Exception as e:
         print(f"Error fetching OSM data: {e}")
         # Return empty GeoDataFrame on error
-        return gpd.GeoDataFrame(columns=['name', 'osm_id', 'place_type', 'population', 'element_type', 'geometry'])
+        return gpd.GeoDataFrame(columns=PLACE_COLUMNS)
+
+
+class _TileCache:
+    """
+    LRU cache of city/town features per grid tile.
+
+    Each entry keeps the fetch time of its Overpass data, so callers can
+    apply the disk cache's TTL; entries older than ``max_age_s`` are dropped.
+    """
+
+    def __init__(self, max_tiles: int = OVERPASS_TILE_CACHE_SIZE, max_age_s: Optional[float] = None):
+        self.max_tiles = max(1, max_tiles)
+        self.max_age_s = max_age_s
+        self._tiles: "OrderedDict[Tuple[int, int], Tuple[List[dict], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tile: Tuple[int, int]) -> Optional[Tuple[List[dict], float]]:
+        """Return (features, fetched_at) for a tile, or None."""
+        with self._lock:
+            entry = self._tiles.get(tile)
+            if entry is not None and self.max_age_s is not None and time.time() - entry[1] > self.max_age_s:
+                del self._tiles[tile]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._tiles.move_to_end(tile)
+            self.hits += 1
+            return entry
+
+    def put(self, tile: Tuple[int, int], features: List[dict], fetched_at: float):
+        with self._lock:
+            self._tiles[tile] = (features, fetched_at)
+            self._tiles.move_to_end(tile)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "tiles": len(self._tiles),
+            "max_tiles": self.max_tiles,
+            "tile_deg": OVERPASS_TILE_DEG,
+        }
+
+
+_tile_cache = _TileCache(max_age_s=overpass_cache.ttl_s + overpass_cache.stale_s)
+
+
+def _tile_of(lat: float, lon: float) -> Tuple[int, int]:
+    return math.floor(lat / OVERPASS_TILE_DEG), math.floor(lon / OVERPASS_TILE_DEG)
+
+
+def _tiles_for_bbox(bbox) -> List[Tuple[int, int]]:
+    min_lat, min_lon, max_lat, max_lon = bbox
+    low_row, low_col = _tile_of(min_lat, min_lon)
+    high_row, high_col = _tile_of(max_lat, max_lon)
+    return [(row, col) for row in range(low_row, high_row + 1) for col in range(low_col, high_col + 1)]
+
+
+def _tile_bbox(tile: Tuple[int, int]):
+    row, col = tile
+    return (row * OVERPASS_TILE_DEG, col * OVERPASS_TILE_DEG, (row + 1) * OVERPASS_TILE_DEG, (col + 1) * OVERPASS_TILE_DEG)
+
+
+def _tile_query(tile: Tuple[int, int]) -> str:
+    return _city_nodes_query(_tile_bbox(tile))
+
+
+def _disk_tile(tile: Tuple[int, int]) -> Optional[Tuple[List[dict], float]]:
+    """Load a tile from the disk cache as (features, fetched_at)."""
+    data, fetched_at = overpass_cache.lookup(_tile_query(tile))
+    if data is None:
+        return None
+    return _parse_city_features(data), fetched_at
+
+
+def _revalidate_tile(tile: Tuple[int, int]):
+    _revalidate(
+        _tile_query(tile),
+        on_refresh=lambda fresh: _tile_cache.put(tile, _parse_city_features(fresh), time.time()),
+    )
+
+
+def _tiles_envelope(tiles: List[Tuple[int, int]]):
+    rows = [row for row, _ in tiles]
+    cols = [col for _, col in tiles]
+    return (
+        min(rows) * OVERPASS_TILE_DEG,
+        min(cols) * OVERPASS_TILE_DEG,
+        (max(rows) + 1) * OVERPASS_TILE_DEG,
+        (max(cols) + 1) * OVERPASS_TILE_DEG,
+    )
+
+
+def _tile_groups(tiles: List[Tuple[int, int]]) -> List[List[Tuple[int, int]]]:
+    """
+    Split tiles into rectangles made only of the given tiles, each at most
+    OVERPASS_MAX_QUERY_TILES, so the envelope of a group never covers tiles
+    that are already cached (scattered misses no longer pull in the whole
+    area between them). Contiguous columns in a row form a run, and runs
+    spanning the same columns in consecutive rows are merged.
+    """
+    max_tiles = max(1, OVERPASS_MAX_QUERY_TILES)
+    cols_by_row: Dict[int, List[int]] = {}
+    for row, col in set(tiles):
+        cols_by_row.setdefault(row, []).append(col)
+
+    rects = []
+    open_rects = {}
+    for row in sorted(cols_by_row):
+        cols = sorted(cols_by_row[row])
+        runs = []
+        for col in cols:
+            if runs and col == runs[-1][1] + 1 and col - runs[-1][0] < max_tiles:
+                runs[-1][1] = col
+            else:
+                runs.append([col, col])
+        for first, last in runs:
+            rect = open_rects.get((first, last))
+            if rect is not None and rect[1] == row - 1 and (row - rect[0] + 1) * (last - first + 1) <= max_tiles:
+                rect[1] = row
+            else:
+                rect = [row, row, first, last]
+                rects.append(rect)
+                open_rects[(first, last)] = rect
+
+    return [
+        [(row, col) for row in range(first_row, last_row + 1) for col in range(first_col, last_col + 1)]
+        for first_row, last_row, first_col, last_col in rects
+    ]
+
+
+def _split_tiles(tiles: List[Tuple[int, int]], data: dict):
+    """
+    Split an envelope response back into the given tiles. Every tile is
+    returned (empty lists included) so empty areas are cached too.
+
+    Returns:
+        tuple: ({tile: features}, [(tile query, tile response)]) - the second
+        item is for one batched write to the disk cache
+    """
+    elements_by_tile = {tile: [] for tile in tiles}
+    for element in data.get('elements', []):
+        if 'lat' not in element or 'lon' not in element:
+            continue
+        tile = _tile_of(element['lat'], element['lon'])
+        # Nodes on the envelope's far edge belong to the next tile, fetched with it
+        if tile in elements_by_tile:
+            elements_by_tile[tile].append(element)
+
+    by_tile = {}
+    entries = []
+    for tile, elements in elements_by_tile.items():
+        tile_data = {'elements': elements}
+        entries.append((_tile_query(tile), tile_data))
+        by_tile[tile] = _parse_city_features(tile_data)
+    return by_tile, entries
+
+
+def _store_groups(groups, responses) -> Dict[Tuple[int, int], List[dict]]:
+    by_tile = {}
+    entries = []
+    for group, data in zip(groups, responses):
+        group_tiles, group_entries = _split_tiles(group, data)
+        by_tile.update(group_tiles)
+        entries.extend(group_entries)
+    overpass_cache.store_many(entries)
+    return by_tile
+
+
+def _fetch_tiles(tiles: List[Tuple[int, int]]) -> Dict[Tuple[int, int], List[dict]]:
+    """Fetch the given tiles with one Overpass query per rectangle of tiles (see _tile_groups)."""
+    # Envelopes themselves are not stored: their keys would rarely be asked for again
+    groups = _tile_groups(tiles)
+    responses = [_overpass_fetch(_city_nodes_query(_tiles_envelope(group)), store=False) for group in groups]
+    return _store_groups(groups, responses)
+
+
+async def _fetch_tiles_async(tiles: List[Tuple[int, int]]) -> Dict[Tuple[int, int], List[dict]]:
+    """Async version of _fetch_tiles; the group queries run concurrently."""
+    groups = _tile_groups(tiles)
+    responses = await asyncio.gather(
+        *(_overpass_fetch_async(_city_nodes_query(_tiles_envelope(group)), store=False) for group in groups)
+    )
+    return await asyncio.to_thread(_store_groups, groups, responses)
+
+
+def _cached_tiles(tiles: List[Tuple[int, int]]):
+    """
+    Features of the tiles found in memory or on disk, and the tiles still
+    missing. Tiles past the TTL are served and revalidated in the background.
+    """
+    features_by_tile = {}
+    missing = []
+    for tile in tiles:
+        entry = _tile_cache.get(tile)
+        if entry is None:
+            entry = _disk_tile(tile)
+            if entry is not None:
+                _tile_cache.put(tile, *entry)
+        if entry is None:
+            missing.append(tile)
+            continue
+        features, fetched_at = entry
+        if overpass_cache.is_stale(fetched_at):
+            _revalidate_tile(tile)
+        features_by_tile[tile] = features
+    return features_by_tile, missing
+
+
+def _tiles_to_gdf(bbox, tiles, features_by_tile) -> gpd.GeoDataFrame:
+    min_lat, min_lon, max_lat, max_lon = bbox
+    features = [
+        feature
+        for tile in tiles
+        for feature in features_by_tile.get(tile, [])
+        if min_lon <= feature['geometry']['coordinates'][0] <= max_lon
+        and min_lat <= feature['geometry']['coordinates'][1] <= max_lat
+    ]
+    return _features_to_gdf(features)
+
+
+def get_city_boundaries_by_bbox(bbox):
+    """
+    Fetch city boundaries from OpenStreetMap using Overpass API within a bounding box
+    
+    The bbox is snapped to a fixed grid of OVERPASS_TILE_DEG tiles; each tile
+    is fetched once and cached in memory and on disk, and the result is the
+    union of the covering tiles filtered to the exact bbox. Nearby bboxes
+    therefore share cache entries, and missing tiles are fetched with one
+    Overpass request per rectangle of missing tiles.
+    
+    Args:
+        bbox (tuple): Bounding box (min_lat, min_lon, max_lat, max_lon)
+    """
+    tiles = _tiles_for_bbox(bbox)
+    features_by_tile, missing = _cached_tiles(tiles)
+
+    if missing:
+        try:
+            fetched = _fetch_tiles(missing)
+        except Exception as e:
+            # Failures are not cached; the next request retries the missing tiles
+            print(f"Error fetching OSM data: {e}")
+            fetched = {}
+        _add_tiles(features_by_tile, fetched)
+
+    return _tiles_to_gdf(bbox, tiles, features_by_tile)
+
+
+async def get_city_boundaries_by_bbox_async(bbox):
+    """Async version of get_city_boundaries_by_bbox; never blocks the event loop on Overpass or the disk cache."""
+    tiles = _tiles_for_bbox(bbox)
+    features_by_tile, missing = await asyncio.to_thread(_cached_tiles, tiles)
+
+    if missing:
+        try:
+            fetched = await _fetch_tiles_async(missing)
+        except Exception as e:
+            print(f"Error fetching OSM data: {e}")
+            fetched = {}
+        _add_tiles(features_by_tile, fetched)
+
+    return _tiles_to_gdf(bbox, tiles, features_by_tile)
+
+
+def _add_tiles(features_by_tile, fetched):
+    now = time.time()
+    for tile, features in fetched.items():
+        _tile_cache.put(tile, features, now)
+    features_by_tile.update(fetched)
+
+
+def get_overpass_cache_stats() -> dict:
+    """Hit/miss counters of the in-memory tile cache and the on-disk response cache."""
+    return {"tiles": _tile_cache.stats(), "disk": overpass_cache.stats(), "client": overpass_client.stats()}
+
+
+# Statewide index of Florida city/town nodes, loaded and refreshed in a
+# background thread; until it is ready, queries go to Overpass per bbox.
+places_index = FloridaPlacesIndex(_fetch_city_nodes)
+
+
+# Florida county polygons for in-process admin lookups (FL_COUNTIES_PATH);
+# Overpass is only asked for points outside them
+counties_index = FloridaCountiesIndex()
+
+
+def load_counties_index() -> bool:
+    """Load the county polygons now instead of on the first lookup."""
+    return counties_index.load()
+
+
+def start_places_index():
+    """Start loading the Florida places index in the background (idempotent)."""
+    places_index.start()
+
+
+def _indexed(bbox) -> bool:
+    # The first query kicks off the background load; it never waits for it
+    places_index.start()
+    return places_index.covers(bbox)
+
+
+def _cities_in_bbox(bbox):
+    """City/town nodes in a bbox, from the places index when it covers the bbox."""
+    if _indexed(bbox):
+        return places_index.places_in_bbox(bbox)
+    return get_city_boundaries_by_bbox(bbox)
+
+
+async def _cities_in_bbox_async(bbox):
+    if _indexed(bbox):
+        return places_index.places_in_bbox(bbox)
+    return await get_city_boundaries_by_bbox_async(bbox)
 
 
 def get_city_boundary(city_name, bbox=None):
@@ -86,9 +530,19 @@ def get_city_boundary(city_name, bbox=None):
         print("Error: bounding box is required. Please provide bbox=(min_lat, min_lon, max_lat, max_lon)")
         return gpd.GeoDataFrame(columns=['name', 'osm_id', 'place_type', 'population', 'element_type', 'geometry'])
     
-    # Get city boundaries within the bounding box (uses cache)
-    all_cities = get_city_boundaries_by_bbox(bbox)
-    
+    # Get city boundaries within the bounding box (index or cached Overpass query)
+    return _match_city(city_name, _cities_in_bbox(bbox))
+
+
+async def get_city_boundary_async(city_name, bbox=None):
+    """Async version of get_city_boundary."""
+    if bbox is None:
+        print("Error: bounding box is required. Please provide bbox=(min_lat, min_lon, max_lat, max_lon)")
+        return gpd.GeoDataFrame(columns=PLACE_COLUMNS)
+    return _match_city(city_name, await _cities_in_bbox_async(bbox))
+
+
+def _match_city(city_name, all_cities):
     if all_cities.empty:
         print("No city data available in the specified area")
         return gpd.GeoDataFrame(columns=['name', 'osm_id', 'place_type', 'population', 'element_type', 'geometry'])
@@ -122,8 +576,15 @@ def get_city_boundary_geojson(city_name, bbox=None):
     Returns:
         dict: GeoJSON representation of the city boundary
     """
-    city_gdf = get_city_boundary(city_name, bbox=bbox)
-    
+    return _city_geojson(city_name, get_city_boundary(city_name, bbox=bbox))
+
+
+async def get_city_boundary_geojson_async(city_name, bbox=None):
+    """Async version of get_city_boundary_geojson."""
+    return _city_geojson(city_name, await get_city_boundary_async(city_name, bbox=bbox))
+
+
+def _city_geojson(city_name, city_gdf):
     if city_gdf.empty:
         return {
             "type": "FeatureCollection",
@@ -148,9 +609,26 @@ def list_available_cities(bbox=None):
     if bbox is None:
         print("Error: bounding box is required. Please provide bbox=(min_lat, min_lon, max_lat, max_lon)")
         return []
-        
-    all_cities = get_city_boundaries_by_bbox(bbox)
     
+    if _indexed(bbox):
+        return places_index.names_in_bbox(bbox)
+        
+    return _sorted_names(get_city_boundaries_by_bbox(bbox))
+
+
+async def list_available_cities_async(bbox=None):
+    """Async version of list_available_cities."""
+    if bbox is None:
+        print("Error: bounding box is required. Please provide bbox=(min_lat, min_lon, max_lat, max_lon)")
+        return []
+
+    if _indexed(bbox):
+        return places_index.names_in_bbox(bbox)
+
+    return _sorted_names(await get_city_boundaries_by_bbox_async(bbox))
+
+
+def _sorted_names(all_cities):
     if all_cities.empty:
         return []
     
@@ -255,60 +733,330 @@ def reverse_geocode_coordinate(
               - county: County name
               - city: City name
               - all_cities_nearby: List of nearby cities within search radius
+              - nearest_cities: Up to NEAREST_CITIES_K closest cities as
+                {"name", "distance_km"} (great-circle km), closest first
     """
     if radius_km is not None:
         search_radius_km = radius_km
 
-    from shapely.geometry import Point
+    bbox = _search_bbox(lat, lon, search_radius_km)
+    result = _empty_location(lat, lon)
+
+    try:
+        admin, cities_gdf = _admin_and_cities(lat, lon, bbox)
+        result.update(admin)
+
+        if cities_gdf is None:
+            _nearest_from_index(result, lat, lon, bbox)
+        else:
+            _nearest_from_gdf(result, lat, lon, cities_gdf)
+
+    except Exception as exc:
+        print(f"Error in reverse geocoding: {exc}")
+        result["error"] = str(exc)
+
+    return result
+
+
+async def reverse_geocode_coordinate_async(
+    lat: float,
+    lon: float,
+    *,
+    search_radius_km: float = 50,
+    radius_km: Optional[float] = None,
+):
+    """Async version of reverse_geocode_coordinate; Overpass calls use the pooled async client."""
+    if radius_km is not None:
+        search_radius_km = radius_km
+
+    bbox = _search_bbox(lat, lon, search_radius_km)
+    result = _empty_location(lat, lon)
+
+    try:
+        admin, cities_gdf = await _admin_and_cities_async(lat, lon, bbox)
+        result.update(admin)
+
+        if cities_gdf is None:
+            _nearest_from_index(result, lat, lon, bbox)
+        else:
+            _nearest_from_gdf(result, lat, lon, cities_gdf)
+
+    except Exception as exc:
+        print(f"Error in reverse geocoding: {exc}")
+        result["error"] = str(exc)
+
+    return result
+
+
+def _admin_and_cities(lat, lon, bbox):
+    """
+    Admin boundaries at a point and the city nodes around it.
+
+    Admin boundaries come from the county polygons when they cover the
+    point; otherwise both are looked up in the caches first. When both
+    miss, a combined Overpass query fetches the admin relations together
+    with the first rectangle of missing city tiles (see _tile_groups), so
+    the two lookups never cost two round trips in series. The cities are None when the places index
+    covers ``bbox``.
+    """
+    admin_query = _admin_boundaries_query(lat, lon)
+    local_admin = counties_index.lookup(lat, lon)
+    admin_data = None if local_admin else _cached_overpass_json(admin_query)
+    if _indexed(bbox):
+        return local_admin or _admin_from(admin_data, admin_query), None
+
+    tiles = _tiles_for_bbox(bbox)
+    features_by_tile, missing = _cached_tiles(tiles)
+    if not local_admin and admin_data is None and missing:
+        try:
+            first, *rest = _tile_groups(missing)
+            data = _overpass_fetch(_admin_and_cities_query(lat, lon, _tiles_envelope(first)), store=False)
+            admin_data, fetched = _split_admin_and_cities(admin_query, first, data)
+            _add_tiles(features_by_tile, fetched)
+            if rest:
+                _add_tiles(features_by_tile, _fetch_tiles([tile for group in rest for tile in group]))
+        except Exception as e:
+            print(f"Error fetching OSM data: {e}")
+        return _parse_admin_boundaries(admin_data or {}), _tiles_to_gdf(bbox, tiles, features_by_tile)
+
+    admin = local_admin or _admin_from(admin_data, admin_query)
+    if missing:
+        try:
+            _add_tiles(features_by_tile, _fetch_tiles(missing))
+        except Exception as e:
+            print(f"Error fetching OSM data: {e}")
+    return admin, _tiles_to_gdf(bbox, tiles, features_by_tile)
+
+
+async def _admin_and_cities_async(lat, lon, bbox):
+    """Async version of _admin_and_cities; disk cache access runs in worker threads."""
+    admin_query = _admin_boundaries_query(lat, lon)
+    local_admin = counties_index.lookup(lat, lon)
+    admin_data = None if local_admin else await asyncio.to_thread(_cached_overpass_json, admin_query)
+    if _indexed(bbox):
+        return local_admin or await _admin_from_async(admin_data, admin_query), None
+
+    tiles = _tiles_for_bbox(bbox)
+    features_by_tile, missing = await asyncio.to_thread(_cached_tiles, tiles)
+    if not local_admin and admin_data is None and missing:
+        try:
+            first, *rest = _tile_groups(missing)
+            query = _admin_and_cities_query(lat, lon, _tiles_envelope(first))
+            data, fetched_rest = await asyncio.gather(
+                _overpass_fetch_async(query, store=False),
+                _fetch_tiles_async([tile for group in rest for tile in group]) if rest else asyncio.sleep(0, {}),
+                return_exceptions=True,
+            )
+            if isinstance(fetched_rest, Exception):
+                print(f"Error fetching OSM data: {fetched_rest}")
+            else:
+                _add_tiles(features_by_tile, fetched_rest)
+            if isinstance(data, Exception):
+                raise data
+            admin_data, fetched = await asyncio.to_thread(_split_admin_and_cities, admin_query, first, data)
+            _add_tiles(features_by_tile, fetched)
+        except Exception as e:
+            print(f"Error fetching OSM data: {e}")
+        return _parse_admin_boundaries(admin_data or {}), _tiles_to_gdf(bbox, tiles, features_by_tile)
+
+    admin = local_admin or await _admin_from_async(admin_data, admin_query)
+    if missing:
+        try:
+            _add_tiles(features_by_tile, await _fetch_tiles_async(missing))
+        except Exception as e:
+            print(f"Error fetching OSM data: {e}")
+    return admin, _tiles_to_gdf(bbox, tiles, features_by_tile)
+
+
+def _admin_from(admin_data, admin_query) -> dict:
+    try:
+        if admin_data is None:
+            admin_data = _overpass_fetch(admin_query)
+        return _parse_admin_boundaries(admin_data)
+    except Exception as e:
+        print(f"Error getting admin boundaries: {e}")
+        return _parse_admin_boundaries({})
+
+
+async def _admin_from_async(admin_data, admin_query) -> dict:
+    try:
+        if admin_data is None:
+            admin_data = await _overpass_fetch_async(admin_query)
+        return _parse_admin_boundaries(admin_data)
+    except Exception as e:
+        print(f"Error getting admin boundaries: {e}")
+        return _parse_admin_boundaries({})
+
+
+def _admin_and_cities_query(lat, lon, envelope) -> str:
+    min_lat, min_lon, max_lat, max_lon = envelope
+    lat, lon = round(lat, 4), round(lon, 4)
+    return f"""[out:json][timeout:60];
+{_admin_relations(lat, lon)}
+out tags;
+(
+  node["place"~"^(city|town)$"](bbox:{min_lat},{min_lon},{max_lat},{max_lon});
+);
+out;"""
+
+
+def _split_admin_and_cities(admin_query, tiles, data):
+    """Store the admin relations and the city tiles of a combined response under their own cache keys."""
+    elements = data.get('elements', [])
+    admin_data = {'elements': [e for e in elements if e.get('type') == 'relation']}
+    nodes = {'elements': [e for e in elements if e.get('type') == 'node']}
+    by_tile, entries = _split_tiles(tiles, nodes)
+    overpass_cache.store_many([(admin_query, admin_data)] + entries)
+    return admin_data, by_tile
 
-    point = Point(lon, lat)
 
+def _search_bbox(lat, lon, search_radius_km):
     # Rough conversion: 1 degree ≈ 111 km
     radius_degrees = search_radius_km / 111.0
-    bbox = (
+    return (
         lat - radius_degrees,  # min_lat
         lon - radius_degrees,  # min_lon
         lat + radius_degrees,  # max_lat
         lon + radius_degrees,  # max_lon
     )
 
-    result = {
+
+def _empty_location(lat, lon) -> dict:
+    return {
         "country": None,
         "state": None,
         "county": None,
         "city": None,
         "all_cities_nearby": [],
+        "nearest_cities": [],
         "coordinates": {"lat": lat, "lon": lon},
     }
 
-    try:
-        result.update(_get_admin_boundaries_at_point(lat, lon))
 
-        cities_gdf = get_city_boundaries_by_bbox(bbox)
-        if not cities_gdf.empty:
-            if cities_gdf.crs is None:
-                cities_gdf = cities_gdf.set_crs("EPSG:4326")
+def _nearest_from_index(result, lat, lon, bbox):
+    result["all_cities_nearby"] = places_index.names_in_bbox(bbox)
+    if result["all_cities_nearby"]:
+        _set_nearest(result, places_index.nearest(lat, lon, k=NEAREST_CITIES_K, bbox=bbox))
 
-            cities_gdf["distance"] = cities_gdf.geometry.distance(point)
 
-            result["all_cities_nearby"] = sorted(cities_gdf["name"].tolist())
+def _nearest_from_gdf(result, lat, lon, cities_gdf):
+    # Coordinates are read into fresh arrays; the (possibly shared) frame is never modified
+    if cities_gdf.empty:
+        return
+    result["all_cities_nearby"] = sorted(cities_gdf["name"].tolist())
+    lats = np.asarray(cities_gdf.geometry.y, dtype=np.float64)
+    lons = np.asarray(cities_gdf.geometry.x, dtype=np.float64)
+    positions, distances = k_nearest(lat, lon, lats, lons, NEAREST_CITIES_K)
+    names = cities_gdf["name"].to_numpy(dtype=object)[positions]
+    _set_nearest(result, list(zip(names.tolist(), distances.tolist())))
 
-            closest_city = cities_gdf.loc[cities_gdf["distance"].idxmin()]
-            if closest_city["distance"] < 0.1:
-                result["city"] = closest_city["name"]
-            else:
-                result["city"] = f"{closest_city['name']} (nearest, {closest_city['distance'] * 111:.1f}km)"
 
-    except Exception as exc:
-        print(f"Error in reverse geocoding: {exc}")
-        result["error"] = str(exc)
+def _set_nearest(result, nearest):
+    """Fill ``city`` and ``nearest_cities`` from (name, km) pairs, closest first."""
+    result["nearest_cities"] = [{"name": name, "distance_km": round(km, 2)} for name, km in nearest]
+    if nearest:
+        name, km = nearest[0]
+        result["city"] = name if km < NEAREST_CITY_MAX_KM else f"{name} (nearest, {km:.1f}km)"
+
+
+async def iter_reverse_geocode_batch(
+    points: Iterable[Tuple[float, float]],
+    search_radius_km: float = 50,
+) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    Reverse geocode many coordinates, yielding results in input order.
+
+    Duplicate coordinates (to 6 decimals, ~0.1 m) are resolved once. The
+    unique points are grouped into REVERSE_GEOCODE_CLUSTER_DEG grid cells;
+    each cell costs one city lookup over its points' combined search area
+    (places index or cached Overpass tiles) and a vectorized nearest-city
+    search per point. Admin boundaries come from the county polygons, and
+    the points they don't cover share one Overpass query per cell (see
+    _admin_boundaries_for_points_async). Cells are processed in order of
+    first appearance and results are yielded as soon as every earlier input
+    row is resolved, so spatially sorted input streams with little
+    buffering.
+
+    Args:
+        points (iterable): (lat, lon) pairs
+        search_radius_km (float): Search radius per point, as in reverse_geocode_coordinate
+
+    Yields:
+        tuple: (input index, result dict shaped like reverse_geocode_coordinate's)
+    """
+    keys = [(round(lat, 6), round(lon, 6)) for lat, lon in points]
+    clusters = OrderedDict()
+    seen = set()
+    for key in keys:
+        if key not in seen:
+            seen.add(key)
+            cell = (math.floor(key[0] / REVERSE_GEOCODE_CLUSTER_DEG), math.floor(key[1] / REVERSE_GEOCODE_CLUSTER_DEG))
+            clusters.setdefault(cell, []).append(key)
+
+    results = {}
+    next_index = 0
+    for cluster in clusters.values():
+        results.update(await _reverse_geocode_cluster_async(cluster, search_radius_km))
+        while next_index < len(keys) and keys[next_index] in results:
+            yield next_index, results[keys[next_index]]
+            next_index += 1
+
+
+async def _reverse_geocode_cluster_async(keys: List[Tuple[float, float]], search_radius_km: float) -> Dict[Tuple[float, float], dict]:
+    radius_degrees = search_radius_km / 111.0
+    lats = np.array([lat for lat, _ in keys], dtype=np.float64)
+    lons = np.array([lon for _, lon in keys], dtype=np.float64)
+    cluster_bbox = (
+        lats.min() - radius_degrees,
+        lons.min() - radius_degrees,
+        lats.max() + radius_degrees,
+        lons.max() + radius_degrees,
+    )
+
+    results = {key: _empty_location(*key) for key in keys}
+    try:
+        cities_gdf = await _cities_in_bbox_async(cluster_bbox)
+    except Exception as e:
+        print(f"Error in batch reverse geocoding: {e}")
+        for result in results.values():
+            result["error"] = str(e)
+        return results
+
+    if cities_gdf.empty:
+        city_lats = city_lons = np.empty(0, dtype=np.float64)
+        city_names = np.empty(0, dtype=object)
+    else:
+        city_lats = np.asarray(cities_gdf.geometry.y, dtype=np.float64)
+        city_lons = np.asarray(cities_gdf.geometry.x, dtype=np.float64)
+        city_names = cities_gdf["name"].to_numpy(dtype=object)
+
+    # Admin boundaries: county polygons in-process, one combined Overpass query for the rest
+    admins = {key: counties_index.lookup(*key) for key in keys}
+    uncovered = [key for key, admin in admins.items() if admin is None]
+    if uncovered:
+        admins.update(await _admin_boundaries_for_points_async(uncovered))
+
+    for key in keys:
+        lat, lon = key
+        result = results[key]
+        result.update(admins[key])
+        nearby = np.nonzero(
+            (np.abs(city_lats - lat) <= radius_degrees) & (np.abs(city_lons - lon) <= radius_degrees)
+        )[0]
+        result["all_cities_nearby"] = sorted(city_names[nearby].tolist())
+        if len(nearby):
+            positions, distances = k_nearest(lat, lon, city_lats[nearby], city_lons[nearby], NEAREST_CITIES_K)
+            _set_nearest(result, list(zip(city_names[nearby[positions]].tolist(), distances.tolist())))
+    return results
 
-    return result
 
 def _get_admin_boundaries_at_point(lat, lon):
     """
     Helper function to get administrative boundaries (country, state, county) at a specific point.
     
+    Points inside the Florida county polygons are resolved in-process;
+    Overpass is only queried outside them.
+    
     Args:
         lat (float): Latitude
         lon (float): Longitude
@@ -316,42 +1064,108 @@ def _get_admin_boundaries_at_point(lat, lon):
     Returns:
         dict: Dictionary with country, state, county information
     """
-    overpass_url = "http://overpass-api.de/api/interpreter"
+    result = counties_index.lookup(lat, lon)
+    if result is not None:
+        return result
+
+    result = {"country": None, "state": None, "county": None}
+    
+    try:
+        result = _parse_admin_boundaries(overpass_json(_admin_boundaries_query(lat, lon)))
+    except Exception as e:
+        print(f"Error getting admin boundaries: {e}")
+    
+    return result
+
+
+async def _admin_boundaries_for_points_async(points: List[Tuple[float, float]]) -> Dict[Tuple[float, float], dict]:
+    """
+    Admin boundaries (country, state, county) for many points with one
+    Overpass query per REVERSE_GEOCODE_ADMIN_BATCH points instead of one
+    per point. Points failing to resolve get empty fields, as in
+    _get_admin_boundaries_at_point.
+    """
+    # Rounded to ~11 m like _admin_boundaries_query, so near-duplicates share a slot in the query
+    unique = sorted({(round(lat, 4), round(lon, 4)) for lat, lon in points})
+    size = max(1, REVERSE_GEOCODE_ADMIN_BATCH)
+    chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+    slots = asyncio.Semaphore(OVERPASS_MAX_CONNECTIONS)
+
+    async def resolve(chunk):
+        async with slots:
+            try:
+                return _parse_admin_batch(chunk, await overpass_json_async(_admin_batch_query(chunk)))
+            except Exception as e:
+                print(f"Error getting admin boundaries: {e}")
+                return {}
+
+    by_point = {}
+    for resolved in await asyncio.gather(*(resolve(chunk) for chunk in chunks)):
+        by_point.update(resolved)
+    empty = {"country": None, "state": None, "county": None}
+    return {(lat, lon): dict(by_point.get((round(lat, 4), round(lon, 4)), empty)) for lat, lon in points}
+
+
+def _admin_batch_query(points: List[Tuple[float, float]]) -> str:
+    # Each point's relations are followed by a marker element carrying its index
+    parts = [
+        f"""is_in({lat},{lon})->.areas;
+rel(pivot.areas)["boundary"="administrative"]["admin_level"~"^(2|4|6)$"];
+out tags;
+make batch_point index="{index}";
+out;"""
+        for index, (lat, lon) in enumerate(points)
+    ]
+    return "[out:json][timeout:90];\n" + "\n".join(parts)
+
+
+def _parse_admin_batch(points: List[Tuple[float, float]], data: dict) -> Dict[Tuple[float, float], dict]:
+    results = {}
+    relations = []
+    for element in data.get('elements', []):
+        if element.get('type') == 'relation':
+            relations.append(element)
+        elif element.get('type') == 'batch_point':
+            index = int(element.get('tags', {}).get('index', -1))
+            if 0 <= index < len(points):
+                results[points[index]] = _parse_admin_boundaries({'elements': relations})
+            relations = []
+    return results
+
+
+def _admin_boundaries_query(lat, lon) -> str:
+    # Rounded to ~11 m so nearby points share a disk cache entry
+    lat, lon = round(lat, 4), round(lon, 4)
     
     # Query for administrative boundaries at the point
-    overpass_query = f"""
+    return f"""
     [out:json][timeout:30];
-    (
+    {_admin_relations(lat, lon)}
+    out tags;
+    """
+
+
+def _admin_relations(lat, lon) -> str:
+    return f"""(
       relation["admin_level"="2"]["boundary"="administrative"](around:1000,{lat},{lon});
       relation["admin_level"="4"]["boundary"="administrative"](around:1000,{lat},{lon});
       relation["admin_level"="6"]["boundary"="administrative"](around:1000,{lat},{lon});
-    );
-    out tags;
-    """
-    
+    );"""
+
+
+def _parse_admin_boundaries(data: dict) -> dict:
     result = {"country": None, "state": None, "county": None}
-    
-    try:
-        response = requests.get(overpass_url, params={'data': overpass_query})
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        for element in data.get('elements', []):
-            if element.get('type') == 'relation':
-                tags = element.get('tags', {})
-                admin_level = tags.get('admin_level')
-                name = tags.get('name')
-                
-                if name:
-                    if admin_level == '2':  # Country level
-                        result["country"] = name
-                    elif admin_level == '4':  # State/Province level
-                        result["state"] = name
-                    elif admin_level == '6':  # County level
-                        result["county"] = name
-                        
-    except Exception as e:
-        print(f"Error getting admin boundaries: {e}")
-    
-    return result
\ No newline at end of file
+    for element in data.get('elements', []):
+        if element.get('type') == 'relation':
+            tags = element.get('tags', {})
+            admin_level = tags.get('admin_level')
+            name = tags.get('name')
+            
+            if name:
+                if admin_level == '2':  # Country level
+                    result["country"] = name
+                elif admin_level == '4':  # State/Province level
+                    result["state"] = name
+                elif admin_level == '6':  # County level
+                    result["county"] = name
+    return result
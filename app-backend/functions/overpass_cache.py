@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+
+# Disk cache knobs (env-driven). OVERPASS_CACHE_DB=off disables the cache.
+DEFAULT_OVERPASS_CACHE_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "overpass_cache.sqlite")
+OVERPASS_CACHE_DB = os.getenv("OVERPASS_CACHE_DB", DEFAULT_OVERPASS_CACHE_DB)
+OVERPASS_CACHE_TTL_S = float(os.getenv("OVERPASS_CACHE_TTL_S", str(7 * 24 * 3600)))
+OVERPASS_CACHE_STALE_S = float(os.getenv("OVERPASS_CACHE_STALE_S", str(30 * 24 * 3600)))
+OVERPASS_CACHE_MAX_BYTES = int(os.getenv("OVERPASS_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so formatting differences don't change the cache key."""
+    return " ".join(query.split())
+
+
+class OverpassCache:
+    """
+    SQLite cache of raw Overpass JSON responses keyed by normalized query.
+
+    An entry is fresh for ``ttl_s``. For a further ``stale_s`` it is still
+    served but reported as stale, so the caller can revalidate it in the
+    background. Least-recently-used entries are evicted once the stored
+    responses exceed ``max_bytes``. Lookups don't write: their last-used
+    times are batched into the next store (or every TOUCH_BATCH lookups).
+    """
+
+    TOUCH_BATCH = 256
+
+    def __init__(
+        self,
+        db_path: Optional[str] = OVERPASS_CACHE_DB,
+        ttl_s: float = OVERPASS_CACHE_TTL_S,
+        stale_s: float = OVERPASS_CACHE_STALE_S,
+        max_bytes: int = OVERPASS_CACHE_MAX_BYTES,
+    ):
+        self.db_path = None if not db_path or db_path.lower() == "off" else db_path
+        self.ttl_s = ttl_s
+        self.stale_s = stale_s
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._touched = {}
+
+        self._db = None
+        if self.db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, query TEXT NOT NULL, body TEXT NOT NULL, size INTEGER NOT NULL, "
+                "fetched_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+            self._db.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - ttl_s - stale_s,))
+            self._db.commit()
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+
+    def is_stale(self, fetched_at: float) -> bool:
+        """True if a response fetched at ``fetched_at`` is past its TTL."""
+        return time.time() - fetched_at > self.ttl_s
+
+    def lookup(self, query: str) -> Tuple[Optional[dict], Optional[float]]:
+        """
+        Return (response, fetched_at) for a query, or (None, None) on a miss.
+        Use ``is_stale(fetched_at)`` to decide whether to revalidate.
+        """
+        if self._db is None:
+            return None, None
+        now = time.time()
+        key = self._key(query)
+        with self._lock:
+            row = self._db.execute("SELECT body, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl_s + self.stale_s:
+                self.misses += 1
+                return None, None
+            self._touched[key] = now
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._flush_touched()
+                self._db.commit()
+            if now - row[1] > self.ttl_s:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+        return json.loads(row[0]), row[1]
+
+    def store(self, query: str, response: dict):
+        """Store a raw Overpass response, evicting LRU entries over the size bound."""
+        self.store_many([(query, response)])
+
+    def store_many(self, entries: Iterable[Tuple[str, dict]]):
+        """Store several responses in one transaction."""
+        if self._db is None:
+            return
+        now = time.time()
+        rows = []
+        for query, response in entries:
+            body = json.dumps(response, separators=(",", ":"))
+            rows.append((self._key(query), normalize_query(query), body, len(body), now, now))
+        if not rows:
+            return
+        with self._lock:
+            self._flush_touched()
+            self._db.executemany(
+                "INSERT OR REPLACE INTO responses (key, query, body, size, fetched_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(total - self.max_bytes)
+            self._db.commit()
+
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self, excess_bytes: int):
+        freed = 0
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if freed >= excess_bytes:
+                break
+            doomed.append((key,))
+            freed += size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def stats(self) -> dict:
+        """Return hit/stale/miss counters and the stored size."""
+        entries, size = 0, 0
+        if self._db is not None:
+            with self._lock:
+                entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttl_s": self.ttl_s,
+            "stale_s": self.stale_s,
+            "path": self.db_path,
+        }
@@ -0,0 +1,100 @@
+import asyncio
+import os
+import random
+from typing import Optional
+
+import httpx
+
+# Client knobs (env-driven)
+OVERPASS_CONNECT_TIMEOUT_S = float(os.getenv("OVERPASS_CONNECT_TIMEOUT_S", "5"))
+# Slightly above the [timeout:60] the queries ask the server for
+OVERPASS_READ_TIMEOUT_S = float(os.getenv("OVERPASS_READ_TIMEOUT_S", "65"))
+OVERPASS_MAX_CONNECTIONS = int(os.getenv("OVERPASS_MAX_CONNECTIONS", "8"))
+OVERPASS_KEEPALIVE_S = float(os.getenv("OVERPASS_KEEPALIVE_S", "30"))
+OVERPASS_MAX_ATTEMPTS = int(os.getenv("OVERPASS_MAX_ATTEMPTS", "3"))
+OVERPASS_RETRY_BASE_S = float(os.getenv("OVERPASS_RETRY_BASE_S", "0.5"))
+OVERPASS_RETRY_MAX_S = float(os.getenv("OVERPASS_RETRY_MAX_S", "8"))
+
+# Overpass answers 429 when its slots are taken and 504 when it is overloaded
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AsyncOverpassClient:
+    """
+    Shared async HTTP client for the Overpass API.
+
+    One pooled ``httpx.AsyncClient`` (keep-alive, bounded connections)
+    is created on first use and reused by every request. Timeouts, 429s
+    and 5xx responses are retried with full-jitter exponential backoff;
+    a ``Retry-After`` header, when present, sets the minimum wait.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_attempts: int = OVERPASS_MAX_ATTEMPTS,
+        retry_base_s: float = OVERPASS_RETRY_BASE_S,
+        retry_max_s: float = OVERPASS_RETRY_MAX_S,
+    ):
+        self.url = url
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_s = retry_base_s
+        self.retry_max_s = retry_max_s
+        self._client: Optional[httpx.AsyncClient] = None
+        self.requests = 0
+        self.retries = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(OVERPASS_READ_TIMEOUT_S, connect=OVERPASS_CONNECT_TIMEOUT_S),
+                limits=httpx.Limits(
+                    max_connections=OVERPASS_MAX_CONNECTIONS,
+                    max_keepalive_connections=OVERPASS_MAX_CONNECTIONS,
+                    keepalive_expiry=OVERPASS_KEEPALIVE_S,
+                ),
+            )
+        return self._client
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        delay = random.uniform(0, min(self.retry_max_s, self.retry_base_s * 2 ** attempt))
+        try:
+            return max(delay, min(self.retry_max_s, float(retry_after))) if retry_after else delay
+        except ValueError:
+            return delay
+
+    async def query(self, query: str) -> dict:
+        """
+        Run an Overpass QL query and return the decoded JSON.
+
+        Raises the last error once all attempts are used up; other 4xx
+        responses are raised immediately.
+        """
+        client = self._get_client()
+        for attempt in range(self.max_attempts):
+            self.requests += 1
+            last_attempt = attempt == self.max_attempts - 1
+            try:
+                response = await client.post(self.url, data={"data": query})
+            except (httpx.TimeoutException, httpx.TransportError):
+                if last_attempt:
+                    raise
+                self.retries += 1
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and not last_attempt:
+                self.retries += 1
+                await asyncio.sleep(self._backoff(attempt, response.headers.get("Retry-After")))
+                continue
+            response.raise_for_status()
+            return response.json()
+
+    async def aclose(self):
+        """Close the pooled connections (call on application shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "retries": self.retries}
@@ -0,0 +1,152 @@
+import datetime
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+from florida_data import COUNTY_CITIES
+
+PROPERTY_FIELDS = ("address", "city", "zip", "year_built")
+
+# Three-digit ZIP prefixes (USPS sectional centers) that serve Florida
+FL_ZIP_PREFIXES = {
+    "320", "321", "322", "323", "324", "325", "326", "327", "328", "329",
+    "330", "331", "332", "333", "334", "335", "336", "337", "338", "339",
+    "341", "342", "344", "346", "347", "349",
+}
+
+STREET_SUFFIXES = (
+    "Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Place|Pl|"
+    "Terrace|Ter|Circle|Cir|Highway|Hwy|Parkway|Pkwy|Trail|Trl|Loop|Run|Point|Pt|Square|Sq|Cove|Cv|Path|Row"
+)
+
+ADDRESS_RE = re.compile(
+    r"\b\d{1,6}\s+"                                       # house number
+    r"(?:[NSEW]\.?\s+)?"                                  # leading direction
+    r"(?:(?:[A-Za-z][A-Za-z'-]*|\d+(?:st|nd|rd|th))\s+){0,4}?"  # street name words (no bare numbers or periods)
+    rf"(?:{STREET_SUFFIXES})\b\.?"                        # street suffix
+    r"(?:\s+(?:N|S|E|W|NE|NW|SE|SW)\b\.?)?"               # trailing direction
+    r"(?:,?\s*(?:#|Apt\.?|Unit|Suite|Ste\.?)\s*[\w-]+)?",  # unit
+    re.IGNORECASE,
+)
+HOUSE_NUMBER_RE = re.compile(r"\b\d{1,6}\s")
+STATE_ZIP_RE = re.compile(r"\b(?:FL|Florida)[\s,]+(\d{5})(?:-\d{4})?\b", re.IGNORECASE)
+BARE_ZIP_RE = re.compile(r"\b(3[2-4]\d{3})(?:-\d{4})?\b")
+STATE_RE = re.compile(r"\b(?:FL|Florida)\b")
+# What may sit between a street address and a bare ZIP: an optional capitalized city
+ADDRESS_TO_ZIP_RE = re.compile(r"\s*,?\s*(?:[A-Z][A-Za-z'-]*(?:\s+[A-Z][A-Za-z'-]*){0,3})?\s*,?\s*")
+ZIP_LABEL_RE = re.compile(r"\b(?:zip|postal)(?:\s*code)?\s*[:#]?\s*$", re.IGNORECASE)
+YEAR_BUILT_RE = re.compile(
+    r"\b(?:year\s+built|built(?:\s+in)?|constructed(?:\s+in)?|yr\.?\s+built)\s*[:\-–—]?\s*((?:18|19|20)\d{2})\b"
+    r"|\b((?:18|19|20)\d{2})\s+(?:construction|built)\b",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1)
+def _city_re() -> re.Pattern:
+    # Capitalized or all-caps names only, so "sunrise views" isn't the city of Sunrise;
+    # longest names first so "Panama City Beach" wins over "Panama City"
+    names = sorted(_city_display_names().values(), key=len, reverse=True)
+    variants = [re.escape(n) for n in names] + [re.escape(n.upper()) for n in names]
+    return re.compile(r"\b(" + "|".join(variants) + r")\b")
+
+
+@lru_cache(maxsize=1)
+def _city_display_names() -> Dict[str, str]:
+    return {city.lower(): city for cities in COUNTY_CITIES.values() for city in cities}
+
+
+def _find_address(text: str) -> Optional[re.Match]:
+    # Try every house number, not just the leftmost, and prefer the candidate
+    # ending closest before the state/ZIP ("..., Miami FL 33101")
+    candidates = [
+        match
+        for number in HOUSE_NUMBER_RE.finditer(text)
+        for match in [ADDRESS_RE.match(text, number.start())]
+        if match
+    ]
+    if not candidates:
+        return None
+    anchor = STATE_RE.search(text)
+    if anchor is None:
+        return candidates[0]
+    before = [match for match in candidates if match.end() <= anchor.start()]
+    if before:
+        return max(before, key=lambda match: match.end())
+    return min(candidates, key=lambda match: abs(match.start() - anchor.start()))
+
+
+def _find_zip(text: str, address_end: int) -> Optional[str]:
+    for match in STATE_ZIP_RE.finditer(text):
+        if match.group(1)[:3] in FL_ZIP_PREFIXES:
+            return match.group(1)
+    # A bare 5-digit number is only a ZIP right after the street address
+    # (optionally with a city) or after a "ZIP" label, not "a price drop of 32801"
+    for match in BARE_ZIP_RE.finditer(text):
+        zip_code = match.group(1)
+        if zip_code[:3] not in FL_ZIP_PREFIXES:
+            continue
+        after_address = address_end and match.start() >= address_end and ADDRESS_TO_ZIP_RE.fullmatch(text[address_end:match.start()])
+        labelled = ZIP_LABEL_RE.search(text[max(0, match.start() - 16):match.start()])
+        if after_address or labelled:
+            return zip_code
+    return None
+
+
+def _find_city(text: str, address_end: int) -> Optional[str]:
+    # Only trust a gazetteer hit in an address-like position: right after the
+    # street address, followed by ", FL", or after "in" / "near"
+    for match in _city_re().finditer(text):
+        after_address = address_end and 0 <= match.start() - address_end <= 3
+        state_tagged = re.match(r"\s*,?\s*(?:FL|Florida)\b", text[match.end():], re.IGNORECASE)
+        located = re.search(r"\b(?:in|near|of)\s+$", text[max(0, match.start() - 12):match.start()], re.IGNORECASE)
+        if after_address or state_tagged or located:
+            return _city_display_names()[match.group(1).lower()]
+    return None
+
+
+def _find_year_built(text: str) -> Optional[int]:
+    latest = datetime.date.today().year + 1
+    for match in YEAR_BUILT_RE.finditer(text):
+        year = int(match.group(1) or match.group(2))
+        if 1800 <= year <= latest:
+            return year
+    return None
+
+
+def extract_property_fields(text: str) -> Dict[str, object]:
+    """
+    Deterministically extract address, city, zip and year_built from listing text.
+
+    Uses street-address and year-built patterns, Florida ZIP prefixes and
+    the Florida city gazetteer. Fields that can't be found are omitted.
+    Bare 5-digit numbers count as a ZIP only next to the address or a
+    "ZIP" label, so prices and phone numbers are not mistaken for one.
+
+    Args:
+        text (str): Listing text (markup already stripped)
+
+    Returns:
+        dict: Subset of {"address", "city", "zip", "year_built"}
+    """
+    fields = {}
+    address_end = 0
+
+    address = _find_address(text)
+    if address:
+        fields["address"] = re.sub(r"\s+", " ", address.group(0)).strip(" ,")
+        address_end = address.end()
+
+    city = _find_city(text, address_end)
+    if city:
+        fields["city"] = city
+
+    zip_code = _find_zip(text, address_end)
+    if zip_code:
+        fields["zip"] = zip_code
+
+    year_built = _find_year_built(text)
+    if year_built:
+        fields["year_built"] = year_built
+
+    return fields
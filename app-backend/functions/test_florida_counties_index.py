@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for the in-process Florida county lookup
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from florida_counties_index import FloridaCountiesIndex, _county_name
+
+
+def _square(name, min_lon, min_lat, size=1.0):
+    ring = [[min_lon, min_lat], [min_lon + size, min_lat], [min_lon + size, min_lat + size], [min_lon, min_lat + size], [min_lon, min_lat]]
+    return {"type": "Feature", "properties": {"NAME": name}, "geometry": {"type": "Polygon", "coordinates": [ring]}}
+
+
+def test_county_names():
+    """Dataset spellings are normalized to the Overpass admin_level=6 names"""
+
+    print("🧪 Testing county names...")
+    print("=" * 50)
+
+    cases = {
+        "Alachua": "Alachua County",
+        "PALM BEACH": "Palm Beach County",
+        "DESOTO": "DeSoto County",
+        "DeSoto": "DeSoto County",
+        "MIAMI-DADE": "Miami-Dade County",
+        "DADE": "Miami-Dade County",
+        "ST JOHNS": "St. Johns County",
+        "St. Lucie": "St. Lucie County",
+        "Indian River County": "Indian River County",
+    }
+    for raw, expected in cases.items():
+        assert _county_name(raw) == expected, f"{raw!r} -> {_county_name(raw)!r}"
+        print(f"✅ {raw!r} -> {expected!r}")
+
+
+def test_lookup():
+    """Points inside a polygon get its county; points outside (or no file) get None"""
+
+    print("\n🧪 Testing point lookup...")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "counties.geojson")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"type": "FeatureCollection", "features": [
+                _square("DESOTO", -82.0, 27.0),
+                _square("Miami-Dade", -81.0, 25.0),
+            ]}, f)
+
+        index = FloridaCountiesIndex(path)
+        assert index.lookup(27.2, -81.8) == {"country": "United States", "state": "Florida", "county": "DeSoto County"}
+        assert index.lookup(25.5, -80.5)["county"] == "Miami-Dade County"
+        print("✅ Points resolved to their counties")
+
+        assert index.lookup(30.0, -85.0) is None
+        print("✅ Point outside every polygon -> None")
+
+    missing = FloridaCountiesIndex(os.path.join(tempfile.gettempdir(), "no-such-counties.geojson"))
+    assert missing.lookup(27.2, -81.8) is None and not missing.ready
+    print("✅ Missing file -> None (callers use Overpass)")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting Florida counties index tests...\n")
+
+    test_county_names()
+    test_lookup()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
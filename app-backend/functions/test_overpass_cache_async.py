@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the async Overpass paths: disk cache (SQLite) work must stay off the event loop
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+
+# Throwaway disk cache; must be set before osm_api is imported
+os.environ["OVERPASS_CACHE_DB"] = os.path.join(tempfile.mkdtemp(), "overpass_cache.sqlite")
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import osm_api
+
+
+def _fake_response(query):
+    elements = [{"type": "node", "id": 1, "lat": 27.95, "lon": -82.46, "tags": {"name": "Tampa", "place": "city"}}]
+    if "admin_level" in query:
+        elements.append({"type": "relation", "id": 2, "tags": {"admin_level": "4", "name": "Florida"}})
+    return {"elements": elements}
+
+
+def test_cache_calls_run_in_worker_threads():
+    """lookup / store / store_many never run on the event loop thread"""
+
+    print("🧪 Testing async disk cache access...")
+    print("=" * 50)
+
+    cache = osm_api.overpass_cache
+    on_loop = []
+
+    def watched(method):
+        def call(*args, **kwargs):
+            if threading.current_thread() is threading.main_thread():
+                on_loop.append(method.__name__)
+            return method(*args, **kwargs)
+        return call
+
+    async def fake_query(query):
+        return _fake_response(query)
+
+    originals = (cache.lookup, cache.store, cache.store_many, osm_api.overpass_client.query)
+    cache.lookup, cache.store, cache.store_many = watched(cache.lookup), watched(cache.store), watched(cache.store_many)
+    osm_api.overpass_client.query = fake_query
+    try:
+        bbox = (27.8, -82.6, 28.1, -82.3)
+        cities = asyncio.run(osm_api.get_city_boundaries_by_bbox_async(bbox))
+        osm_api._tile_cache = osm_api._TileCache(max_age_s=osm_api._tile_cache.max_age_s)
+        cities_again = asyncio.run(osm_api.get_city_boundaries_by_bbox_async(bbox))
+        admin, _ = asyncio.run(osm_api._admin_and_cities_async(27.95, -82.46, (27.5, -83.0, 28.4, -82.0)))
+        asyncio.run(osm_api.overpass_json_async("[out:json];node(1);out;"))
+    finally:
+        cache.lookup, cache.store, cache.store_many, osm_api.overpass_client.query = originals
+
+    assert list(cities["name"]) == ["Tampa"] and list(cities_again["name"]) == ["Tampa"]
+    assert admin["state"] == "Florida", admin
+    assert not on_loop, f"ran on the event loop: {on_loop}"
+    print("✅ Cache reads and writes ran in worker threads")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting async Overpass cache tests...\n")
+
+    test_cache_calls_run_in_worker_threads()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
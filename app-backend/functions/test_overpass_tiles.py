@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the Overpass tile grid (bbox tiles, query groups, splitting responses)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from osm_api import OVERPASS_MAX_QUERY_TILES, OVERPASS_TILE_DEG, _split_tiles, _tile_groups, _tiles_envelope, _tiles_for_bbox
+
+
+def _node(node_id, lat, lon):
+    return {"type": "node", "id": node_id, "lat": lat, "lon": lon, "tags": {"name": f"n{node_id}", "place": "town"}}
+
+
+def test_tiles_for_bbox():
+    """The bbox is covered by every grid tile it touches, and no others"""
+
+    print("🧪 Testing bbox tiles...")
+    print("=" * 50)
+
+    deg = OVERPASS_TILE_DEG
+    tiles = _tiles_for_bbox((deg * 100 + deg / 2, deg * -300 + deg / 2, deg * 101 + deg / 2, deg * -299 + deg / 2))
+    assert sorted(tiles) == [(100, -300), (100, -299), (101, -300), (101, -299)], tiles
+    assert _tiles_for_bbox((deg * 4 + deg / 4, deg * 4 + deg / 4, deg * 4 + deg / 2, deg * 4 + deg / 2)) == [(4, 4)]
+    print("✅ 2x2 and single-tile bboxes")
+
+
+def test_groups_skip_cached_tiles():
+    """Scattered missing tiles are fetched as separate rectangles, not one envelope"""
+
+    print("\n🧪 Testing query groups...")
+    print("=" * 50)
+
+    # Two opposite corners of a 10x10 area: one envelope would fetch 100 tiles
+    missing = [(0, 0), (0, 1), (9, 9)]
+    groups = _tile_groups(missing)
+    assert sorted(sorted(group) for group in groups) == [[(0, 0), (0, 1)], [(9, 9)]], groups
+    print(f"✅ {len(missing)} scattered tiles -> {len(groups)} queries")
+
+    square = [(row, col) for row in range(3) for col in range(3)]
+    assert [sorted(group) for group in _tile_groups(square)] == [square]
+    print("✅ A full rectangle is one query")
+
+    big = [(row, col) for row in range(20) for col in range(20)]
+    groups = _tile_groups(big)
+    assert all(len(group) <= OVERPASS_MAX_QUERY_TILES for group in groups)
+    assert sorted(tile for group in groups for tile in group) == sorted(big)
+    print(f"✅ {len(big)} tiles split into {len(groups)} capped queries")
+
+    # Every group is a full rectangle, so its envelope holds only its own tiles
+    for group in _tile_groups([(0, 0), (0, 1), (1, 1), (2, 0), (2, 1)]):
+        min_lat, min_lon, max_lat, max_lon = _tiles_envelope(group)
+        area = round((max_lat - min_lat) / OVERPASS_TILE_DEG) * round((max_lon - min_lon) / OVERPASS_TILE_DEG)
+        assert area == len(group), group
+    print("✅ Envelopes cover only missing tiles")
+
+
+def test_split_tiles_edges():
+    """Nodes go to the tile whose south/west edge they lie on; every tile gets an entry"""
+
+    print("\n🧪 Testing response splitting...")
+    print("=" * 50)
+
+    deg = OVERPASS_TILE_DEG
+    tiles = [(10, 20), (10, 21)]
+    data = {"elements": [
+        _node(1, 10 * deg + deg / 2, 20 * deg + deg / 2),  # inside (10, 20)
+        _node(2, 10 * deg, 21 * deg),                       # shared edge -> (10, 21)
+        _node(3, 11 * deg, 21 * deg + deg / 2),             # north edge -> tile (11, 21), outside
+        {"type": "relation", "id": 4, "tags": {"name": "no coordinates"}},
+    ]}
+    by_tile, entries = _split_tiles(tiles, data)
+
+    names = {tile: [f["properties"]["name"] for f in features] for tile, features in by_tile.items()}
+    assert names == {(10, 20): ["n1"], (10, 21): ["n2"]}, names
+    assert len(entries) == 2 and all(query.count("bbox:") == 1 for query, _ in entries)
+    print(f"✅ {names}")
+
+    by_tile, entries = _split_tiles([(0, 0)], {"elements": []})
+    assert by_tile == {(0, 0): []} and entries[0][1] == {"elements": []}
+    print("✅ Empty tiles are kept so they are cached too")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting Overpass tile tests...\n")
+
+    test_tiles_for_bbox()
+    test_groups_skip_cached_tiles()
+    test_split_tiles_edges()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
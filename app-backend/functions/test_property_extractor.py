@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for the local listing field extractor
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from property_extractor import extract_property_fields
+
+
+def test_address_ignores_leading_numbers():
+    """Room counts, phone numbers and years before the address are not part of it"""
+
+    print("🧪 Testing address extraction...")
+    print("=" * 50)
+
+    cases = {
+        "Beautiful 3 bed home. 2004 Lake Dr, Miami FL 33101": "2004 Lake Dr",
+        "Call 407 555 1234 for 100 Orange Ave": "100 Orange Ave",
+        "Built 2004 at 15 Oak Ln": "15 Oak Ln",
+        "1200 NE 2nd Ave, Miami, FL 33132": "1200 NE 2nd Ave",
+        "Open house Sunday. 12 Palm Ct. Also see 456 Ocean Blvd Apt 5, Miami Beach FL 33139": "456 Ocean Blvd Apt 5",
+    }
+    for text, expected in cases.items():
+        fields = extract_property_fields(text)
+        assert fields.get("address") == expected, f"{text!r}: {fields}"
+        print(f"✅ {expected!r}")
+
+
+def test_zip_needs_context():
+    """A bare 5-digit number is a ZIP only after the address or a ZIP label"""
+
+    print("\n🧪 Testing ZIP extraction...")
+    print("=" * 50)
+
+    assert "zip" not in extract_property_fields("Price drop of 32801 dollars")
+    assert "zip" not in extract_property_fields("123 Main St. Price drop of 32801 dollars")
+    print("✅ Prices are not ZIPs")
+
+    assert extract_property_fields("100 Orange Ave, Orlando 32801")["zip"] == "32801"
+    assert extract_property_fields("Zip: 33139")["zip"] == "33139"
+    assert extract_property_fields("Condo in Tampa, FL 33601")["zip"] == "33601"
+    print("✅ ZIPs after the address, a label or the state are kept")
+
+
+def test_full_listing():
+    """All four fields from a typical listing"""
+
+    print("\n🧪 Testing a full listing...")
+    print("=" * 50)
+
+    fields = extract_property_fields("123 Main St, Tampa FL 33601. 3 beds 2 baths, built 2004")
+    assert fields == {"address": "123 Main St", "city": "Tampa", "zip": "33601", "year_built": 2004}, fields
+    print(f"✅ {fields}")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting property extractor tests...\n")
+
+    test_address_ignores_leading_numbers()
+    test_zip_needs_context()
+    test_full_listing()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
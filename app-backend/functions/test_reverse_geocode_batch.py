@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for batch reverse geocoding (input order, dedupe, combined admin query)
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import osm_api
+
+
+def test_input_order_and_dedupe():
+    """Results come back in input order and each distinct point is resolved once"""
+
+    print("🧪 Testing batch order and dedupe...")
+    print("=" * 50)
+
+    resolved = []
+
+    async def fake_cluster(keys, search_radius_km):
+        resolved.extend(keys)
+        return {key: {"coordinates": {"lat": key[0], "lon": key[1]}} for key in keys}
+
+    # Alternating cells and repeated points, so cells finish out of input order
+    points = [(25.76, -80.19), (28.54, -81.38), (25.76, -80.19), (25.77, -80.20), (28.54, -81.38), (25.7600000001, -80.19)]
+    original = osm_api._reverse_geocode_cluster_async
+    osm_api._reverse_geocode_cluster_async = fake_cluster
+    try:
+        async def collect():
+            return [item async for item in osm_api.iter_reverse_geocode_batch(points)]
+        rows = asyncio.run(collect())
+    finally:
+        osm_api._reverse_geocode_cluster_async = original
+
+    assert [index for index, _ in rows] == list(range(len(points))), rows
+    for (index, result), (lat, lon) in zip(rows, points):
+        assert result["coordinates"] == {"lat": round(lat, 6), "lon": round(lon, 6)}, (index, result)
+    print(f"✅ {len(rows)} rows in input order")
+
+    assert sorted(resolved) == sorted(set(resolved)) and len(resolved) == 3, resolved
+    print(f"✅ {len(points)} points resolved as {len(resolved)} distinct coordinates")
+
+
+def test_admin_batch_parsing():
+    """Relations are attributed to the point whose marker follows them"""
+
+    print("\n🧪 Testing combined admin query...")
+    print("=" * 50)
+
+    points = [(25.76, -80.19), (40.0, -70.0), (28.54, -81.38)]
+    query = osm_api._admin_batch_query(points)
+    assert query.count("is_in(") == 3 and query.count("make batch_point") == 3
+
+    def relation(level, name):
+        return {"type": "relation", "tags": {"admin_level": level, "name": name}}
+
+    data = {"elements": [
+        relation("2", "United States"), relation("4", "Florida"), relation("6", "Miami-Dade County"),
+        {"type": "batch_point", "id": 1, "tags": {"index": "0"}},
+        {"type": "batch_point", "id": 2, "tags": {"index": "1"}},
+        relation("6", "Orange County"), relation("4", "Florida"),
+        {"type": "batch_point", "id": 3, "tags": {"index": "2"}},
+    ]}
+    admins = osm_api._parse_admin_batch(points, data)
+    assert admins[points[0]] == {"country": "United States", "state": "Florida", "county": "Miami-Dade County"}
+    assert admins[points[1]] == {"country": None, "state": None, "county": None}
+    assert admins[points[2]] == {"country": None, "state": "Florida", "county": "Orange County"}
+    print("✅ Each point gets its own relations")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting batch reverse geocoding tests...\n")
+
+    test_input_order_and_dedupe()
+    test_admin_batch_parsing()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for format_insurance_response.
+Checks the formatter against the original multi-pass implementation on
+synthetic agent outputs, then times both from 1 KB up to 1 MB.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add the parent directory (app-backend) to path to import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.response_formatter import format_insurance_response
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+FRAGMENTS = [
+    "Coverage recommendation.",
+    "Risk factors.",
+    "Estimated price range.",
+    "HO-3 policies in Orlando average $2,200 per year, and wind coverage is included.",
+    "Flood insurance is purchased separately through NFIP or private carriers.",
+    "Wind mitigation credits: roof straps, impact windows, and shutters can lower premiums.",
+    "• Roof age under 10 years",
+    "• Opening protection",
+    "Hello there.",
+    "Consider a higher hurricane deductible to save money",
+    "Summary: coastal homes cost more to insure.",
+    "**Next step:**",
+    "|",
+    "\n",
+    "\n\n\n\n\n",
+    ":\n• Impact glass",
+]
+
+
+def legacy_format_insurance_response(response_text: str) -> str:
+    """Original multi-pass formatter, kept as the reference for equivalence checks."""
+    # Clean up the text first
+    clean_text = response_text.strip()
+    
+    # Split into sentences for better processing
+    sentences = clean_text.replace('. ', '.|').split('|')
+    sentences = [s.strip() for s in sentences if s.strip()]
+    
+    formatted_parts = []
+    current_section = []
+    
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+            
+        # Check if this looks like a header/section
+        if (any(keyword in sentence.lower() for keyword in 
+               ['recommendation', 'coverage', 'risk', 'price', 'cost', 'factors', 'benefits']) 
+            and len(sentence) < 80):
+            # If we have accumulated content, add it as a section
+            if current_section:
+                formatted_parts.append(' '.join(current_section))
+                current_section = []
+            # Add the header
+            formatted_parts.append(f"\n**{sentence.rstrip('.')}:**")
+        else:
+            current_section.append(sentence)
+    
+    # Add any remaining content
+    if current_section:
+        formatted_parts.append(' '.join(current_section))
+    
+    # Join everything together
+    result = '\n'.join(formatted_parts)
+    
+    # Add bullet points for lists
+    lines = result.split('\n')
+    formatted_lines = []
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            formatted_lines.append('')
+            continue
+            
+        # Convert items that look like lists to bullet points with better formatting
+        if (line and not line.startswith('**') and not line.startswith('•') and 
+            (',' in line or 'and ' in line) and len(line) > 50):
+            # Try to split on common delimiters
+            if ': ' in line:
+                parts = line.split(': ', 1)
+                if len(parts) == 2:
+                    formatted_lines.append(f"🔹 **{parts[0]}:** {parts[1]}")
+                else:
+                    formatted_lines.append(f"🔹 {line}")
+            else:
+                formatted_lines.append(f"🔹 {line}")
+        elif line.startswith('**') and line.endswith(':**'):
+            # Format section headers with better styling
+            formatted_lines.append(f"📋 {line}")
+        else:
+            formatted_lines.append(line)
+    
+    # Clean up extra spaces and add better spacing
+    final_result = '\n'.join(formatted_lines)
+    
+    # Add more spacing between sections for better readability
+    final_result = final_result.replace('**', '\n**')  # Add line break before headers
+    final_result = final_result.replace(':\n•', ':\n\n•')  # Space between headers and bullets
+    final_result = final_result.replace('\n•', '\n\n•')  # Space between bullet points
+    
+    # Clean up excessive newlines (max 3 for good spacing)
+    while '\n\n\n\n' in final_result:
+        final_result = final_result.replace('\n\n\n\n', '\n\n\n')
+    
+    # Add greeting and closing for better UX
+    if final_result and not final_result.startswith('Hello') and not final_result.startswith('Hi'):
+        final_result = f"🏠 **Insurance Expert Response:**\n\n{final_result}"
+    
+    # Add a helpful closing
+    if not any(word in final_result.lower() for word in ['question', 'help', 'more']):
+        final_result += f"\n\n💡 *Need more specific information? Feel free to ask about coverage details, pricing, or risk factors for your area.*"
+    
+    return final_result.strip()
+
+
+def synthetic_output(size: int, seed: int = 0) -> str:
+    """Build a pseudo agent answer of roughly ``size`` characters."""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        fragment = rng.choice(FRAGMENTS)
+        parts.append(fragment)
+        length += len(fragment) + 1
+    return " ".join(parts)[:size]
+
+
+def check_equivalence(samples: int = 500):
+    """Compare against the original implementation on random inputs."""
+    for seed in range(samples):
+        text = synthetic_output(random.Random(seed).randint(0, 3_000), seed)
+        expected = legacy_format_insurance_response(text)
+        actual = format_insurance_response(text)
+        if expected != actual:
+            print(f"❌ Output mismatch for seed {seed}")
+            print(f"   input:    {text[:200]!r}")
+            print(f"   expected: {expected[:200]!r}")
+            print(f"   actual:   {actual[:200]!r}")
+            return False
+    print(f"✅ Identical output on {samples} random inputs")
+    return True
+
+
+def time_call(func, text: str, repeat: int) -> float:
+    """Best wall-clock time of ``repeat`` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark():
+    """Time both implementations across input sizes."""
+    print(f"\n{'size':>10} {'legacy ms':>12} {'current ms':>12} {'speedup':>9} {'ns/char':>9}")
+    print("-" * 56)
+    for size in SIZES:
+        text = synthetic_output(size)
+        repeat = 20 if size <= 100_000 else 3
+        legacy_ms = time_call(legacy_format_insurance_response, text, repeat)
+        current_ms = time_call(format_insurance_response, text, repeat)
+        ns_per_char = current_ms * 1e6 / size
+        print(f"{size:>10,} {legacy_ms:>12.2f} {current_ms:>12.2f} {legacy_ms / current_ms:>8.1f}x {ns_per_char:>9.1f}")
+
+
+if __name__ == "__main__":
+    if check_equivalence():
+        benchmark()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Open-loop load generator for the chat endpoints.
+
+Sends requests at a fixed rate (whether or not earlier ones have finished)
+and reports latency percentiles, throughput and error rates. Run it against
+an API started with the offline fake model so no quota is used:
+
+    CHAT_MODEL_BACKEND=fake FAKE_LLM_LATENCY_MS=600 FAKE_LLM_FAILURE_RATE=0.02 \\
+        FAKE_LLM_TOOL_CALL_RATE=0.5 uvicorn api:app --port 8000
+    python misc/load_test_chat.py --rps 20 --duration 60
+
+Latency is measured from each request's scheduled send time, so requests
+held back by a saturated client or server count their wait (no coordinated
+omission); service time from the actual send is reported alongside.
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+CITIES = ["Orlando", "Miami", "Tampa", "Jacksonville", "Naples", "Gainesville", "Pensacola", "Sarasota"]
+QUESTIONS = [
+    "How much is home insurance in {city}?",
+    "Do I need flood insurance in {city}?",
+    "What does an HO-3 policy cover in {city}?",
+    "How can I lower my premium in {city}?",
+    "What are the hurricane risks for a house in {city}?",
+]
+
+
+def build_messages(count: int, unique: bool, seed: int) -> list:
+    """Build chat messages; `unique` adds a nonce so the answer cache can't absorb the load."""
+    rng = random.Random(seed)
+    messages = []
+    for i in range(count):
+        message = rng.choice(QUESTIONS).format(city=rng.choice(CITIES))
+        messages.append(f"{message} (ref {i})" if unique else message)
+    return messages
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def send_one(session: requests.Session, url: str, message: str, stream: bool, timeout: float, scheduled: float) -> dict:
+    """
+    Send one chat request and time it (and the first byte, when streaming).
+
+    ``latency`` and ``first_byte`` count from ``scheduled`` (a perf_counter
+    time); ``service`` counts from the moment the request was actually sent.
+    """
+    started = time.perf_counter()
+    first_byte = None
+    try:
+        response = session.post(url, json={"message": message}, timeout=timeout, stream=stream)
+        if stream:
+            for _ in response.iter_content(chunk_size=None):
+                if first_byte is None:
+                    first_byte = time.perf_counter() - scheduled
+        else:
+            response.content
+        status = str(response.status_code)
+    except requests.exceptions.Timeout:
+        status = "timeout"
+    except requests.exceptions.RequestException as e:
+        status = type(e).__name__
+    finished = time.perf_counter()
+    return {"status": status, "latency": finished - scheduled, "service": finished - started, "first_byte": first_byte}
+
+
+def run_load(base_url: str, endpoint: str, rps: float, duration: float, messages: list, timeout: float, max_in_flight: int) -> dict:
+    """
+    Drive the endpoint at a fixed rate and collect per-request results.
+
+    Returns:
+        dict: Summary with percentiles, throughput and status counts
+    """
+    url = base_url.rstrip("/") + endpoint
+    stream = endpoint.endswith("/stream")
+    total = max(1, int(rps * duration))
+    interval = 1.0 / rps
+    results = []
+    lock = threading.Lock()
+    local = threading.local()
+
+    def worker(message, scheduled):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        result = send_one(local.session, url, message, stream, timeout, scheduled)
+        with lock:
+            results.append(result)
+
+    late_starts = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for i in range(total):
+            scheduled = started + i * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -interval:
+                late_starts += 1
+            pool.submit(worker, messages[i % len(messages)], scheduled)
+    elapsed = time.perf_counter() - started
+
+    statuses = Counter(r["status"] for r in results)
+    ok = [r["latency"] for r in results if r["status"] == "200"]
+    service = [r["service"] for r in results if r["status"] == "200"]
+    first_bytes = [r["first_byte"] for r in results if r["status"] == "200" and r["first_byte"] is not None]
+    summary = {
+        "url": url,
+        "target_rps": rps,
+        "duration_s": round(elapsed, 2),
+        "requests": len(results),
+        "throughput_rps": round(len(ok) / elapsed, 2),
+        "error_rate": round(1 - len(ok) / len(results), 4) if results else 0.0,
+        "statuses": dict(statuses),
+        "late_starts": late_starts,
+        "latency_s": {f"p{p}": round(percentile(ok, p), 4) for p in (50, 95, 99)},
+        "service_s": {f"p{p}": round(percentile(service, p), 4) for p in (50, 95, 99)},
+    }
+    if stream:
+        summary["first_byte_s"] = {f"p{p}": round(percentile(first_bytes, p), 4) for p in (50, 95, 99)}
+    return summary
+
+
+def print_summary(summary: dict):
+    print("\n" + "=" * 60)
+    print(f"📊 Load test: {summary['url']}")
+    print("=" * 60)
+    print(f"Target rate:   {summary['target_rps']} rps for {summary['duration_s']}s")
+    print(f"Requests:      {summary['requests']} ({summary['late_starts']} started late)")
+    print(f"Throughput:    {summary['throughput_rps']} successful rps")
+    print(f"Error rate:    {summary['error_rate']:.2%}  {summary['statuses']}")
+    latency = summary["latency_s"]
+    print(f"Latency (s):   p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}")
+    service = summary["service_s"]
+    print(f"Service (s):   p50 {service['p50']}  p95 {service['p95']}  p99 {service['p99']}")
+    if "first_byte_s" in summary:
+        first = summary["first_byte_s"]
+        print(f"First byte (s): p50 {first['p50']}  p95 {first['p95']}  p99 {first['p99']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fixed-rate load test for the chat API")
+    parser.add_argument("--url", default="http://localhost:8000", help="API base URL")
+    parser.add_argument("--endpoint", default="/chat", choices=["/chat", "/chat/stream", "/chat/structured"])
+    parser.add_argument("--rps", type=float, default=10, help="Requests per second")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to send for")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-request timeout in seconds")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="Upper bound on concurrent requests")
+    parser.add_argument("--unique", action="store_true", help="Make every message unique to bypass the answer cache")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the message mix")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    messages = build_messages(max(1, int(args.rps * args.duration)), args.unique, args.seed)
+    summary = run_load(args.url, args.endpoint, args.rps, args.duration, messages, args.timeout, args.max_in_flight)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,15 @@ def check_port_available(port=8000):
     except requests.exceptions.RequestException:
         return True  # Port is available
 
+def ensure_county_polygons(parent_dir):
+    """Build data/florida_counties.geojson on first start (admin lookups fall back to Overpass without it)"""
+    if os.path.exists(os.path.join(parent_dir, "data", "florida_counties.geojson")):
+        return
+    print("🗺️  Building Florida county polygons...")
+    result = subprocess.run([sys.executable, os.path.join(parent_dir, "build_florida_counties.py")])
+    if result.returncode != 0:
+        print("⚠️  Could not build county polygons; admin lookups will use Overpass")
+
 def start_api_server():
     """Start the FastAPI server"""
     
@@ -34,6 +43,7 @@ def start_api_server():
     parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
     print(f"📂 Working directory: {parent_dir}")
+    ensure_county_polygons(parent_dir)
     print("🌐 Starting server on http://localhost:8000")
     print("📖 API docs will be available at http://localhost:8000/docs")
     print("🔧 API schema at http://localhost:8000/openapi.json")
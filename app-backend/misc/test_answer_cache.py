@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for chat answer cache keys (different questions must not collide)
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.answer_cache import intent_cache_key, normalize_intent
+
+
+def test_different_questions_get_different_keys():
+    """Polarity words and extra topics change the key"""
+
+    print("🧪 Testing cache key collisions...")
+    print("=" * 50)
+
+    pairs = [
+        ("Is flood insurance cheap in Miami?", "Is flood insurance expensive in Miami?"),
+        ("flood risk in Miami", "flood and hurricane risk in Miami"),
+        ("Is Orlando safe?", "Is Orlando a risk?"),
+        ("HO-3 cost in Tampa", "HO-6 cost in Tampa"),
+    ]
+    for first, second in pairs:
+        assert intent_cache_key(first) != intent_cache_key(second), f"{first!r} collides with {second!r}"
+        print(f"✅ {first!r} != {second!r}")
+
+
+def test_rephrasings_share_a_key():
+    """Wording that doesn't change the question still shares an entry"""
+
+    print("\n🧪 Testing cache key sharing...")
+    print("=" * 50)
+
+    assert intent_cache_key("How much is insurance in Miami?") == intent_cache_key("what is the price of insurance in miami")
+    assert intent_cache_key("Condo insurance cost in Tampa") == intent_cache_key("HO-6 price Tampa FL")
+    print("✅ Rephrased questions share a key")
+
+    intent = normalize_intent("flood and hurricane risk in Miami")
+    assert intent["topics"] == ["flood", "hurricane", "risk"] and intent["topic"] == "flood"
+    print(f"✅ All topics kept: {intent['topics']}")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting answer cache tests...\n")
+
+    test_different_questions_get_different_keys()
+    test_rephrasings_share_a_key()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
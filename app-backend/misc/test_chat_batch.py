@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for /chat/batch admission control against the offline fake model
+(no server or quota needed)
+"""
+
+import os
+import sys
+
+# Fast fake model; must be set before the app is imported
+os.environ["CHAT_MODEL_BACKEND"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "50")
+os.environ.setdefault("FAKE_LLM_CHUNK_DELAY_MS", "1")
+os.environ.setdefault("FAKE_LLM_FAILURE_RATE", "0")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import api
+from utils.chat_queue import ChatAdmissionQueue
+from utils.metrics import CHAT_REQUESTS
+
+
+def test_batch_goes_through_chat_queue():
+    """Batch agent calls take /chat queue slots; overflow gets the fallback, canned answers skip the queue"""
+
+    print("🧪 Testing batch admission control...")
+    print("=" * 50)
+
+    original = api.chat_queue
+    api.chat_queue = ChatAdmissionQueue(max_concurrency=1, max_queue_depth=1, deadline_s=30)
+    peak = 0
+    acquire = api.chat_queue.acquire
+
+    async def counting_acquire():
+        nonlocal peak
+        deadline = await acquire()
+        peak = max(peak, api.chat_queue.running)
+        return deadline
+
+    api.chat_queue.acquire = counting_acquire
+    rejected_before = CHAT_REQUESTS.value(endpoint="chat_batch", outcome="rejected")
+    messages = [f"How much is HO-3 insurance in Tampa for a {year} house?" for year in range(1990, 1996)] + ["hi"]
+    try:
+        with TestClient(api.app) as client:
+            response = client.post("/chat/batch", json={"messages": messages, "parallelism": 8})
+    finally:
+        api.chat_queue = original
+
+    assert response.status_code == 200, response.text
+    results = response.json()["results"]
+    assert [r["index"] for r in results] == list(range(len(messages)))
+    rejected = CHAT_REQUESTS.value(endpoint="chat_batch", outcome="rejected") - rejected_before
+    assert peak == 1, peak
+    assert rejected > 0, "queue limits were not applied to batch messages"
+    assert all(r["response"] for r in results)
+    print(f"✅ {len(messages)} answers, at most {peak} running, {rejected:g} rejected to the fallback")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting chat batch tests...\n")
+
+    test_batch_goes_through_chat_queue()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the chat router (canned / glossary / light / full routes)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.chat_router import (
+    ROUTE_CANNED,
+    ROUTE_FULL,
+    ROUTE_GLOSSARY,
+    RouteDecision,
+    log_decision,
+    route_message,
+)
+
+
+def test_canned_only_for_closed_phrases():
+    """Greetings and bare thanks are canned; anything with a real question is not"""
+
+    print("🧪 Testing canned routes...")
+    print("=" * 50)
+
+    for message in ["hi", "Hello there!", "thanks", "Thank you so much!", "thx", "ok thanks."]:
+        assert route_message(message).route == ROUTE_CANNED, message
+        print(f"✅ {message!r} -> canned")
+
+    for message in [
+        "thanks but I still need a quote for my house in Tampa",
+        "thank you, what does HO-3 cover?",
+        "hi, how much is insurance in Miami?",
+    ]:
+        assert route_message(message).route != ROUTE_CANNED, message
+        print(f"✅ {message!r} -> not canned")
+
+
+def test_glossary_and_full():
+    """Bare definitions use the glossary; place and price questions go to the full agent"""
+
+    print("\n🧪 Testing glossary and full routes...")
+    print("=" * 50)
+
+    assert route_message("What is replacement cost?").route == ROUTE_GLOSSARY
+    assert route_message("what is an ho-3 policy").route == ROUTE_GLOSSARY
+    print("✅ Definitions answered from the glossary")
+
+    assert route_message("How much is HO-3 insurance in Tampa?").route == ROUTE_FULL
+    print("✅ Priced place question goes to the full agent")
+
+
+def test_log_written_off_thread():
+    """Decisions are appended to the JSONL log by the background writer"""
+
+    print("\n🧪 Testing routing log...")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "routes.jsonl")
+        log_decision("hi", RouteDecision(ROUTE_CANNED, "greeting", answer="Hi!"), log_path=path)
+        deadline = time.time() + 2
+        while not (os.path.exists(path) and os.path.getsize(path)) and time.time() < deadline:
+            time.sleep(0.01)
+        with open(path, encoding="utf-8") as f:
+            record = json.loads(f.readline())
+        assert record["route"] == ROUTE_CANNED and "answer" not in record
+        print(f"✅ Logged: {record['route']} ({record['reason']})")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting chat router tests...\n")
+
+    test_canned_only_for_closed_phrases()
+    test_glossary_and_full()
+    test_log_written_off_thread()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming chat endpoint against the offline fake model
+(no server or quota needed)
+"""
+
+import logging
+import os
+import sys
+
+# Fast, deterministic fake model; must be set before the app is imported
+os.environ["CHAT_MODEL_BACKEND"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "20")
+os.environ.setdefault("FAKE_LLM_CHUNK_DELAY_MS", "1")
+os.environ.setdefault("FAKE_LLM_FAILURE_RATE", "0")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import api
+
+
+class _ContextErrors(logging.Handler):
+    """Collects OpenTelemetry "Failed to detach context" errors"""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.messages = []
+
+    def emit(self, record):
+        message = record.getMessage()
+        if "detach context" in message or "different Context" in message:
+            self.messages.append(message)
+
+
+def test_stream_keeps_tracing_context():
+    """A streamed answer arrives in full and logs no context detach errors"""
+
+    print("🧪 Testing /chat/stream with the fake model...")
+    print("=" * 50)
+
+    handler = _ContextErrors()
+    logging.getLogger().addHandler(handler)
+    try:
+        with TestClient(api.app) as client:
+            for i in range(3):
+                response = client.post("/chat/stream", json={"message": f"How much is HO-3 insurance in Tampa? (stream test {i})"})
+                assert response.status_code == 200, response.text
+                body = response.text
+                assert "event: delta" in body and "event: done" in body, body[:300]
+                assert "event: error" not in body, body[-300:]
+    finally:
+        logging.getLogger().removeHandler(handler)
+
+    assert not handler.messages, f"{len(handler.messages)} context errors, first: {handler.messages[0]}"
+    print("✅ Streamed answers with no context detach errors")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting chat stream tests...\n")
+
+    test_stream_keeps_tracing_context()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
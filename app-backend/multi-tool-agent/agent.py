@@ -1,15 +1,25 @@
+import asyncio
 import os
 import sys
 
 
 from google.adk.agents import Agent
-from google.adk.tools import google_search, FunctionTool
-# from api import *
+from google.adk.tools import google_search
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
 from pydantic import BaseModel, Field
 
-# Add parent directory to path to import utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path to import utils and the local data modules
+APP_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(APP_BACKEND_DIR)
+sys.path.append(os.path.join(APP_BACKEND_DIR, "functions"))
 from utils.load_instruction import load_instruction_from_file
+from utils.prompt_registry import instruction_provider, build_context_cache_provider, context_cache_callback
+from utils.model_backend import chat_model
+from osm_api import reverse_geocode_coordinate_async
+from housing_prices_fetch import get_city_row, housing_market_ready, start_housing_market_warmup
+from parse_median_sale_prices import load_median_prices_by_region
+from florida_data import COUNTY_METRO_AREAS, resolve_county, get_insurance_rates as county_insurance_rates
 
 class HomeInsuranceExpertOutput(BaseModel):
     InsuranceRecommendation: str = Field(..., description="Recommended type of home insurance based on city weather and risk factors.")
@@ -17,42 +27,172 @@ class HomeInsuranceExpertOutput(BaseModel):
     Price: str = Field(..., description="Estimated price range for the recommended insurance.")
 
 
-# def findCityBoundary(city: str) -> CityBoundaryResponse:
-#     boundary = get_city_boundary(city)
-#     return boundary
+# -------------------------------------------------------------------
+# Local data tools (answer from in-process data instead of web search)
+# -------------------------------------------------------------------
+async def find_location(lat: float, lon: float) -> dict:
+    """
+    Find the city, county and state for a coordinate, plus nearby cities.
 
-# def findCity(lat: float, lon: float) -> LocationResponse:
-#     city = reverse_geocode_coordinate(lat, lon)
-#     return city
+    Args:
+        lat: Latitude of the location.
+        lon: Longitude of the location.
 
-# def findNearbyCities(lat: float, lon: float, radius_km: int = 50) -> CitiesListResponse:
-#     cities = list_available_cities(lat, lon, radius_km)
-#     return cities
+    Returns:
+        dict with city, county, state, country and all_cities_nearby.
+    """
+    return await reverse_geocode_coordinate_async(lat, lon)
 
-# findCityBoundary_tool = FunctionTool(
-#     func=findCityBoundary,
-# )
-# findCity_tool = FunctionTool(
-#     func=findCity,
-# )
-# findNearbyCities_tool = FunctionTool(
-#     func=findNearbyCities,
-# )
 
-# Load instruction from file
-instruction_text = load_instruction_from_file("home_insurance_expert.txt")
+def get_insurance_rates(location: str) -> dict:
+    """
+    Estimated annual home insurance premiums per HO form (HO-1 to HO-8) for a Florida city or county.
+
+    Args:
+        location: Florida city or county name, e.g. "Orlando" or "Miami-Dade County".
+
+    Returns:
+        dict with county and annual_premiums_usd per HO form, or an error.
+    """
+    county = resolve_county(location)
+    if county is None:
+        return {"error": f"'{location}' is not a known Florida city or county"}
+    return {
+        "county": county,
+        "annual_premiums_usd": county_insurance_rates(county),
+        "note": "Approximate county averages; actual quotes vary by home and insurer.",
+    }
+
+
+def _plain(value):
+    # numpy/pandas scalars -> plain Python, NaN -> None, timestamps -> ISO strings
+    if hasattr(value, "item"):
+        value = value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+async def get_housing_market(city: str) -> dict:
+    """
+    Latest Redfin housing market metrics for a Florida city (median list price, inventory, trends).
+
+    Args:
+        city: Florida city name, e.g. "Tampa".
+
+    Returns:
+        dict of market metrics, or an error if the city has no data.
+    """
+    # The Redfin file is large; it is loaded off the event loop and the tool
+    # reports "not ready" instead of blocking a chat on the download
+    if not housing_market_ready():
+        start_housing_market_warmup()
+        return {"error": "Housing market data is still loading; try again in a few minutes."}
+    row = await asyncio.to_thread(get_city_row, city)
+    if row is None:
+        return {"error": f"No housing market data for '{city}'"}
+    return {key: _plain(value) for key, value in row.items()}
+
+
+def get_median_sale_prices(location: str) -> dict:
+    """
+    Median home sale prices by property type (all, single family, townhouse, condo) for the metro area of a Florida city or county.
+
+    Args:
+        location: Florida city or county name, e.g. "Orlando".
+
+    Returns:
+        dict with metro region and prices per property type, or an error.
+    """
+    county = resolve_county(location)
+    region = COUNTY_METRO_AREAS.get(county) if county else None
+    if region is None:
+        return {"error": f"No median sale price data for '{location}'"}
+
+    prices = load_median_prices_by_region().get(region)
+    if prices is None:
+        return {"error": f"No median sale price data for region '{region}'"}
+    return {
+        "region": region,
+        "county": county,
+        "property_types": {k: dict(v) for k, v in prices["property_types"].items()},
+    }
+
+
+# Every agent's model goes through chat_model(): Gemini by default, or an
+# offline fake for load tests (CHAT_MODEL_BACKEND=fake, see utils/model_backend.py).
+
+# google_search is a built-in tool and cannot share an agent with function
+# tools, so web search lives in its own agent exposed through AgentTool.
+search_agent = Agent(
+    name="web_search_agent",
+    model=chat_model("gemini-2.0-flash"),
+    description="Searches the web for Florida home insurance information not available in local data.",
+    instruction="Answer the request using Google Search. Be concise and cite sources.",
+    tools=[google_search],
+)
+
+# Load instruction from file (kept in memory, hot-reloaded when the file changes)
+expert_instruction = instruction_provider(lambda: load_instruction_from_file("home_insurance_expert.txt"))
+
+# Optional provider-side context caching of the system prompt (PROMPT_CONTEXT_CACHE=gemini|fake)
+context_cache = build_context_cache_provider()
 
 root_agent = Agent(
     name="home_insurance_expert",
-    model="gemini-2.0-flash",
+    model=chat_model("gemini-2.0-flash"),
     description="You are a home insurance expert.",
-    instruction = instruction_text,
-    tools=[google_search],
+    instruction=expert_instruction,
+    before_model_callback=context_cache_callback(context_cache),
+    tools=[
+        get_insurance_rates,
+        get_median_sale_prices,
+        get_housing_market,
+        find_location,
+        AgentTool(agent=search_agent),
+    ],
+)
+
+# Structured mode: the answer is constrained to HomeInsuranceExpertOutput so the
+# API can return typed JSON without summarizing or re-formatting free text.
+# (ADK agents with an output_schema cannot call tools.)
+structured_agent = Agent(
+    name="home_insurance_expert_structured",
+    model=chat_model("gemini-2.0-flash"),
+    description="You are a home insurance expert that answers in a fixed JSON structure.",
+    instruction=instruction_provider(
+        lambda: load_instruction_from_file("home_insurance_expert.txt"),
+        suffix=(
+            "\n\nOUTPUT FORMAT\n"
+            "Reply only with JSON matching the output schema. "
+            "Keep each field to one or two short sentences."
+        ),
+    ),
+    before_model_callback=context_cache_callback(context_cache),
+    output_schema=HomeInsuranceExpertOutput,
+    output_key="structured_answer",
+)
+
+# Light mode: general questions the chat router judged simple (no place or
+# pricing) go to a smaller model with a short prompt, no tools and a capped answer.
+LIGHT_MODEL = os.getenv("CHAT_LIGHT_MODEL", "gemini-2.0-flash-lite")
+light_agent = Agent(
+    name="home_insurance_expert_light",
+    model=chat_model(LIGHT_MODEL),
+    description="You are a home insurance expert answering general questions.",
+    instruction=(
+        "You are a friendly Florida home insurance expert. Answer general home insurance "
+        "questions in at most five short sentences. If the answer depends on a specific "
+        "city, county or price, say so and ask the user where the home is."
+    ),
+    generate_content_config=types.GenerateContentConfig(temperature=0.3, max_output_tokens=400),
 )
 
 summarization_agent = Agent(
     name="summarization_agent",
-    model="gemini-2.0-flash",
+    model=chat_model("gemini-2.0-flash"),
     description="You are an agent that summarizes text content.",
     instruction="Summarize the given text content concisely.",
 )
\ No newline at end of file
@@ -52,7 +52,8 @@ def test_agent_creation():
     
     try:
         # Import and test the agent
-        from agent import root_agent, instruction_text
+        from agent import root_agent, expert_instruction
+        instruction_text = expert_instruction(None)
         
         print(f"✅ Agent created successfully!")
         print(f"📋 Agent name: {root_agent.name}")
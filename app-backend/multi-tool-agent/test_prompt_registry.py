@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for the prompt registry and context caching (uses the fake provider)
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Add the parent directory to Python path so we can import utils from app-backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.prompt_registry import PromptRegistry, FakeContextCacheProvider, context_cache_callback
+
+
+def test_mtime_reload():
+    """Prompt text is served from memory and reloaded when the file changes"""
+
+    print("🧪 Testing prompt registry reload...")
+    print("=" * 50)
+
+    registry = PromptRegistry()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "prompt.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("You are a home insurance expert.")
+
+        first = registry.get(path)
+        again = registry.get(path)
+        assert first is again, "unchanged file should be served from memory"
+        print(f"✅ Cached entry reused (hash {first.content_hash[:12]})")
+
+        time.sleep(0.01)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("You are a Florida home insurance expert.")
+        os.utime(path, ns=(first.mtime_ns + 1_000_000, first.mtime_ns + 1_000_000))
+
+        reloaded = registry.get(path)
+        assert reloaded.text == "You are a Florida home insurance expert."
+        assert reloaded.content_hash != first.content_hash
+        print(f"✅ Edited file reloaded (hash {reloaded.content_hash[:12]})")
+
+
+def test_fake_context_cache():
+    """The callback swaps the system prompt for one cached context per prompt"""
+
+    print("\n🧪 Testing context caching with the fake provider...")
+    print("=" * 50)
+
+    provider = FakeContextCacheProvider(ttl_s=3600)
+    before_model = context_cache_callback(provider)
+
+    def make_request(prompt):
+        config = SimpleNamespace(system_instruction=prompt, tools=None, cached_content=None)
+        return SimpleNamespace(model="gemini-2.0-flash", config=config)
+
+    names = set()
+    for _ in range(3):
+        request = make_request("You are a home insurance expert.")
+        asyncio.run(before_model(None, request))
+        assert request.config.system_instruction is None
+        names.add(request.config.cached_content)
+
+    assert len(names) == 1 and provider.created == 1 and provider.reused == 2
+    print(f"✅ One cache created and reused: {names.pop()}")
+
+    request = make_request("A different prompt.")
+    asyncio.run(before_model(None, request))
+    assert provider.created == 2
+    print("✅ Changed prompt gets its own cache")
+
+    async def concurrent():
+        requests = [make_request("Yet another prompt.") for _ in range(5)]
+        await asyncio.gather(*(before_model(None, request) for request in requests))
+        return {request.config.cached_content for request in requests}
+
+    names = asyncio.run(concurrent())
+    assert len(names) == 1 and provider.created == 3
+    print("✅ Concurrent requests share one create")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting prompt registry tests...\n")
+
+    test_mtime_reload()
+    test_fake_context_cache()
+
+    print("\n" + "=" * 50)
+    print("🏁 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 import pandas as pd
 import json
 import os
+from functools import lru_cache
 from typing import Dict, List
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Property type file mapping - USE EXCEL FILES
 PROPERTY_FILES = {
     'all': 'med_sale_price.xlsx',
@@ -159,6 +162,23 @@ def organize_by_region(all_results: Dict[str, List[Dict]]) -> Dict[str, Dict]:
     return organized
 
 
+@lru_cache(maxsize=1)
+def load_median_prices_by_region() -> Dict[str, Dict]:
+    """
+    Parse every property type file next to this module once and return
+    the prices organized by region (see organize_by_region).
+    Results are cached so agent tools can query them in-process.
+    """
+    all_results = {}
+    for prop_type, filename in PROPERTY_FILES.items():
+        file_path = os.path.join(BASE_DIR, filename)
+        if os.path.exists(file_path):
+            all_results[prop_type] = parse_median_prices(file_path, prop_type)
+        else:
+            print(f"   ❌ File not found: {file_path}")
+    return organize_by_region(all_results)
+
+
 def print_results_by_property_type(all_results: Dict[str, List[Dict]]):
     """Pretty print results organized by property type"""
     print("\n" + "="*80)
@@ -0,0 +1,156 @@
+import asyncio
+import os
+import time
+import uuid
+from typing import AsyncIterator, Dict, Optional
+
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from utils.metrics import CHAT_STAGE_SECONDS, CHAT_TOKENS, CHAT_TOOL_CALLS
+
+# Number of agent sessions allowed to run at the same time (env-driven)
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", "8"))
+APP_NAME = "home_insurance_app"
+
+
+class AgentRunnerPool:
+    """
+    Long-lived pool of in-process ADK runners.
+
+    Agents are loaded once and driven through ``Runner.run_async`` instead of
+    spawning an ``adk run`` subprocess per message. Each call gets its own
+    short-lived session, and a semaphore caps how many sessions run at once.
+    """
+
+    def __init__(self, agents: Dict[str, object], max_sessions: int = AGENT_POOL_SIZE, app_name: str = APP_NAME):
+        """
+        Args:
+            agents (dict): Mapping of pool key -> ADK agent (e.g. {"insurance": root_agent})
+            max_sessions (int): Maximum number of concurrent agent sessions
+            app_name (str): ADK application name used for sessions
+        """
+        self.app_name = app_name
+        self.max_sessions = max(1, max_sessions)
+        self.session_service = InMemorySessionService()
+        self.runners = {
+            name: Runner(agent=agent, app_name=app_name, session_service=self.session_service)
+            for name, agent in agents.items()
+        }
+        self._slots = asyncio.Semaphore(self.max_sessions)
+
+    def _get_runner(self, agent_name: str) -> Runner:
+        runner = self.runners.get(agent_name)
+        if runner is None:
+            raise KeyError(f"Unknown agent '{agent_name}'. Available: {sorted(self.runners)}")
+        return runner
+
+    async def run(self, agent_name: str, message: str, user_id: str = "api_user") -> str:
+        """
+        Run one message through an agent and return its final text response.
+
+        Args:
+            agent_name (str): Pool key of the agent to run
+            message (str): User message
+            user_id (str): ADK user id for the temporary session
+
+        Returns:
+            str: Concatenated text of the agent's final response ('' if none)
+        """
+        runner = self._get_runner(agent_name)
+
+        async with self._slots:
+            session_id = uuid.uuid4().hex
+            await self.session_service.create_session(
+                app_name=self.app_name, user_id=user_id, session_id=session_id
+            )
+            try:
+                content = types.Content(role="user", parts=[types.Part(text=message)])
+                response_parts = []
+                tool_starts = {}
+                async for event in runner.run_async(
+                    user_id=user_id, session_id=session_id, new_message=content
+                ):
+                    _record_event(agent_name, event, tool_starts)
+                    if event.is_final_response():
+                        response_parts.append(_event_text(event))
+                return "".join(response_parts).strip()
+            finally:
+                await self.session_service.delete_session(
+                    app_name=self.app_name, user_id=user_id, session_id=session_id
+                )
+
+    async def stream(self, agent_name: str, message: str, user_id: str = "api_user") -> AsyncIterator[str]:
+        """
+        Run one message through an agent and yield text chunks as they arrive.
+
+        Partial (SSE) events are forwarded immediately. The aggregated event
+        that closes each model turn is only yielded when that turn produced
+        no partial chunks, so text is never sent twice.
+
+        Args:
+            agent_name (str): Pool key of the agent to run
+            message (str): User message
+            user_id (str): ADK user id for the temporary session
+
+        Yields:
+            str: Text chunks of the agent's answer
+        """
+        runner = self._get_runner(agent_name)
+
+        async with self._slots:
+            session_id = uuid.uuid4().hex
+            await self.session_service.create_session(
+                app_name=self.app_name, user_id=user_id, session_id=session_id
+            )
+            try:
+                content = types.Content(role="user", parts=[types.Part(text=message)])
+                run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+                streamed_in_turn = False
+                tool_starts = {}
+                async for event in runner.run_async(
+                    user_id=user_id, session_id=session_id, new_message=content, run_config=run_config
+                ):
+                    _record_event(agent_name, event, tool_starts)
+                    text = _event_text(event)
+                    if getattr(event, "partial", False):
+                        if text:
+                            streamed_in_turn = True
+                            yield text
+                        continue
+
+                    if event.is_final_response() and text and not streamed_in_turn:
+                        yield text
+                    streamed_in_turn = False
+            finally:
+                await self.session_service.delete_session(
+                    app_name=self.app_name, user_id=user_id, session_id=session_id
+                )
+
+
+def _event_text(event) -> str:
+    """Return the text parts of an ADK event joined together."""
+    content: Optional[types.Content] = getattr(event, "content", None)
+    if not content or not content.parts:
+        return ""
+    return "".join(part.text for part in content.parts if getattr(part, "text", None))
+
+
+def _record_event(agent_name: str, event, tool_starts: dict):
+    """Record token usage, tool calls and tool latency carried by an ADK event."""
+    # Partial (streamed) chunks are followed by an aggregated event; count usage once
+    usage = getattr(event, "usage_metadata", None)
+    if usage is not None and not getattr(event, "partial", False):
+        CHAT_TOKENS.inc(usage.prompt_token_count or 0, agent=agent_name, direction="input")
+        CHAT_TOKENS.inc(usage.candidates_token_count or 0, agent=agent_name, direction="output")
+
+    now = time.perf_counter()
+    for call in event.get_function_calls():
+        CHAT_TOOL_CALLS.inc(tool=call.name)
+        tool_starts[call.id] = now
+    for response in event.get_function_responses():
+        started = tool_starts.pop(response.id, None)
+        if started is not None:
+            CHAT_STAGE_SECONDS.observe(now - started, stage="tool")
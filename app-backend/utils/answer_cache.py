@@ -0,0 +1,226 @@
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Add functions directory to path to import the Florida gazetteer
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "functions"))
+from florida_data import COUNTY_CITIES, city_county_index
+
+# Cache knobs (env-driven). CHAT_CACHE_DB enables the SQLite backing store.
+CHAT_CACHE_MAX_ENTRIES = int(os.getenv("CHAT_CACHE_MAX_ENTRIES", "1024"))
+CHAT_CACHE_TTL_S = float(os.getenv("CHAT_CACHE_TTL_S", str(6 * 3600)))
+CHAT_CACHE_DB = os.getenv("CHAT_CACHE_DB")
+
+# Topic -> phrases that signal it. Every matched topic goes into the cache
+# key; order only decides the primary ``topic``.
+TOPIC_KEYWORDS = {
+    "price": ["how much", "price", "prices", "cost", "costs", "premium", "premiums", "quote", "rate", "rates", "afford", "cheap", "expensive"],
+    "flood": ["flood", "flooding", "storm surge", "surge"],
+    "hurricane": ["hurricane", "hurricanes", "wind", "windstorm", "tropical"],
+    "savings": ["discount", "discounts", "save", "saving", "savings", "mitigation", "credit", "credits", "lower"],
+    "risk": ["risk", "risks", "climate", "weather", "danger", "safe", "sinkhole"],
+    "coverage": ["coverage", "cover", "covers", "covered", "policy", "deductible", "form"],
+    "alternatives": ["alternative", "alternatives", "instead", "nearby", "other cities", "compare"],
+}
+
+# Plain-language names for HO forms
+HO_FORM_SYNONYMS = {
+    "renters": "HO-4",
+    "renter": "HO-4",
+    "condo": "HO-6",
+    "condominium": "HO-6",
+    "mobile home": "HO-7",
+    "manufactured home": "HO-7",
+    "older home": "HO-8",
+}
+
+STOPWORDS = {
+    "a", "an", "the", "in", "on", "at", "for", "of", "to", "is", "are", "was", "be", "my", "me", "i",
+    "what", "whats", "which", "and", "or", "with", "about", "do", "does", "can", "you", "your", "it",
+    "this", "that", "there", "much", "how", "fl", "florida", "please", "tell", "give", "get", "insurance",
+    "home", "house", "homeowners", "city", "county", "area", "near",
+}
+
+# Topic words that change the answer within a topic ("cheap" vs "expensive",
+# "safe" vs "risk"); they stay in the fingerprint instead of being stripped
+POLARITY_WORDS = {
+    "cheap", "expensive", "lower", "safe", "danger", "compare", "instead",
+}
+
+_HO_FORM_RE = re.compile(r"\bho[\s-]?([1-8])\b")
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def _phrase_pattern(phrases) -> re.Pattern:
+    # Longest phrases first so "miami beach" wins over "miami"
+    ordered = sorted(phrases, key=len, reverse=True)
+    return re.compile(r"\b(" + "|".join(re.escape(p) for p in ordered) + r")\b")
+
+
+_CITY_RE = _phrase_pattern(city_county_index().keys())
+_COUNTY_RE = re.compile(
+    r"\b(" + "|".join(re.escape(c.lower()) for c in sorted(COUNTY_CITIES, key=len, reverse=True)) + r")\s+county\b"
+)
+_TOPIC_RES = {topic: _phrase_pattern(words) for topic, words in TOPIC_KEYWORDS.items()}
+_HO_SYNONYM_RE = _phrase_pattern(HO_FORM_SYNONYMS)
+
+
+def _remove_phrase(text: str, phrase: str) -> str:
+    return re.sub(r"\b" + re.escape(phrase) + r"\b", " ", text)
+
+
+def normalize_intent(message: str) -> Dict[str, Optional[str]]:
+    """
+    Reduce a chat message to its Florida place, HO form, topics and a
+    fingerprint of the remaining words (polarity and comparison words
+    such as "cheap"/"expensive" or "safe" are kept in the fingerprint).
+
+    Args:
+        message (str): Raw user message
+
+    Returns:
+        dict: Keys city, county, ho_form, topic (primary), topics (all, sorted), fingerprint
+    """
+    text = message.lower().replace("’", "'")
+    text = re.sub(r"\s+", " ", text).strip()
+
+    county = None
+    city = None
+    county_match = _COUNTY_RE.search(text)
+    if county_match:
+        county = next(c for c in COUNTY_CITIES if c.lower() == county_match.group(1))
+        text = _remove_phrase(text, county_match.group(0))
+
+    city_match = _CITY_RE.search(text)
+    if city_match:
+        city = city_match.group(1)
+        county = county or city_county_index()[city]
+        text = _remove_phrase(text, city)
+
+    ho_form = None
+    form_match = _HO_FORM_RE.search(text)
+    if form_match:
+        ho_form = f"HO-{form_match.group(1)}"
+        text = _HO_FORM_RE.sub(" ", text)
+    else:
+        synonym_match = _HO_SYNONYM_RE.search(text)
+        if synonym_match:
+            ho_form = HO_FORM_SYNONYMS[synonym_match.group(1)]
+            text = _remove_phrase(text, synonym_match.group(1))
+
+    topics = []
+    for name, pattern in _TOPIC_RES.items():
+        if pattern.search(text):
+            topics.append(name)
+            text = pattern.sub(lambda m: m.group(0) if m.group(0) in POLARITY_WORDS else " ", text)
+
+    residual = sorted({t for t in _TOKEN_RE.findall(text) if t not in STOPWORDS})
+    fingerprint = hashlib.sha1(" ".join(residual).encode("utf-8")).hexdigest()[:12]
+
+    return {
+        "city": city,
+        "county": county,
+        "ho_form": ho_form,
+        "topic": topics[0] if topics else None,
+        "topics": sorted(topics),
+        "fingerprint": fingerprint,
+    }
+
+
+def intent_cache_key(message: str) -> str:
+    """Build the cache key for a chat message from its normalized intent."""
+    intent = normalize_intent(message)
+    topics = "+".join(intent["topics"]) or "-"
+    return "|".join([intent["county"] or "-", intent["city"] or "-", intent["ho_form"] or "-", topics, intent["fingerprint"]])
+
+
+class AnswerCache:
+    """
+    In-memory LRU cache with TTL for chat answers, optionally backed by a
+    local SQLite file so answers survive restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CHAT_CACHE_MAX_ENTRIES,
+        ttl_s: float = CHAT_CACHE_TTL_S,
+        db_path: Optional[str] = CHAT_CACHE_DB,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._db = None
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS answers (key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("DELETE FROM answers WHERE expires_at < ?", (time.time(),))
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a fresh cached answer for ``key`` or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                response, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, expires_at FROM answers WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+                if row:
+                    self._store_in_memory(key, row[0], row[1])
+                    self.hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str):
+        """Store an answer for ``key`` with the configured TTL."""
+        expires_at = time.time() + self.ttl_s
+        with self._lock:
+            self._store_in_memory(key, response, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO answers (key, response, expires_at) VALUES (?, ?, ?)",
+                    (key, response, expires_at),
+                )
+                self._db.commit()
+
+    def _store_in_memory(self, key: str, response: str, expires_at: float):
+        self._entries[key] = (response, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the hit ratio."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_s": self.ttl_s,
+            "persistent": self._db is not None,
+        }
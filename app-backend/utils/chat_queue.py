@@ -0,0 +1,122 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, TypeVar
+
+from utils.metrics import CHAT_STAGE_SECONDS
+
+# Admission control knobs (env-driven)
+CHAT_MAX_CONCURRENCY = int(os.getenv("CHAT_MAX_CONCURRENCY", "8"))
+CHAT_MAX_QUEUE_DEPTH = int(os.getenv("CHAT_MAX_QUEUE_DEPTH", "32"))
+CHAT_DEADLINE_S = float(os.getenv("CHAT_DEADLINE_S", "45"))
+
+T = TypeVar("T")
+
+
+class ChatQueueFull(Exception):
+    """Raised when a request arrives while the wait queue is already full."""
+
+
+class ChatDeadlineExceeded(Exception):
+    """Raised when a request cannot finish within its deadline."""
+
+
+class ChatAdmissionQueue:
+    """
+    Bounded work queue for chat requests.
+
+    At most ``max_concurrency`` requests run at once and at most
+    ``max_queue_depth`` wait for a slot. Anything beyond that is rejected
+    immediately instead of piling up, and every admitted request is bounded
+    by a deadline that also counts the time spent waiting.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = CHAT_MAX_CONCURRENCY,
+        max_queue_depth: int = CHAT_MAX_QUEUE_DEPTH,
+        deadline_s: float = CHAT_DEADLINE_S,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue_depth = max(0, max_queue_depth)
+        self.deadline_s = deadline_s
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._running = 0
+        self._waiting = 0
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot. Callers must call ``release()`` when done.
+
+        Raises:
+            ChatQueueFull: No slot is free and the wait queue is full
+            ChatDeadlineExceeded: No slot freed up before the deadline
+
+        Returns:
+            float: Monotonic deadline of this request
+        """
+        deadline = time.monotonic() + self.deadline_s
+
+        if self._running + self._waiting >= self.max_concurrency + self.max_queue_depth:
+            raise ChatQueueFull(
+                f"Chat queue is full ({self._waiting} waiting, {self._running} running)"
+            )
+
+        self._waiting += 1
+        try:
+            with CHAT_STAGE_SECONDS.time(stage="queue_wait"):
+                await asyncio.wait_for(self._slots.acquire(), timeout=self.deadline_s)
+        except asyncio.TimeoutError:
+            raise ChatDeadlineExceeded(f"No chat slot freed up within {self.deadline_s:g}s")
+        finally:
+            self._waiting -= 1
+
+        self._running += 1
+        return deadline
+
+    def release(self):
+        """Give back a slot obtained with ``acquire()``."""
+        self._running -= 1
+        self._slots.release()
+
+    @asynccontextmanager
+    async def admit(self):
+        """
+        Hold a slot for the body of the ``async with``.
+
+        Yields:
+            float: Monotonic deadline of this request
+        """
+        deadline = await self.acquire()
+        try:
+            yield deadline
+        finally:
+            self.release()
+
+    async def run(self, work: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``work()`` once admitted, bounded by the remaining deadline.
+
+        Args:
+            work (callable): Zero-argument coroutine factory for the request
+
+        Returns:
+            The result of ``work()``
+        """
+        async with self.admit() as deadline:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ChatDeadlineExceeded("Chat deadline expired while queued")
+            try:
+                return await asyncio.wait_for(work(), timeout=remaining)
+            except asyncio.TimeoutError:
+                raise ChatDeadlineExceeded(f"Chat request exceeded {self.deadline_s:g}s deadline")
@@ -0,0 +1,208 @@
+import json
+import math
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+from utils.answer_cache import normalize_intent
+from utils.metrics import CHAT_ROUTES
+
+# Routing knobs (env-driven). CHAT_ROUTER_LOG appends one JSON line per decision.
+CHAT_ROUTER_ENABLED = os.getenv("CHAT_ROUTER_ENABLED", "1") not in ("0", "false", "no")
+CHAT_ROUTER_THRESHOLD = float(os.getenv("CHAT_ROUTER_THRESHOLD", "0.5"))
+CHAT_ROUTER_LOG = os.getenv("CHAT_ROUTER_LOG")
+
+# Routes, cheapest first
+ROUTE_CANNED = "canned"      # greeting / thanks, answered locally
+ROUTE_GLOSSARY = "glossary"  # definition of a known term, answered locally
+ROUTE_LIGHT = "light"        # general question, small model config without tools
+ROUTE_FULL = "full"          # location / pricing question, full tool-using agent
+
+GREETING_ANSWER = (
+    "Hi! I'm your Florida home insurance expert. Ask me about coverage, HO policy forms, "
+    "or what insurance costs in a specific city or county."
+)
+THANKS_ANSWER = "You're welcome! Let me know if you have any other home insurance questions."
+
+GLOSSARY = {
+    "ho-1": "HO-1 is a basic named-perils policy that covers the home against a short list of events such as fire, lightning and theft. It is rarely sold today.",
+    "ho-2": "HO-2 is a broad-form policy: the home and belongings are covered against a longer list of named perils.",
+    "ho-3": "HO-3 is the most common homeowners policy. The dwelling is covered against all perils except those excluded (such as flood), and belongings against named perils.",
+    "ho-4": "HO-4 is renters insurance. It covers your belongings and personal liability, but not the building itself.",
+    "ho-5": "HO-5 is a comprehensive policy that covers both the dwelling and belongings against all perils except those excluded.",
+    "ho-6": "HO-6 is condo insurance. It covers the interior of your unit, your belongings and liability; the building is covered by the association's policy.",
+    "ho-7": "HO-7 covers mobile and manufactured homes, with protection similar to an HO-3.",
+    "ho-8": "HO-8 is for older homes whose replacement cost exceeds their market value; repairs are paid at actual cash value or with standard materials.",
+    "deductible": "A deductible is the amount you pay out of pocket on a claim before insurance pays. In Florida, policies usually also have a separate hurricane deductible of 2% to 5% of the dwelling coverage.",
+    "hurricane deductible": "A hurricane deductible applies to damage from a named storm. In Florida it is usually 2%, 5% or 10% of the dwelling coverage rather than a flat dollar amount.",
+    "premium": "The premium is what you pay for the policy, usually billed annually or monthly.",
+    "flood insurance": "Flood insurance covers damage from rising water, which standard homeowners policies exclude. It is sold through the NFIP or private insurers.",
+    "nfip": "The NFIP (National Flood Insurance Program) is the federal program that sells flood insurance through participating insurers.",
+    "replacement cost": "Replacement cost coverage pays to repair or replace damaged property with new items of similar kind and quality, without deducting for depreciation.",
+    "actual cash value": "Actual cash value pays the replacement cost minus depreciation, so older items are reimbursed for less.",
+    "liability coverage": "Liability coverage pays if someone is injured on your property or you accidentally damage someone else's property.",
+    "wind mitigation": "A wind mitigation inspection documents features such as roof straps, impact windows and shutters. In Florida it can earn significant premium discounts.",
+    "citizens": "Citizens Property Insurance is Florida's state-backed insurer of last resort for homeowners who can't find coverage in the private market.",
+}
+
+GLOSSARY_ALIASES = {
+    "renters insurance": "ho-4",
+    "condo insurance": "ho-6",
+    "mobile home insurance": "ho-7",
+    "acv": "actual cash value",
+    "liability": "liability coverage",
+    "flood coverage": "flood insurance",
+    "citizens insurance": "citizens",
+    "citizens property insurance": "citizens",
+}
+
+# Small lexical model: log-odds weights for "needs the full tool-using agent".
+# Hand-set starting weights (retune from CHAT_ROUTER_LOG); positive pushes toward ROUTE_FULL.
+LEXICAL_WEIGHTS = {
+    "bias": -1.2,
+    "has_place": 2.4,
+    "topic_price": 1.6,
+    "topic_alternatives": 1.4,
+    "topic_risk": 0.6,
+    "topic_flood": 0.4,
+    "topic_hurricane": 0.4,
+    "mentions_numbers": 0.5,
+    "mentions_market": 1.2,
+    "mentions_search": 1.5,
+    "long_message": 0.6,
+}
+
+_GREETING_RE = re.compile(r"^(hi|hello|hey|howdy|good (morning|afternoon|evening)|greetings)\b[\s!.,]*(there)?[\s!.,]*$")
+_THANKS_RE = re.compile(r"^(great,? |ok,? |okay,? )?(thanks|thank you|thx|ty)( so much| a lot| again)?[!. ]*$")
+_DEFINITION_RE = re.compile(
+    r"^(what(?:'s| is| are| does)?|define|explain|meaning of|whats)\s+(?:an?\s+|the\s+)?(.+?)(?:\s+mean)?\s*\??$"
+)
+_MARKET_RE = re.compile(r"\b(housing|market|home prices?|median|sale price|inventory|listing)\b")
+_SEARCH_RE = re.compile(r"\b(latest|news|current|today|this year|recent|company|companies|insurers?)\b")
+_NUMBER_RE = re.compile(r"\d")
+_HO_FORM_RE = re.compile(r"\bho[\s-]?[1-8]\b")
+
+
+@dataclass
+class RouteDecision:
+    route: str
+    reason: str
+    score: float = 0.0
+    answer: Optional[str] = None
+    features: Dict[str, float] = field(default_factory=dict)
+
+
+def _glossary_term(text: str) -> Optional[str]:
+    match = _DEFINITION_RE.match(text)
+    if not match:
+        return None
+    term = re.sub(r"\s+(policy|insurance policy|form|coverage)$", "", match.group(2).strip(" ?.!"))
+    term = re.sub(r"^ho\s?(\d)$", r"ho-\1", term)
+    term = GLOSSARY_ALIASES.get(term, term)
+    return term if term in GLOSSARY else None
+
+
+def lexical_features(text: str, intent: Dict[str, Optional[str]]) -> Dict[str, float]:
+    """Binary features of a lowercased message for the lexical model."""
+    features = {
+        "bias": 1.0,
+        "has_place": float(bool(intent["city"] or intent["county"])),
+        "mentions_numbers": float(bool(_NUMBER_RE.search(_HO_FORM_RE.sub(" ", text)))),
+        "mentions_market": float(bool(_MARKET_RE.search(text))),
+        "mentions_search": float(bool(_SEARCH_RE.search(text))),
+        "long_message": float(len(text.split()) > 25),
+    }
+    if intent["topic"]:
+        features[f"topic_{intent['topic']}"] = 1.0
+    return features
+
+
+def full_agent_probability(features: Dict[str, float]) -> float:
+    """Logistic score of the lexical model: probability that the full agent is needed."""
+    logit = sum(LEXICAL_WEIGHTS.get(name, 0.0) * value for name, value in features.items())
+    return 1 / (1 + math.exp(-logit))
+
+
+def route_message(message: str, threshold: float = CHAT_ROUTER_THRESHOLD) -> RouteDecision:
+    """
+    Decide how a chat message should be answered.
+
+    Rules handle greetings, thanks and glossary questions locally; anything
+    else is scored by the lexical model, and only messages scoring at or
+    above ``threshold`` go to the full tool-using agent.
+
+    Args:
+        message (str): Raw user message
+        threshold (float): Minimum score for the full agent
+
+    Returns:
+        RouteDecision: Route, reason, score and (for local routes) the answer
+    """
+    text = re.sub(r"\s+", " ", message.lower().replace("’", "'")).strip()
+
+    if not CHAT_ROUTER_ENABLED:
+        decision = RouteDecision(ROUTE_FULL, "router_disabled", 1.0)
+    elif _GREETING_RE.match(text):
+        decision = RouteDecision(ROUTE_CANNED, "greeting", 0.0, GREETING_ANSWER)
+    elif _THANKS_RE.match(text):
+        decision = RouteDecision(ROUTE_CANNED, "thanks", 0.0, THANKS_ANSWER)
+    else:
+        intent = normalize_intent(message)
+        term = _glossary_term(text)
+        # The term must be the whole question, so "what is ho-3 cost" is not a glossary hit
+        if term and not (intent["city"] or intent["county"]):
+            decision = RouteDecision(ROUTE_GLOSSARY, f"glossary:{term}", 0.0, GLOSSARY[term])
+        else:
+            features = lexical_features(text, intent)
+            score = full_agent_probability(features)
+            route = ROUTE_FULL if score >= threshold else ROUTE_LIGHT
+            decision = RouteDecision(route, "lexical_model", round(score, 4), features=features)
+
+    CHAT_ROUTES.inc(route=decision.route)
+    log_decision(message, decision)
+    return decision
+
+
+# Routing log lines are appended by a background thread so route_message
+# never does file I/O on the event loop
+_log_queue = queue.SimpleQueue()
+_log_writer: Optional[threading.Thread] = None
+_log_writer_lock = threading.Lock()
+
+
+def _write_log_lines():
+    while True:
+        batch = [_log_queue.get()]
+        while True:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        lines_by_path = {}
+        for log_path, line in batch:
+            lines_by_path.setdefault(log_path, []).append(line)
+        for log_path, lines in lines_by_path.items():
+            try:
+                with open(log_path, "a", encoding="utf-8") as log_file:
+                    log_file.writelines(lines)
+            except OSError as e:
+                print(f"Could not write routing log: {e!r}")
+
+
+def log_decision(message: str, decision: RouteDecision, log_path: Optional[str] = CHAT_ROUTER_LOG):
+    """Print a routing decision and queue it for the JSONL routing log, if configured."""
+    global _log_writer
+    print(f"Chat route: {decision.route} ({decision.reason}, score {decision.score})")
+    if not log_path:
+        return
+    record = {"ts": round(time.time(), 3), "message": message, **asdict(decision)}
+    record.pop("answer")
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = threading.Thread(target=_write_log_lines, name="chat-router-log", daemon=True)
+            _log_writer.start()
+    _log_queue.put((log_path, json.dumps(record) + "\n"))
@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+import math
+from typing import List, Sequence, Tuple
+
+# Accepted column names, first match wins
+LAT_COLUMNS = ("lat", "latitude", "y")
+LON_COLUMNS = ("lon", "lng", "long", "longitude", "x")
+
+ARROW_CONTENT_TYPES = (
+    "application/vnd.apache.arrow.stream",
+    "application/vnd.apache.arrow.file",
+    "application/x-apache-arrow",
+)
+
+
+def _column(names: Sequence[str], candidates: Sequence[str]) -> str:
+    lowered = {str(name).strip().lower(): name for name in names}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    raise ValueError(f"Missing coordinate column; expected one of {', '.join(candidates)}")
+
+
+def _validated(lats: Sequence, lons: Sequence) -> List[Tuple[float, float]]:
+    if len(lats) != len(lons):
+        raise ValueError(f"lat and lon have different lengths ({len(lats)} vs {len(lons)})")
+    points = []
+    for index, (lat, lon) in enumerate(zip(lats, lons)):
+        try:
+            lat, lon = float(lat), float(lon)
+        except (TypeError, ValueError):
+            raise ValueError(f"Row {index}: coordinates must be numbers")
+        if not (math.isfinite(lat) and math.isfinite(lon) and -90 <= lat <= 90 and -180 <= lon <= 180):
+            raise ValueError(f"Row {index}: coordinates out of range ({lat}, {lon})")
+        points.append((lat, lon))
+    return points
+
+
+def _from_json(body: bytes) -> List[Tuple[float, float]]:
+    payload = json.loads(body)
+    # {"lat": [...], "lon": [...]} (columnar) or {"points": [{"lat": .., "lon": ..}, ...]} / a bare list of points
+    if isinstance(payload, dict) and "points" not in payload:
+        return _validated(payload[_column(payload, LAT_COLUMNS)], payload[_column(payload, LON_COLUMNS)])
+    points = payload["points"] if isinstance(payload, dict) else payload
+    if not isinstance(points, list):
+        raise ValueError("points must be a list")
+    lats, lons = [], []
+    for index, point in enumerate(points):
+        if isinstance(point, dict):
+            lats.append(point.get(_column(point, LAT_COLUMNS)))
+            lons.append(point.get(_column(point, LON_COLUMNS)))
+        elif isinstance(point, (list, tuple)) and len(point) == 2:
+            lats.append(point[0])
+            lons.append(point[1])
+        else:
+            raise ValueError(f"Row {index}: expected {{\"lat\", \"lon\"}} or [lat, lon]")
+    return _validated(lats, lons)
+
+
+def _from_csv(body: bytes) -> List[Tuple[float, float]]:
+    reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+    if not reader.fieldnames:
+        raise ValueError("CSV has no header row")
+    lat_column = _column(reader.fieldnames, LAT_COLUMNS)
+    lon_column = _column(reader.fieldnames, LON_COLUMNS)
+    lats, lons = [], []
+    for row in reader:
+        lats.append(row[lat_column])
+        lons.append(row[lon_column])
+    return _validated(lats, lons)
+
+
+def _from_arrow(body: bytes) -> List[Tuple[float, float]]:
+    import pyarrow as pa
+
+    reader = pa.ipc.open_file(body) if body[:6] == b"ARROW1" else pa.ipc.open_stream(body)
+    table = reader.read_all()
+    lat_column = _column(table.column_names, LAT_COLUMNS)
+    lon_column = _column(table.column_names, LON_COLUMNS)
+    return _validated(table.column(lat_column).to_pylist(), table.column(lon_column).to_pylist())
+
+
+def parse_coordinate_batch(body: bytes, content_type: str) -> List[Tuple[float, float]]:
+    """
+    Parse a batch of coordinates from a JSON, CSV or Arrow IPC request body.
+
+    Args:
+        body (bytes): Raw request body
+        content_type (str): Request Content-Type header
+
+    Returns:
+        list: (lat, lon) tuples in input order
+
+    Raises:
+        ValueError: Malformed body, missing columns or out-of-range coordinates
+        LookupError: Unsupported content type
+    """
+    media_type = (content_type or "application/json").split(";")[0].strip().lower()
+    try:
+        if media_type in ARROW_CONTENT_TYPES:
+            return _from_arrow(body)
+        if media_type in ("text/csv", "application/csv"):
+            return _from_csv(body)
+        if media_type == "application/json":
+            return _from_json(body)
+    except (KeyError, TypeError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Malformed request body: {e}")
+    raise LookupError(f"Unsupported content type {media_type!r}; use JSON, CSV or Arrow")
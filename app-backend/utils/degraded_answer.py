@@ -0,0 +1,75 @@
+import os
+import sys
+
+# Add the app-backend and functions directories to path for the local data modules
+APP_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(APP_BACKEND_DIR)
+sys.path.append(os.path.join(APP_BACKEND_DIR, "functions"))
+
+from florida_data import COUNTY_METRO_AREAS, get_insurance_rates
+from parse_median_sale_prices import load_median_prices_by_region
+from utils.answer_cache import normalize_intent
+
+DEGRADED_NOTICE = (
+    "Our insurance expert is temporarily unavailable, so this answer is based on local data only."
+)
+DEFAULT_FORMS = ("HO-3", "HO-5", "HO-6", "HO-4")
+
+
+def warm_degraded_data():
+    """Load the median sale price files so degraded answers never wait on Excel parsing."""
+    try:
+        load_median_prices_by_region()
+    except Exception as e:
+        print(f"Could not preload median sale prices: {e!r}")
+
+
+def _median_prices(county: str):
+    region = COUNTY_METRO_AREAS.get(county)
+    # Only use prices that are already in memory; parsing the files takes seconds
+    if region is None or load_median_prices_by_region.cache_info().currsize == 0:
+        return None, None
+    prices = load_median_prices_by_region().get(region)
+    return region, prices["property_types"] if prices else None
+
+
+def degraded_answer(message: str) -> str:
+    """
+    Build a data-only answer for a chat message without calling a model.
+
+    Uses the city/county and HO form found in the message to quote the
+    county's estimated premiums and, when loaded, the metro area's median
+    sale prices.
+
+    Args:
+        message (str): Raw user message
+
+    Returns:
+        str: Answer text ready to return from the chat endpoints
+    """
+    intent = normalize_intent(message)
+    county = intent["county"]
+    if county is None:
+        return (
+            f"{DEGRADED_NOTICE} Tell me which Florida city or county you're interested in "
+            "and I can share estimated insurance premiums and home prices for it."
+        )
+
+    place = f"{intent['city'].title()} ({county} County)" if intent["city"] else f"{county} County"
+    lines = [DEGRADED_NOTICE, "", f"**Estimated annual premiums for {place}:**"]
+
+    rates = get_insurance_rates(county)
+    forms = (intent["ho_form"],) if intent["ho_form"] in rates else DEFAULT_FORMS
+    for form in forms:
+        lines.append(f"• {form}: ${rates[form]:,}")
+
+    region, property_types = _median_prices(county)
+    if property_types:
+        lines.extend(["", f"**Median sale prices ({region}):**"])
+        for prop_type, stats in property_types.items():
+            latest = stats.get("latest_price")
+            if latest:
+                lines.append(f"• {prop_type.replace('_', ' ').title()}: ${latest:,.0f}")
+
+    lines.extend(["", "Actual quotes vary by home and insurer. Please try again shortly for a full recommendation."])
+    return "\n".join(lines)
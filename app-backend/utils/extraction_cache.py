@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+# Cache knobs (env-driven). EXTRACT_CACHE_DB=off disables the cache.
+DEFAULT_EXTRACT_CACHE_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "extraction_cache.sqlite")
+EXTRACT_CACHE_DB = os.getenv("EXTRACT_CACHE_DB", DEFAULT_EXTRACT_CACHE_DB)
+EXTRACT_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACT_CACHE_MAX_ENTRIES", "100000"))
+
+
+def content_key(normalized_text: str, prompt_version: str) -> str:
+    """Cache key for a normalized document under a given prompt/extractor version."""
+    return hashlib.sha256(f"{prompt_version}\n{normalized_text}".encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Persistent SQLite cache of extraction results keyed by content hash.
+
+    Entries are evicted least-recently-used once the table grows past
+    ``max_entries`` (checked every few writes rather than on each one).
+    Hits don't write: their last-used times are batched into the next put
+    (or every TOUCH_BATCH hits).
+    """
+
+    TOUCH_BATCH = 256
+
+    def __init__(self, db_path: Optional[str] = EXTRACT_CACHE_DB, max_entries: int = EXTRACT_CACHE_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self.db_path = None if not db_path or db_path.lower() == "off" else db_path
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self._touched = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = None
+        if self.db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS extractions_last_used ON extractions (last_used)")
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached result for ``key`` or None."""
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT result FROM extractions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._flush_touched()
+                self._db.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, result: dict):
+        """Store an extraction result, evicting old entries when over the size bound."""
+        if self._db is None:
+            return
+        now = time.time()
+        with self._lock:
+            self._flush_touched()
+            self._db.execute(
+                "INSERT OR REPLACE INTO extractions (key, result, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result), now, now),
+            )
+            self._writes_since_evict += 1
+            # Amortize the COUNT(*) over a batch of writes
+            if self._writes_since_evict >= max(1, min(1000, self.max_entries // 100)):
+                self._writes_since_evict = 0
+                self._evict()
+            self._db.commit()
+
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE extractions SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self):
+        count = self._db.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM extractions WHERE key IN (SELECT key FROM extractions ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+
+    def stats(self) -> dict:
+        """Return hit/miss counters, hit ratio and size."""
+        lookups = self.hits + self.misses
+        entries = 0
+        if self._db is not None:
+            with self._lock:
+                entries = self._db.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "path": self.db_path,
+        }
@@ -1,9 +1,13 @@
 import os
 from typing import Optional
 
+from utils.prompt_registry import prompt_registry
+
 def load_instruction_from_file(filename: str, instructions_dir: str = "instructions") -> str:
     """
     Load instruction content from a text file.
+    Content is kept in memory by the prompt registry and only re-read
+    when the file's mtime changes.
     
     Args:
         filename (str): Name of the instruction file (e.g., "home_insurance_expert.txt")
@@ -25,13 +29,7 @@ def load_instruction_from_file(filename: str, instructions_dir: str = "instructi
     file_path = os.path.join(instructions_path, filename)
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read().strip()
-            
-        if not content:
-            raise ValueError(f"Instruction file is empty: {file_path}")
-            
-        return content
+        return prompt_registry.text(file_path)
         
     except FileNotFoundError:
         raise FileNotFoundError(f"Instruction file not found: {file_path}")
@@ -0,0 +1,188 @@
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import re
+from typing import AsyncGenerator, List, Optional, Union
+
+from pydantic import PrivateAttr
+from google.adk.models import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+# Model backend for the agents: gemini (default) or fake (offline, no quota)
+CHAT_MODEL_BACKEND = os.getenv("CHAT_MODEL_BACKEND", "gemini").lower()
+
+# Fake backend knobs (env-driven)
+FAKE_LLM_LATENCY_MS = float(os.getenv("FAKE_LLM_LATENCY_MS", "800"))
+FAKE_LLM_LATENCY_SIGMA = float(os.getenv("FAKE_LLM_LATENCY_SIGMA", "0.5"))
+FAKE_LLM_CHUNK_CHARS = int(os.getenv("FAKE_LLM_CHUNK_CHARS", "40"))
+FAKE_LLM_CHUNK_DELAY_MS = float(os.getenv("FAKE_LLM_CHUNK_DELAY_MS", "20"))
+FAKE_LLM_RESPONSE_CHARS = int(os.getenv("FAKE_LLM_RESPONSE_CHARS", "900"))
+FAKE_LLM_FAILURE_RATE = float(os.getenv("FAKE_LLM_FAILURE_RATE", "0"))
+# Share of first turns answered with a call to one of the agent's tools
+FAKE_LLM_TOOL_CALL_RATE = float(os.getenv("FAKE_LLM_TOOL_CALL_RATE", "0"))
+FAKE_LLM_SEED = int(os.getenv("FAKE_LLM_SEED", "1234"))
+
+_FAKE_SENTENCES = [
+    "For a home in Florida, an HO-3 policy is the usual starting point.",
+    "Hurricane and windstorm risk drive most of the premium along the coast.",
+    "Flood damage is excluded from standard policies, so consider a separate NFIP or private flood policy.",
+    "Wind mitigation features such as impact windows and a newer roof can lower the premium.",
+    "Expect a separate hurricane deductible, typically 2% to 5% of the dwelling coverage.",
+    "Comparing quotes from several insurers is the best way to find a fair price.",
+    "Inland counties usually cost less to insure than coastal ones.",
+]
+
+
+class FakeLlmFailure(RuntimeError):
+    """Injected model failure from the fake backend."""
+
+
+class FakeLlm(BaseLlm):
+    """
+    Offline stand-in for Gemini used for load tests.
+
+    Replies with canned insurance text (or JSON for agents with an output
+    schema) after a lognormal time-to-first-token, streams it in fixed-size
+    chunks, and fails a configurable share of calls. With ``tool_call_rate``
+    set, that share of first turns calls one of the agent's tools instead,
+    so the tool round trip is exercised too. Each call draws from
+    its own RNG seeded with ``seed`` and the call number, so a run is
+    reproducible for a given request order.
+    """
+
+    latency_ms: float = FAKE_LLM_LATENCY_MS
+    latency_sigma: float = FAKE_LLM_LATENCY_SIGMA
+    chunk_chars: int = FAKE_LLM_CHUNK_CHARS
+    chunk_delay_ms: float = FAKE_LLM_CHUNK_DELAY_MS
+    response_chars: int = FAKE_LLM_RESPONSE_CHARS
+    failure_rate: float = FAKE_LLM_FAILURE_RATE
+    tool_call_rate: float = FAKE_LLM_TOOL_CALL_RATE
+    seed: int = FAKE_LLM_SEED
+
+    _calls: itertools.count = PrivateAttr(default_factory=itertools.count)
+
+    @classmethod
+    def supported_models(cls) -> list:
+        return [r"fake-.*"]
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        rng = random.Random(f"{self.seed}:{next(self._calls)}")
+        prompt = _last_user_text(llm_request)
+        function_call = self._tool_call(llm_request, prompt, rng)
+        text = "" if function_call else self._reply_text(llm_request, prompt, rng)
+
+        # Lognormal around the median, like real model latency
+        first_token_s = self.latency_ms * math.exp(rng.gauss(0, self.latency_sigma)) / 1000
+        await asyncio.sleep(first_token_s)
+        if rng.random() < self.failure_rate:
+            raise FakeLlmFailure(f"Injected failure from {self.model}")
+
+        if function_call is not None:
+            yield LlmResponse(
+                content=types.Content(role="model", parts=[types.Part(function_call=function_call)]),
+                turn_complete=True,
+            )
+            return
+
+        chunks = [text[i:i + self.chunk_chars] for i in range(0, len(text), max(1, self.chunk_chars))]
+        usage = types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=max(1, len(prompt) // 4),
+            candidates_token_count=max(1, len(text) // 4),
+            total_token_count=max(1, len(prompt) // 4) + max(1, len(text) // 4),
+        )
+
+        if stream:
+            for idx, chunk in enumerate(chunks):
+                if idx:
+                    await asyncio.sleep(self.chunk_delay_ms / 1000)
+                yield LlmResponse(content=_model_content(chunk), partial=True)
+        else:
+            await asyncio.sleep(self.chunk_delay_ms * max(0, len(chunks) - 1) / 1000)
+
+        yield LlmResponse(content=_model_content(text), usage_metadata=usage, turn_complete=True)
+
+    def _tool_call(self, llm_request: LlmRequest, prompt: str, rng: random.Random):
+        """A FunctionCall to a random tool taking only string arguments, or None."""
+        if not self.tool_call_rate or _answers_function_call(llm_request) or rng.random() >= self.tool_call_rate:
+            return None
+        candidates = []
+        for name, tool in sorted((llm_request.tools_dict or {}).items()):
+            params = _string_params(tool._get_declaration())
+            if params:
+                candidates.append((name, params))
+        if not candidates:
+            return None
+        name, params = rng.choice(candidates)
+        # Tools here take a place name (location / city / request), so pass the asked-about city
+        match = re.search(r"\bin ([A-Z][A-Za-z]+(?: [A-Z][A-Za-z]+)*)", prompt)
+        place = match.group(1) if match else "Orlando"
+        return types.FunctionCall(name=name, args={param: place for param in params})
+
+    def _reply_text(self, llm_request: LlmRequest, prompt: str, rng: random.Random) -> str:
+        schema = llm_request.config.response_schema if llm_request.config else None
+        if schema is not None and hasattr(schema, "model_fields"):
+            return json.dumps({name: rng.choice(_FAKE_SENTENCES) for name in schema.model_fields})
+
+        sentences = [f"Thanks for your question about \"{prompt[:80]}\"."]
+        while sum(len(s) + 1 for s in sentences) < self.response_chars:
+            sentences.append(rng.choice(_FAKE_SENTENCES))
+        return " ".join(sentences)
+
+
+def _last_user_text(llm_request: LlmRequest) -> str:
+    for content in reversed(llm_request.contents or []):
+        if content.role == "user" and content.parts:
+            text = "".join(part.text or "" for part in content.parts)
+            if text:
+                return text
+    return ""
+
+
+def _string_params(declaration: Optional[types.FunctionDeclaration]) -> Optional[List[str]]:
+    """Parameter names of a tool declaration when all of them are strings, else None."""
+    if declaration is None:
+        return None
+    # Recent google-adk fills parameters_json_schema and leaves parameters unset
+    schema = declaration.parameters_json_schema
+    if isinstance(schema, dict) and schema.get("properties"):
+        properties = schema["properties"]
+        if all(isinstance(prop, dict) and prop.get("type") == "string" for prop in properties.values()):
+            return list(properties)
+        return None
+    properties = declaration.parameters.properties if declaration.parameters else None
+    if properties and all(prop.type == types.Type.STRING for prop in properties.values()):
+        return list(properties)
+    return None
+
+
+def _answers_function_call(llm_request: LlmRequest) -> bool:
+    """True if the latest content carries tool results (the turn after a function call)."""
+    contents = llm_request.contents or []
+    return bool(contents) and any(part.function_response for part in contents[-1].parts or [])
+
+
+def _model_content(text: str) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def chat_model(model_name: str, backend: str = CHAT_MODEL_BACKEND) -> Union[str, BaseLlm]:
+    """
+    Resolve the model for an agent according to CHAT_MODEL_BACKEND.
+
+    Args:
+        model_name (str): Real model name, e.g. "gemini-2.0-flash"
+        backend (str): gemini | fake
+
+    Returns:
+        The model name for ADK to resolve, or a FakeLlm instance
+    """
+    if backend == "fake":
+        return FakeLlm(model=f"fake-{model_name}")
+    return model_name
@@ -0,0 +1,244 @@
+import abc
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+# Context caching knobs (env-driven): off | gemini | fake
+PROMPT_CONTEXT_CACHE = os.getenv("PROMPT_CONTEXT_CACHE", "off").lower()
+PROMPT_CONTEXT_CACHE_TTL_S = int(os.getenv("PROMPT_CONTEXT_CACHE_TTL_S", "3600"))
+
+
+@dataclass(frozen=True)
+class PromptEntry:
+    path: str
+    text: str
+    content_hash: str
+    mtime_ns: int
+    size: int
+
+
+class PromptRegistry:
+    """
+    In-memory store of instruction/prompt files.
+
+    Each file is read and validated once and served from memory until its
+    mtime or size changes on disk, so edits are picked up without a restart.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, PromptEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> PromptEntry:
+        """
+        Return the current entry for a prompt file, re-reading it only if it changed.
+
+        Args:
+            path (str): Path of the prompt file
+
+        Returns:
+            PromptEntry: Text, sha256 content hash and file stamp
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is empty
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+
+        with self._lock:
+            with open(path, 'r', encoding='utf-8') as file:
+                text = file.read().strip()
+            if not text:
+                raise ValueError(f"Instruction file is empty: {path}")
+
+            entry = PromptEntry(
+                path=path,
+                text=text,
+                content_hash=hashlib.sha256(text.encode('utf-8')).hexdigest(),
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+            )
+            if path in self._entries:
+                print(f"Reloaded prompt {os.path.basename(path)} ({entry.content_hash[:12]})")
+            self._entries[path] = entry
+            return entry
+
+    def text(self, path: str) -> str:
+        return self.get(path).text
+
+    def content_hash(self, path: str) -> str:
+        return self.get(path).content_hash
+
+
+# Shared registry used by load_instruction and the agents
+prompt_registry = PromptRegistry()
+
+
+def instruction_provider(load: Callable[[], str], suffix: str = "") -> Callable[[object], str]:
+    """
+    Build an ADK instruction provider that re-resolves the instruction on
+    every model call, so file edits take effect without rebuilding agents.
+
+    Args:
+        load (callable): Returns the current instruction text
+        suffix (str): Extra text appended after the loaded instruction
+
+    Returns:
+        callable: Function taking the ADK ReadonlyContext and returning the instruction
+    """
+    def provide(_context) -> str:
+        return load() + suffix
+    return provide
+
+
+# -------------------------------------------------------------------
+# Provider-side context caching
+# -------------------------------------------------------------------
+class ContextCacheProvider(abc.ABC):
+    """
+    Base class for registering a system prompt (plus tool declarations) as
+    cached content with the model provider. ``cached_content_for`` returns
+    the provider's cache name, creating the cache on first use.
+
+    Used from the event loop: the blocking ``_create`` runs in a worker
+    thread, and concurrent requests for the same prompt share one create.
+    """
+
+    def __init__(self, ttl_s: int = PROMPT_CONTEXT_CACHE_TTL_S):
+        self.ttl_s = ttl_s
+        self._caches: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._failed: Dict[Tuple[str, str], float] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.created = 0
+        self.reused = 0
+
+    async def cached_content_for(self, model: str, system_instruction: str, tools_json: str = "") -> Optional[str]:
+        """
+        Return the cache name for this model + prompt, or None if caching is unavailable.
+
+        Args:
+            model (str): Model name, e.g. "gemini-2.0-flash"
+            system_instruction (str): Full system prompt text
+            tools_json (str): Serialized tool declarations sent with the prompt
+        """
+        key = (model, hashlib.sha256((system_instruction + tools_json).encode('utf-8')).hexdigest())
+        now = time.time()
+
+        cached = self._caches.get(key)
+        # Refresh a little before the provider expires the cache
+        if cached is not None and cached[1] - 60 > now:
+            self.reused += 1
+            return cached[0]
+        # Don't hammer the provider after a failed create (e.g. prompt below minimum size)
+        if self._failed.get(key, 0) > now:
+            return None
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._create_off_loop(model, system_instruction, tools_json, key))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        # A cancelled request must not cancel the create other requests wait on
+        return await asyncio.shield(pending)
+
+    async def _create_off_loop(self, model: str, system_instruction: str, tools_json: str, key: Tuple[str, str]) -> Optional[str]:
+        try:
+            name = await asyncio.to_thread(self._create, model, system_instruction, tools_json, key[1])
+        except Exception as e:
+            print(f"Context cache create failed for {model}: {e!r}")
+            self._failed[key] = time.time() + self.ttl_s
+            return None
+
+        self._caches[key] = (name, time.time() + self.ttl_s)
+        self.created += 1
+        return name
+
+    @abc.abstractmethod
+    def _create(self, model: str, system_instruction: str, tools_json: str, content_hash: str) -> str:
+        """Create the cached content with the provider (blocking) and return its name."""
+
+
+class GeminiContextCacheProvider(ContextCacheProvider):
+    """Context caching through the google-genai ``caches`` API."""
+
+    def __init__(self, ttl_s: int = PROMPT_CONTEXT_CACHE_TTL_S):
+        super().__init__(ttl_s)
+        from google import genai
+        self._client = genai.Client()
+
+    def _create(self, model: str, system_instruction: str, tools_json: str, content_hash: str) -> str:
+        from google.genai import types
+
+        tools = [types.Tool.model_validate(t) for t in json.loads(tools_json)] if tools_json else None
+        cache = self._client.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                display_name=f"prompt-{content_hash[:12]}",
+                system_instruction=system_instruction,
+                tools=tools,
+                ttl=f"{self.ttl_s}s",
+            ),
+        )
+        return cache.name
+
+
+class FakeContextCacheProvider(ContextCacheProvider):
+    """Local stand-in for tests: hands out deterministic cache names, no network."""
+
+    def __init__(self, ttl_s: int = PROMPT_CONTEXT_CACHE_TTL_S):
+        super().__init__(ttl_s)
+        self.contents: Dict[str, str] = {}
+
+    def _create(self, model: str, system_instruction: str, tools_json: str, content_hash: str) -> str:
+        name = f"cachedContents/fake-{model}-{content_hash[:12]}"
+        self.contents[name] = system_instruction
+        return name
+
+
+def build_context_cache_provider(kind: str = PROMPT_CONTEXT_CACHE) -> Optional[ContextCacheProvider]:
+    """Create the provider selected by PROMPT_CONTEXT_CACHE (None when off)."""
+    if kind == "gemini":
+        return GeminiContextCacheProvider()
+    if kind == "fake":
+        return FakeContextCacheProvider()
+    return None
+
+
+def context_cache_callback(provider: Optional[ContextCacheProvider]):
+    """
+    Build an ADK ``before_model_callback`` that swaps the system prompt and
+    tool declarations of each request for a provider-side cached context.
+
+    Requests are left untouched when no provider is configured or the
+    cache can't be created, so the agent always keeps working.
+    """
+    async def before_model(callback_context, llm_request):
+        if provider is None or llm_request.config is None:
+            return None
+
+        system_instruction = llm_request.config.system_instruction
+        if not isinstance(system_instruction, str) or not system_instruction:
+            return None
+
+        tools = llm_request.config.tools or []
+        tools_json = json.dumps([t.model_dump(mode="json", exclude_none=True) for t in tools]) if tools else ""
+
+        name = await provider.cached_content_for(llm_request.model, system_instruction, tools_json)
+        if name:
+            # Cached content already carries these; sending them again is rejected
+            llm_request.config.cached_content = name
+            llm_request.config.system_instruction = None
+            llm_request.config.tools = None
+        return None
+
+    return before_model
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Resilience knobs (env-driven)
+AGENT_HEDGE_AFTER_S = float(os.getenv("AGENT_HEDGE_AFTER_S", "8"))
+AGENT_MAX_ATTEMPTS = int(os.getenv("AGENT_MAX_ATTEMPTS", "2"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_S = float(os.getenv("BREAKER_RESET_S", "30"))
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a backend whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed    -> calls go through; ``failure_threshold`` failures in a row open it
+    open      -> calls are refused until ``reset_after_s`` has passed
+    half_open -> one trial call is let through; success closes, failure re-opens
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_after_s: float = BREAKER_RESET_S,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_after_s = reset_after_s
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_after_s:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return True if a call may be made now."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                print(f"Circuit breaker '{self.name}' closed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def abandon(self):
+        """Forget a call that ended without an outcome (e.g. the client went away)."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    print(f"Circuit breaker '{self.name}' opened after {self._failures} failures")
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        return {"name": self.name, "state": self.state, "consecutive_failures": self._failures}
+
+
+async def call_with_resilience(
+    make_call: Callable[[], Awaitable[T]],
+    breaker: CircuitBreaker,
+    deadline_s: float,
+    hedge_after_s: float = AGENT_HEDGE_AFTER_S,
+    max_attempts: int = AGENT_MAX_ATTEMPTS,
+) -> T:
+    """
+    Run an async backend call with a deadline, hedged retries and a breaker.
+
+    The first attempt starts immediately. Another attempt is started when the
+    running ones have been quiet for ``hedge_after_s`` or one of them fails,
+    up to ``max_attempts``; the first successful result wins and the rest are
+    cancelled. The whole call, however many attempts, must finish within
+    ``deadline_s`` and counts as a single success or failure for the breaker.
+
+    Args:
+        make_call (callable): Starts one attempt and returns its awaitable
+        breaker (CircuitBreaker): Breaker guarding this backend
+        deadline_s (float): Overall deadline in seconds
+        hedge_after_s (float): Delay before a hedged attempt is started
+        max_attempts (int): Maximum number of attempts
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        CircuitOpen: If the breaker refuses the call
+        asyncio.TimeoutError: If no attempt succeeded before the deadline
+        Exception: The last attempt's error if every attempt failed
+    """
+    if not breaker.allow():
+        raise CircuitOpen(f"Circuit breaker '{breaker.name}' is open")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + deadline_s
+    attempts = set()
+    started = 0
+    last_error: Optional[BaseException] = None
+    finished = False
+
+    try:
+        while True:
+            if not attempts and started < max(1, max_attempts):
+                attempts.add(asyncio.ensure_future(make_call()))
+                started += 1
+
+            remaining = deadline - loop.time()
+            if remaining <= 0 or not attempts:
+                break
+            wait_s = min(remaining, hedge_after_s) if started < max_attempts else remaining
+            done, attempts = await asyncio.wait(attempts, timeout=wait_s, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                if task.exception() is None:
+                    finished = True
+                    breaker.record_success()
+                    return task.result()
+                last_error = task.exception()
+                print(f"{breaker.name} attempt failed: {last_error!r}")
+
+            # Nothing finished in time: hedge with a parallel attempt
+            if not done and started < max_attempts:
+                print(f"{breaker.name} slow after {hedge_after_s:g}s, starting hedged attempt")
+                attempts.add(asyncio.ensure_future(make_call()))
+                started += 1
+        finished = True
+    finally:
+        for task in attempts:
+            task.cancel()
+        if not finished:
+            breaker.abandon()
+
+    breaker.record_failure()
+    if last_error is not None and loop.time() < deadline:
+        raise last_error
+    raise asyncio.TimeoutError(f"{breaker.name} did not answer within {deadline_s:g}s")
@@ -0,0 +1,178 @@
+import re
+from typing import List
+
+# Keywords that mark a short sentence as a section header
+SECTION_KEYWORDS = ['recommendation', 'coverage', 'risk', 'price', 'cost', 'factors', 'benefits']
+RESPONSE_HEADER = "🏠 **Insurance Expert Response:**"
+RESPONSE_CLOSING = "💡 *Need more specific information? Feel free to ask about coverage details, pricing, or risk factors for your area.*"
+
+# Sentence boundaries: the space after a period, or a literal '|'
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=\.) |\|')
+# Extra spacing before headers and around bullets
+_SPACING_RE = re.compile(r'\*\*|:\n•|\n•')
+_SPACING = {'**': '\n**', ':\n•': ':\n\n\n•', '\n•': '\n\n•'}
+_NEWLINE_RUN_RE = re.compile(r'\n{4,}')
+
+
+def _is_section_header(sentence: str) -> bool:
+    """A short sentence mentioning a section keyword is treated as a header."""
+    if len(sentence) >= 80:
+        return False
+    lowered = sentence.lower()
+    return any(keyword in lowered for keyword in SECTION_KEYWORDS)
+
+
+def _needs_closing(text: str) -> bool:
+    lowered = text.lower()
+    return not any(word in lowered for word in ['question', 'help', 'more'])
+
+
+def _format_line(line: str) -> str:
+    """Apply bullet / header styling to one stripped output line."""
+    if not line:
+        return ''
+
+    # Convert items that look like lists to bullet points with better formatting
+    if (not line.startswith('**') and not line.startswith('•') and
+            len(line) > 50 and (',' in line or 'and ' in line)):
+        label, sep, rest = line.partition(': ')
+        if sep:
+            return f"🔹 **{label}:** {rest}"
+        return f"🔹 {line}"
+    if line.startswith('**') and line.endswith(':**'):
+        # Format section headers with better styling
+        return f"📋 {line}"
+    return line
+
+
+def _spacing_replacement(match: re.Match) -> str:
+    return _SPACING[match.group(0)]
+
+
+def format_insurance_response(response_text: str) -> str:
+    """
+    Format insurance agent response with better structure and readability.
+
+    Runs in O(n): sentences are tokenized in one regex scan, each sentence
+    and output line is visited once, and the spacing/newline clean-up is a
+    fixed number of linear regex passes.
+    """
+    formatted_lines = []
+    current_section = []
+
+    def emit(part: str):
+        for line in part.split('\n'):
+            formatted_lines.append(_format_line(line.strip()))
+
+    for sentence in _SENTENCE_SPLIT_RE.split(response_text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+
+        # Check if this looks like a header/section
+        if _is_section_header(sentence):
+            # If we have accumulated content, add it as a section
+            if current_section:
+                emit(' '.join(current_section))
+                current_section = []
+            # Add the header (preceded by a blank line)
+            emit(f"\n**{sentence.rstrip('.')}:**")
+        else:
+            current_section.append(sentence)
+
+    # Add any remaining content
+    if current_section:
+        emit(' '.join(current_section))
+
+    final_result = '\n'.join(formatted_lines)
+
+    # Line break before headers, space between headers/bullets, then cap
+    # newline runs at 3 for good spacing
+    final_result = _SPACING_RE.sub(_spacing_replacement, final_result)
+    final_result = _NEWLINE_RUN_RE.sub('\n\n\n', final_result)
+
+    # Add greeting and closing for better UX
+    if final_result and not final_result.startswith('Hello') and not final_result.startswith('Hi'):
+        final_result = f"{RESPONSE_HEADER}\n\n{final_result}"
+
+    # Add a helpful closing
+    if _needs_closing(final_result):
+        final_result += f"\n\n{RESPONSE_CLOSING}"
+
+    return final_result.strip()
+
+
+class StreamingInsuranceFormatter:
+    """
+    Incremental variant of format_insurance_response for streamed answers.
+
+    Text chunks are buffered until a sentence is complete; each completed
+    sentence is formatted on its own (headers vs. body text) and returned
+    right away so it can be forwarded to the client.
+    """
+
+    SENTENCE_ENDINGS = ('. ', '? ', '! ', '\n')
+
+    def __init__(self):
+        self._buffer = ""
+        self._started = False
+        self._seen_text: List[str] = []
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Add a text chunk and return formatted pieces for completed sentences.
+
+        Args:
+            chunk (str): Raw text chunk from the agent
+
+        Returns:
+            List[str]: Formatted pieces ready to send (may be empty)
+        """
+        self._buffer += chunk
+        pieces = []
+
+        while True:
+            cut = self._next_sentence_end()
+            if cut < 0:
+                break
+            sentence, self._buffer = self._buffer[:cut], self._buffer[cut:]
+            pieces.extend(self._format_sentence(sentence))
+
+        return pieces
+
+    def flush(self) -> List[str]:
+        """
+        Format whatever is left in the buffer and append the closing line.
+
+        Returns:
+            List[str]: Final formatted pieces
+        """
+        pieces = self._format_sentence(self._buffer)
+        self._buffer = ""
+
+        if self._started and _needs_closing(" ".join(self._seen_text)):
+            pieces.append(f"\n\n{RESPONSE_CLOSING}")
+        return pieces
+
+    def _next_sentence_end(self) -> int:
+        ends = [self._buffer.find(mark) for mark in self.SENTENCE_ENDINGS]
+        ends = [pos + 1 for pos in ends if pos >= 0]
+        return min(ends) if ends else -1
+
+    def _format_sentence(self, sentence: str) -> List[str]:
+        sentence = sentence.strip()
+        if not sentence:
+            return []
+
+        pieces = []
+        if not self._started:
+            self._started = True
+            if not sentence.startswith('Hello') and not sentence.startswith('Hi'):
+                pieces.append(f"{RESPONSE_HEADER}\n\n")
+
+        self._seen_text.append(sentence)
+        if _is_section_header(sentence):
+            pieces.append(f"\n📋 **{sentence.rstrip('.')}:**\n")
+        else:
+            pieces.append(f"{sentence} ")
+        return pieces
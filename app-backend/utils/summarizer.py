@@ -0,0 +1,98 @@
+import os
+import re
+from collections import Counter
+from typing import Awaitable, Callable, Optional, Tuple
+
+from utils.metrics import CHAT_SUMMARY_PATHS
+
+# Summarization thresholds (env-driven), measured in characters of agent output
+SUMMARY_SKIP_CHARS = int(os.getenv("SUMMARY_SKIP_CHARS", "600"))
+SUMMARY_LLM_CHARS = int(os.getenv("SUMMARY_LLM_CHARS", "2500"))
+SUMMARY_MAX_SENTENCES = int(os.getenv("SUMMARY_MAX_SENTENCES", "5"))
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[a-z0-9$%'-]+")
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "if", "of", "to", "in", "on", "for", "with", "at", "by",
+    "is", "are", "was", "were", "be", "been", "it", "its", "this", "that", "these", "those", "as",
+    "you", "your", "can", "will", "may", "also", "from", "which", "their", "they", "more", "most",
+}
+
+
+def extractive_summary(text: str, max_sentences: int = SUMMARY_MAX_SENTENCES) -> str:
+    """
+    Deterministic extractive summary: keep the highest-scoring sentences
+    (by content-word frequency) in their original order.
+
+    Args:
+        text (str): Text to summarize
+        max_sentences (int): Number of sentences to keep
+
+    Returns:
+        str: Summary text
+    """
+    sentences = [s.strip() for s in _SENTENCE_RE.split(text.strip()) if s.strip()]
+    if len(sentences) <= max_sentences:
+        return " ".join(sentences)
+
+    sentence_words = [
+        [w for w in _WORD_RE.findall(s.lower()) if w not in _STOPWORDS] for s in sentences
+    ]
+    frequencies = Counter(w for words in sentence_words for w in words)
+
+    scores = []
+    for idx, words in enumerate(sentence_words):
+        score = sum(frequencies[w] for w in words) / (len(words) or 1)
+        # Lead sentences usually carry the answer; prices and numbers are what users ask for
+        if idx == 0:
+            score *= 1.5
+        if any(ch.isdigit() for ch in sentences[idx]):
+            score *= 1.2
+        scores.append((score, idx))
+
+    # Highest score first; ties keep the earlier sentence
+    keep = sorted(idx for _, idx in sorted(scores, key=lambda s: (-s[0], s[1]))[:max_sentences])
+    return " ".join(sentences[idx] for idx in keep)
+
+
+async def summarize_answer(
+    text: str,
+    llm_summarizer: Optional[Callable[[str], Awaitable[str]]] = None,
+    skip_chars: int = SUMMARY_SKIP_CHARS,
+    llm_chars: int = SUMMARY_LLM_CHARS,
+) -> Tuple[str, str]:
+    """
+    Summarize an agent answer with the cheapest adequate strategy.
+
+    - shorter than ``skip_chars``: returned unchanged
+    - shorter than ``llm_chars`` (or no LLM available): local extractive summary
+    - otherwise: ``llm_summarizer``, falling back to extractive on failure
+
+    Args:
+        text (str): Agent answer
+        llm_summarizer (callable): Async function that summarizes text with a model
+        skip_chars (int): Length under which no summary is made
+        llm_chars (int): Length from which the LLM summarizer is used
+
+    Returns:
+        tuple: (summary text, path taken: skipped | extractive | llm | llm_failed)
+    """
+    if len(text) < skip_chars:
+        path, summary = "skipped", text
+    elif len(text) < llm_chars or llm_summarizer is None:
+        path, summary = "extractive", extractive_summary(text)
+    else:
+        try:
+            summary = (await llm_summarizer(text)).strip()
+            path = "llm"
+        except Exception as e:
+            print(f"LLM summarization error: {e!r}")
+            summary = ""
+            path = "llm_failed"
+        if not summary:
+            summary = extractive_summary(text)
+            path = "llm_failed"
+
+    CHAT_SUMMARY_PATHS.inc(path=path)
+    print(f"Summarization path: {path} ({len(text)} -> {len(summary)} chars)")
+    return summary, path
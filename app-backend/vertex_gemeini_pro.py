@@ -1,33 +1,287 @@
+import asyncio
+import html
 import json
+import os
+import re
+import sys
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import AsyncIterator, Iterable, Tuple
+
 import vertexai
-from vertexai.preview.generative_models import GenerativeModel
+from vertexai.preview.generative_models import GenerationConfig, GenerativeModel
+
+# Add functions directory to path for the local extractor
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "functions"))
+from property_extractor import PROPERTY_FIELDS, extract_property_fields
+from utils.extraction_cache import ExtractionCache, content_key
+
+project_id = os.getenv("VERTEX_PROJECT_ID", "gen-lang-client-0670782423")
+location = os.getenv("VERTEX_LOCATION", "us-central1")
+model_name = os.getenv("VERTEX_MODEL", "gemini-2.0-flash")
+
+# Batch extraction knobs (env-driven)
+EXTRACT_MAX_CONCURRENCY = int(os.getenv("EXTRACT_MAX_CONCURRENCY", "16"))
+EXTRACT_MAX_CHARS = int(os.getenv("EXTRACT_MAX_CHARS", "6000"))
+# Set to 0 to never call the model and return only locally extracted fields
+EXTRACT_USE_LLM = os.getenv("EXTRACT_USE_LLM", "1") not in ("0", "false", "no")
+
+# Bump when the prompt or the local extractor changes so cached results are not reused
+EXTRACTION_PROMPT_VERSION = "3"
+EXTRACTION_PROMPT = (
+    "Extract property information from the following HTML or text. "
+    "Return compact JSON with keys: {keys}. "
+    "If a value is missing, omit it."
+)
+
+# Elements whose content never holds listing details
+SKIP_TAGS = {"script", "style", "noscript", "svg", "iframe", "template", "nav", "footer", "form", "button", "select"}
+BLOCK_TAGS = {"p", "div", "br", "li", "tr", "td", "th", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article", "dd", "dt", "table", "ul", "ol"}
+BOILERPLATE_RE = re.compile(
+    r"cookie|privacy policy|terms of (use|service)|all rights reserved|©|copyright|sign in|log in|"
+    r"subscribe|newsletter|equal housing|skip to|share this|download (our|the) app",
+    re.IGNORECASE,
+)
+# Only sentences up to this long are dropped as boilerplate; longer ones are
+# more likely listing text that happens to mention e.g. "log in" or ©
+BOILERPLATE_MAX_CHARS = 120
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?|])\s+")
+
+
+@lru_cache(maxsize=1)
+def get_model() -> GenerativeModel:
+    """Initialize Vertex AI and the model on first use (nothing runs at import)."""
+    vertexai.init(project=project_id, location=location)
+    return GenerativeModel(
+        model_name,
+        generation_config=GenerationConfig(response_mime_type="application/json", temperature=0),
+    )
+
+
+class _TextExtractor(HTMLParser):
+    """Collect visible text, one line per block element, skipping SKIP_TAGS."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
 
-project_id = "gen-lang-client-0670782423"
-location = "us-central1"
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
 
-vertexai.init(project=project_id, location=location)
 
-model = GenerativeModel("gemini-2.0-flash")
-response = model.generate_content('Say hi, I am Vertext AI Gemini 2.0 Flash!')
-def extract_property_info(raw_html: str):
-    prompt = (
-        "Extract property information from the following HTML or text. "
-        "Return compact JSON with keys: address, city, zip, year_built. "
-        "If a value is missing, omit it."
+def _strip_boilerplate(line: str) -> str:
+    """Remove the short boilerplate sentences from a line, keeping the rest."""
+    if not BOILERPLATE_RE.search(line):
+        return line
+    sentences = SENTENCE_SPLIT_RE.split(line)
+    return " ".join(
+        sentence for sentence in sentences
+        if len(sentence) > BOILERPLATE_MAX_CHARS or not BOILERPLATE_RE.search(sentence)
     )
-    resp = model.generate_content([prompt, raw_html])  # <— pass string directly
-    txt = resp.text.strip()
+
+
+def clean_html(raw_html: str, max_chars: int = EXTRACT_MAX_CHARS) -> str:
+    """
+    Reduce an HTML page to the visible text likely to hold listing details.
+
+    Drops scripts, styles, navigation, footers and forms, removes short
+    boilerplate sentences (cookie banners, copyright, sign-in prompts) while
+    keeping the rest of their line, collapses whitespace and de-duplicates
+    lines, then truncates to ``max_chars``.
+
+    Args:
+        raw_html (str): HTML or plain text
+        max_chars (int): Maximum length of the returned text
+
+    Returns:
+        str: Compact text to send to the model
+    """
+    parser = _TextExtractor()
+    try:
+        parser.feed(raw_html)
+        parser.close()
+        text = "".join(parser.parts)
+    except Exception:
+        # Badly broken markup: fall back to a crude tag strip
+        text = html.unescape(re.sub(r"<[^>]+>", "\n", raw_html))
+
+    lines = []
+    seen = set()
+    for line in text.splitlines():
+        line = _strip_boilerplate(re.sub(r"\s+", " ", line).strip())
+        if not line or line in seen:
+            continue
+        seen.add(line)
+        lines.append(line)
+    return "\n".join(lines)[:max_chars]
+
+
+def _parse_model_json(txt: str) -> dict:
+    txt = txt.strip()
     # strip triple-backticks if model returned a fenced block
     if txt.startswith("```"):
         txt = txt.strip("`").strip()
         if txt.lower().startswith("json"):
             txt = txt[4:].strip()
     try:
-        return json.loads(txt)
+        parsed = json.loads(txt)
     except Exception:
-        # fall back to raw text if the model didn't return valid JSON
-        return {"raw_text": resp.text}
+        parsed = None
+    # fall back to raw text if the model didn't return a JSON object
+    return parsed if isinstance(parsed, dict) else {"raw_text": txt}
+
+
+# Results keyed by cleaned-content hash (EXTRACT_CACHE_DB / EXTRACT_CACHE_MAX_ENTRIES)
+extraction_cache = ExtractionCache()
+
+
+def _cache_key(text: str) -> str:
+    version = f"{EXTRACTION_PROMPT_VERSION}|{model_name}|llm={int(EXTRACT_USE_LLM)}"
+    return content_key(text, version)
+
+
+def _local_pass(text: str):
+    fields = extract_property_fields(text)
+    missing = [name for name in PROPERTY_FIELDS if name not in fields]
+    return fields, missing
+
+
+def _store(key: str, result: dict) -> dict:
+    # Unparseable model output is not worth keeping; the next run may do better
+    if "raw_text" not in result:
+        extraction_cache.put(key, result)
+    return result
+
+
+def _merge_results(local: dict, llm: dict, missing: list) -> dict:
+    """
+    Combine local and model fields; local values always win.
+    ``sources`` records whether each field came from "local" or "llm".
+    """
+    result = dict(local)
+    sources = {name: "local" for name in local}
+    for name in missing:
+        if llm.get(name) not in (None, ""):
+            result[name] = llm[name]
+            sources[name] = "llm"
+    if "raw_text" in llm:
+        result["raw_text"] = llm["raw_text"]
+    result["sources"] = sources
+    return result
+
+
+def extract_property_info(raw_html: str) -> dict:
+    """
+    Extract address, city, zip and year_built from one HTML document (blocking).
+
+    Pages seen before (same cleaned text) are served from the extraction
+    cache. Otherwise the local extractor runs first and the model is asked
+    only for the fields it could not find, so complete listings never leave
+    the process.
+
+    Returns:
+        dict: Extracted fields plus ``sources`` ({field: "local" | "llm"})
+    """
+    text = clean_html(raw_html)
+    key = _cache_key(text)
+    cached = extraction_cache.get(key)
+    if cached is not None:
+        return cached
+
+    local, missing = _local_pass(text)
+    if not missing or not EXTRACT_USE_LLM:
+        return _store(key, _merge_results(local, {}, missing))
+    resp = get_model().generate_content([EXTRACTION_PROMPT.format(keys=", ".join(missing)), text])
+    return _store(key, _merge_results(local, _parse_model_json(resp.text), missing))
+
+
+async def extract_property_info_async(raw_html: str) -> dict:
+    """Async version of extract_property_info."""
+    text = clean_html(raw_html)
+    key = _cache_key(text)
+    cached = extraction_cache.get(key)
+    if cached is not None:
+        return cached
+
+    local, missing = _local_pass(text)
+    if not missing or not EXTRACT_USE_LLM:
+        return _store(key, _merge_results(local, {}, missing))
+    resp = await get_model().generate_content_async([EXTRACTION_PROMPT.format(keys=", ".join(missing)), text])
+    return _store(key, _merge_results(local, _parse_model_json(resp.text), missing))
+
+
+async def iter_extract_property_info(
+    documents: Iterable[str],
+    max_concurrency: int = EXTRACT_MAX_CONCURRENCY,
+) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    Extract property info from many HTML documents with bounded concurrency.
+
+    Documents are pulled from ``documents`` lazily, so a generator over
+    thousands of files is never held in memory at once. At most
+    ``max_concurrency`` extractions are in flight; results are yielded
+    as they complete, tagged with the document's position in the input.
+
+    Args:
+        documents (iterable): HTML strings
+        max_concurrency (int): Maximum concurrent model requests
+
+    Yields:
+        tuple: (input index, extracted dict or {"error": message})
+    """
+    async def extract(index: int, raw_html: str) -> Tuple[int, dict]:
+        try:
+            return index, await extract_property_info_async(raw_html)
+        except Exception as e:
+            return index, {"error": f"{type(e).__name__}: {e}"}
+
+    source = enumerate(documents)
+    pending = set()
+    try:
+        while True:
+            for index, raw_html in source:
+                pending.add(asyncio.ensure_future(extract(index, raw_html)))
+                if len(pending) >= max(1, max_concurrency):
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _extract_files(paths):
+    def read_documents():
+        for path in paths:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                yield f.read()
+
+    async for index, result in iter_extract_property_info(read_documents()):
+        print(json.dumps({"file": paths[index], **result}), flush=True)
+    print(f"Extraction cache: {extraction_cache.stats()}", file=sys.stderr)
+
 
 if __name__ == "__main__":
-    sample = "<p>123 Main St, Orlando FL 32801 — Built 2004</p>"
-    print(extract_property_info(sample))
\ No newline at end of file
+    # python vertex_gemeini_pro.py page1.html page2.html ...  -> one JSON line per file
+    if len(sys.argv) > 1:
+        asyncio.run(_extract_files(sys.argv[1:]))
+    else:
+        sample = "<p>123 Main St, Orlando FL 32801 — Built 2004</p>"
+        print(extract_property_info(sample))